@@ -19,16 +19,34 @@
 
 __version__ = "0.1.3.dev0"
 
-from .assets import *
-from .assets.utils import *
-from .config import Config
-from .engine import *
-from .rl import MultiProcessRLEnv, ParallelRLEnv, RLEnv
-from .scene import Scene
+from .assets import _import_structure as _assets_import_structure
 from .utils import logging
+from .utils.imports import attach_lazy_attributes
 
 
 logger = logging.get_logger(__name__)
 
-# Set Hugging Face hub debug verbosity (TODO remove)
-logging.set_verbosity_debug()
+# The public attributes are only imported on first access (PEP 562), e.g. `import simulate` doesn't import
+# pyvista, the engines or the RL wrappers. All the public attributes of `simulate.assets` are also exposed here.
+_import_structure = {
+    "assets": [name for names in _assets_import_structure.values() for name in names],
+    "compiled_scene": ["CompiledScene"],
+    "config": ["Config"],
+    "engine": [
+        "BlenderEngine",
+        "Engine",
+        "GodotEngine",
+        "NotebookEngine",
+        "PyVistaEngine",
+        "UnityEngine",
+        "in_notebook",
+    ],
+    "rl": ["MultiProcessRLEnv", "ParallelRLEnv", "RLEnv"],
+    "scene": ["Scene"],
+}
+
+# `simulate.utils` are the utilities of the assets (rotations, transforms, names), as with the previous star imports
+del utils
+_import_structure["assets"].append("utils")
+
+__getattr__, __dir__, __all__ = attach_lazy_attributes(__name__, _import_structure)
@@ -1,14 +1,80 @@
-from .action_mapping import *
-from .actors import *
-from .actuator import *
-from .articulation_body import *
-from .asset import Asset
-from .camera import *
-from .collider import *
-from .light import *
-from .material import *
-from .object import *
-from .reward_functions import *
-from .rigid_body import *
-from .sensors import *
-from .utils import *
+from ..utils.imports import attach_lazy_attributes
+
+
+# The submodules are only imported on first access of one of their attributes (PEP 562),
+# so that e.g. pyvista is only imported when meshes are built
+_import_structure = {
+    "action_mapping": ["ALLOWED_PHYSICAL_ACTION_TYPES", "ActionMapping"],
+    "actors": ["EgocentricCameraActor", "SimpleActor"],
+    "actuator": ["Actuator", "ActuatorDict"],
+    "articulation_body": ["ALLOWED_JOINT_TYPES", "ArticulationBodyComponent"],
+    "asset": ["Asset"],
+    "asset_cache": ["SIMULATE_ASSET_CACHE", "AssetCache"],
+    "camera": ["ALLOWED_CAMERA_TYPES", "Camera", "CameraDistant"],
+    "collider": ["ALLOWED_COLLIDER_TYPES", "Collider"],
+    "gltf_extension": ["GltfExtensionMixin"],
+    "light": ["Light", "LightSun"],
+    "material": ["TEXTURE_FIELDS", "Material", "classproperty"],
+    "object": [
+        "PRIMITIVE_MESH_CACHE_SIZE",
+        "Box",
+        "Capsule",
+        "Circle",
+        "Cone",
+        "Cylinder",
+        "Line",
+        "MultipleLines",
+        "Object3D",
+        "Plane",
+        "Polygon",
+        "ProcGenGrid",
+        "ProcGenPrimsMaze3D",
+        "Rectangle",
+        "RegularPolygon",
+        "Ring",
+        "Sphere",
+        "StructuredGrid",
+        "Text3D",
+        "Triangle",
+        "Tube",
+        "clear_primitive_mesh_cache",
+        "get_primitive_mesh",
+        "is_primitive_mesh",
+        "translate",
+    ],
+    "physic_material": ["PhysicMaterial"],
+    "reward_functions": [
+        "ALLOWED_REWARD_DISTANCE_METRICS",
+        "ALLOWED_REWARD_TYPES",
+        "RewardFunction",
+        "RewardFunctionChildError",
+    ],
+    "rigid_body": ["ALLOWED_COLLISION_DETECTION", "ALLOWED_CONSTRAINTS", "RigidBodyComponent"],
+    "sensors": ["ALLOWED_STATE_SENSOR_PROPERTIES", "RaycastSensor", "StateSensor", "get_state_sensor_n_properties"],
+    "transform_store": ["TransformStore"],
+    "transforms": [
+        "compose_transforms",
+        "compose_world_matrices",
+        "decompose_transforms",
+        "euler_radians_from_quaternions",
+        "multiply_quaternions",
+        "quaternions_from_euler_degrees",
+        "quaternions_from_euler_radians",
+        "slerp_quaternions",
+    ],
+    "utils": [
+        "LazyLoader",
+        "camelcase_to_snakecase",
+        "euler_from_quaternion",
+        "get_product_of_quaternions",
+        "get_transform_from_trs",
+        "get_trs_from_transform_matrix",
+        "rotation_from_euler_degrees",
+        "rotation_from_euler_radians",
+        "snakecase_to_camelcase",
+    ],
+}
+
+__getattr__, __dir__, __all__ = attach_lazy_attributes(
+    __name__, _import_structure, submodules=["anytree", "gltf_export", "gltf_import", "gltflib", "procgen", "spaces"]
+)
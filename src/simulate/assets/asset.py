@@ -14,11 +14,13 @@
 
 # Lint as: python3
 """ A simulate Asset - Objects in the scene (mesh, primitives, camera, lights)."""
+import dataclasses
+import hashlib
 import itertools
 import os
 import tempfile
 import typing
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, ClassVar, List, Optional, Tuple, Union
 
 import numpy as np
 from huggingface_hub import create_repo, hf_hub_download, upload_file
@@ -27,8 +29,10 @@ from ..utils import logging
 from .actuator import Actuator, ActuatorDict, spaces
 from .anytree import NodeMixin
 from .articulation_body import ArticulationBodyComponent
+from .asset_cache import AssetCache
 from .rigid_body import RigidBodyComponent
 from .spaces import Space
+from .transform_store import TransformStore
 from .utils import (
     camelcase_to_snakecase,
     get_product_of_quaternions,
@@ -42,6 +46,56 @@ logger = logging.get_logger(__name__)
 ALLOWED_COMPONENTS_ATTRIBUTES = ["actuator", "physics_component", "actuator"]
 
 
+def _shared_constant(value: List) -> np.ndarray:
+    """Build a read-only array shared by all the assets until they set their own value or read it through a getter."""
+    array = np.array(value, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+IDENTITY_POSITION = _shared_constant([0.0, 0.0, 0.0])
+IDENTITY_ROTATION = _shared_constant([0.0, 0.0, 0.0, 1.0])
+IDENTITY_SCALING = _shared_constant([1.0, 1.0, 1.0])
+IDENTITY_TRANSFORMATION_MATRIX = _shared_constant(np.eye(4))
+
+# Attributes storing the transform of an asset, which don't change the spaces of the actors
+_TRANSFORM_ATTRIBUTES = frozenset(
+    [
+        "position",
+        "rotation",
+        "scaling",
+        "transformation_matrix",
+        "_position",
+        "_rotation",
+        "_scaling",
+        "_transformation_matrix",
+        "_trs_position",
+        "_trs_rotation",
+        "_trs_scaling",
+        "_trs_matrix",
+        "_transform_store",
+        "_transform_index",
+    ]
+)
+
+
+def _structural_value(value: Any) -> Any:
+    """Convert a value in a hashable representation for the structural hash of an asset."""
+    if isinstance(value, Asset):
+        return "node", value.name  # Other nodes are referred to by name (as in the glTF extensions)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return type(value).__name__, tuple(
+            _structural_value(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+    if isinstance(value, np.ndarray):
+        return value.shape, str(value.dtype), value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return tuple(_structural_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _structural_value(v)) for k, v in value.items()))
+    return value
+
+
 class Asset(NodeMixin, object):
     """
     Create an Asset in the Scene.
@@ -75,11 +129,32 @@ class Asset(NodeMixin, object):
             Path to the file from which the asset was created if relevant.
         extensions (`List[str]`, *optional*, defaults to `None`):
             Used to define arbitrary extensions for plugins.
+
+    If the asset is created inside a `with TransformStore() as store:` block, its position/rotation/scaling
+    and transformation matrix are stored in the contiguous arrays of the store instead of on the asset.
     """
 
     dimensionality = 3  # 2 for bi-dimensional assets and 3 for tri-dimensional assets (default is 3)
     __NEW_ID = itertools.count()  # Singleton to count instances of the classes for automatic naming
 
+    # Optional struct-of-arrays storage of the transform (see `TransformStore`)
+    _transform_store: Optional[TransformStore] = None
+    _transform_index: Optional[int] = None
+
+    # Class-level defaults: an instance only stores the attributes which differ from them.
+    # The default transform arrays are read-only and shared by all the assets until a setter replaces them.
+    _trs_position: Optional[np.ndarray] = IDENTITY_POSITION
+    _trs_rotation: Optional[np.ndarray] = IDENTITY_ROTATION
+    _trs_scaling: Optional[np.ndarray] = IDENTITY_SCALING
+    _trs_matrix: Optional[np.ndarray] = IDENTITY_TRANSFORMATION_MATRIX
+    is_actor: bool = False
+    extensions: Optional[List[str]] = None
+    _actuator: Optional[Union[Actuator, ActuatorDict]] = None
+    _physics_component: Optional[Union[RigidBodyComponent, ArticulationBodyComponent]] = None
+    _n_copies: int = 0
+    _created_from_file: Optional[str] = None
+    _export_cache: Optional[Any] = None  # Encoded meshes and textures reused between glTF exports of the tree
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -100,29 +175,37 @@ class Asset(NodeMixin, object):
             name = camelcase_to_snakecase(self.__class__.__name__ + f"_{asset_id:02d}")
         self.name = name
 
-        self.tree_parent = parent
+        if parent is not None:
+            self.tree_parent = parent
         if children is not None:
             self.tree_children = children
 
-        self.is_actor = is_actor
-
-        self._position = None
-        self._rotation = None
-        self._scaling = None
-        self._transformation_matrix = None
-        self.position = position
-        self.rotation = rotation
-        self.scaling = scaling
-        if transformation_matrix is not None:
+        if is_actor:
+            self.is_actor = is_actor
+
+        transform_store = TransformStore.get_active_store()
+        if transform_store is not None:
+            transform_store.add(self)
+        # Dataclass subclasses give the properties objects as default values
+        if position is not None and not isinstance(position, property):
+            self.position = position
+        if rotation is not None and not isinstance(rotation, property):
+            self.rotation = rotation
+        if scaling is not None and not isinstance(scaling, property):
+            self.scaling = scaling
+        if transformation_matrix is not None and not isinstance(transformation_matrix, property):
             self.transformation_matrix = transformation_matrix
 
         # Extensions for physics/RL
-        self.actuator = actuator
-        self.physics_component = physics_component
-        self.extensions = extensions
+        if actuator is not None:
+            self.actuator = actuator
+        if physics_component is not None:
+            self.physics_component = physics_component
+        if extensions is not None:
+            self.extensions = extensions
 
-        self._n_copies = 0
-        self._created_from_file = created_from_file
+        if created_from_file is not None:
+            self._created_from_file = created_from_file
 
     def _repr_info_str(self) -> str:
         """Used to add additional information to the __repr__ method."""
@@ -229,6 +312,10 @@ class Asset(NodeMixin, object):
                 If some actuators have space Dict action spaces, they are flattened.
                 If the returned action space Dict has a single entry, we return the single space instead of the Dict.
         """
+        return self._get_cached_actor_attribute("action_space", self._build_action_space)
+
+    def _build_action_space(self) -> Optional[Union[Space, spaces.Dict]]:
+        """Build the action space of the actor from the actuators of the subtree (see `action_space`)."""
         # [The following is NOT implemented at the moment]
         # If the asset has multiple actuators with different ids,
         # actuators of identical types are grouped together by tags and index
@@ -319,6 +406,10 @@ class Asset(NodeMixin, object):
             action_tags (`List[str]`):
                 List of all action tags of the actor.
         """
+        return self._get_cached_actor_attribute("action_tags", self._build_action_tags)
+
+    def _build_action_tags(self) -> Optional[List[str]]:
+        """Build the list of the action tags of the actor (see `action_tags`)."""
 
         def update_tag_list(act: Union[Actuator, ActuatorDict], _tag_list: List[str]):
             """Helper function to update a list of all the action tags."""
@@ -361,6 +452,10 @@ class Asset(NodeMixin, object):
             observation_space (`spaces.Space`):
                 Observation space of the actor.
         """
+        return self._get_cached_actor_attribute("observation_space", self._build_observation_space)
+
+    def _build_observation_space(self) -> Optional[spaces.Space]:
+        """Build the observation space of the actor from the sensors of the subtree (see `observation_space`)."""
         if not self.is_actor:
             return None
         else:
@@ -376,6 +471,10 @@ class Asset(NodeMixin, object):
             sensor_tags (`List[str]`):
                 List of all sensor tags of the actor.
         """
+        return self._get_cached_actor_attribute("sensor_tags", self._build_sensor_tags)
+
+    def _build_sensor_tags(self) -> Optional[List[str]]:
+        """Build the list of the sensor tags of the actor (see `sensor_tags`)."""
         if not self.is_actor:
             return None
 
@@ -422,9 +521,9 @@ class Asset(NodeMixin, object):
         self._n_copies += 1
         instance_copy = type(self)(
             name=copy_name,
-            position=self.position,
-            rotation=self.rotation,
-            scaling=self.scaling,
+            position=self._position,
+            rotation=self._rotation,
+            scaling=self._scaling,
         )
 
         if with_children:
@@ -446,11 +545,104 @@ class Asset(NodeMixin, object):
     def _post_copy(self):
         pass
 
+    def _prefetch(self):
+        pass
+
+    def prefetch(self) -> "Asset":
+        """
+        Load the lazily loaded meshes and textures of the asset and of its descendants
+        (see `create_from(..., lazy=True)`), e.g. before timing or sending the scene to an engine.
+
+        Returns:
+            self (`Asset`):
+                The asset.
+        """
+        for node in (self,) + self.tree_descendants:
+            node._prefetch()
+        return self
+
     def _get_last_copy_name(self) -> str:
         """Get the name of the last copy."""
         assert self._n_copies > 0, "this object is yet to be copied"
         return self.name + f"_copy{self._n_copies-1}"
 
+    def instantiate(
+        self,
+        template: "Asset",
+        transforms: Optional[np.ndarray] = None,
+        positions: Optional[np.ndarray] = None,
+        rotations: Optional[np.ndarray] = None,
+        scalings: Optional[np.ndarray] = None,
+    ) -> List["Asset"]:
+        """
+        Add N lightweight instances of an Object3D template as children of this asset.
+
+        Contrary to `copy`, all the instances reference the mesh and material objects of the template
+        (nothing is copied or recomputed) and the glTF exporter stores the mesh only once.
+        The children of the template (e.g. colliders) are copied in each instance sharing their meshes
+        and materials as well.
+
+        Args:
+            template (`Object3D`):
+                The object to instantiate. The template itself is not added to the tree.
+            transforms (`np.ndarray`, *optional*, defaults to `None`):
+                `(N, 4, 4)` transformation matrices of the instances.
+            positions (`np.ndarray`, *optional*, defaults to `None`):
+                `(N, 3)` positions of the instances.
+            rotations (`np.ndarray`, *optional*, defaults to `None`):
+                `(N, 3)` Euler angles (in degrees) or `(N, 4)` quaternions of the instances.
+            scalings (`np.ndarray`, *optional*, defaults to `None`):
+                `(N,)` or `(N, 3)` scalings of the instances.
+
+        Returns:
+            instances (`List[Object3D]`):
+                The created instances.
+        """
+        # We import here to avoid circular deps
+        from .object import Object3D
+
+        if not isinstance(template, Object3D):
+            raise TypeError(f"Only Object3D can be instantiated, not {type(template)}")
+        if transforms is not None and any(value is not None for value in (positions, rotations, scalings)):
+            raise ValueError("Provide either transforms or positions/rotations/scalings, not both.")
+
+        trs_kwargs = {
+            "transformation_matrix": transforms,
+            "position": positions,
+            "rotation": rotations,
+            "scaling": scalings,
+        }
+        trs_kwargs = {key: np.asarray(value, dtype=float) for key, value in trs_kwargs.items() if value is not None}
+        n_instances = {len(value) for value in trs_kwargs.values()}
+        if len(n_instances) != 1:
+            raise ValueError("transforms, positions, rotations and scalings should all have the same length (N).")
+        n_instances = n_instances.pop()
+
+        instances = []
+        for i in range(n_instances):
+            instance = Object3D(
+                mesh=template.shared_mesh,
+                material=template.material,
+                name=template.name + f"_instance{template._n_copies}",
+                is_actor=template.is_actor,
+                recompute_normals=False,
+                **{key: value[i] if value[i].ndim else float(value[i]) for key, value in trs_kwargs.items()},
+            )
+            instance._mesh_is_shared = template._mesh_is_shared  # Shared primitive meshes stay copy-on-write
+            template._n_copies += 1
+            if template.physics_component is not None:
+                instance.physics_component = dataclasses.replace(template.physics_component)
+            if template.tree_children:
+                instance.tree_children = [
+                    child.copy(share_mesh=True, share_material=True) for child in template.tree_children
+                ]
+                for child in instance.tree_children:
+                    child._post_copy()
+            instance.tree_parent = self
+            instances.append(instance)
+
+        return instances
+
     @staticmethod
     def _get_node_tree_from_hub_or_local(
         hub_or_local_filepath: str,
@@ -458,6 +650,8 @@ class Asset(NodeMixin, object):
         revision: Optional[str] = None,
         is_local: Optional[bool] = None,
         file_type: Optional[str] = None,
+        lazy: bool = False,
+        use_cache: bool = False,
         **kwargs: Any,
     ) -> Tuple["Asset", str]:
         """
@@ -481,6 +675,10 @@ class Asset(NodeMixin, object):
                 (use 'is_local=True/False' to force from the Hub or from local file)
             file_type (`str`, *optional*, defaults to `None`):
                 Type of the file to load. If None, the file type is inferred from the file extension.
+            lazy (`bool`, *optional*, defaults to `False`):
+                Whether to load the meshes and textures on first access (see `load_gltf_as_tree`).
+            use_cache (`bool`, *optional*, defaults to `False`):
+                Whether to use the local asset cache (see `AssetCache`) for the hub paths and the tree snapshots.
 
         Returns:
             root (`Asset`):
@@ -493,6 +691,8 @@ class Asset(NodeMixin, object):
 
         repo_id = None
         subfolder = None
+        repo_type = None
+        asset_cache = AssetCache() if use_cache else None
 
         if os.path.exists(hub_or_local_filepath) and os.path.isfile(hub_or_local_filepath) and is_local is not False:
             file_path = hub_or_local_filepath
@@ -510,39 +710,59 @@ class Asset(NodeMixin, object):
             # remove when release with https://github.com/huggingface/huggingface_hub/pull/1021 is out
             subfolder = subfolder if subfolder else None
             file_path = ""
-            try:
-                file_path = hf_hub_download(
-                    repo_id=repo_id,
-                    filename=filename,
-                    subfolder=subfolder,
-                    revision=revision,
-                    repo_type="space",
-                    use_auth_token=use_auth_token,
-                    **kwargs,
-                )
-            except Exception as e:
-                logger.info(f"Could not load Asset from Spaces: {e}\nTrying to load from Spaces...")
-
-            if not file_path:
+            resolved = None
+            if asset_cache is not None:
+                resolved = asset_cache.get_resolved_path(repo_id, filename, subfolder, revision)
+            if resolved is not None:
+                file_path, repo_type = resolved  # Already downloaded, no need to query the hub again
+            else:
+                repo_type = "space"
                 try:
                     file_path = hf_hub_download(
                         repo_id=repo_id,
                         filename=filename,
                         subfolder=subfolder,
                         revision=revision,
-                        repo_type="dataset",
+                        repo_type="space",
                         use_auth_token=use_auth_token,
                         **kwargs,
                     )
-                except Exception as err:
-                    logger.error(
-                        "Could not load Asset from the Hub. "
-                        "If the asset is in a private repo, please provide a valid token."
+                except Exception as e:
+                    logger.info(f"Could not load Asset from Spaces: {e}\nTrying to load from Spaces...")
+
+                if not file_path:
+                    repo_type = "dataset"
+                    try:
+                        file_path = hf_hub_download(
+                            repo_id=repo_id,
+                            filename=filename,
+                            subfolder=subfolder,
+                            revision=revision,
+                            repo_type="dataset",
+                            use_auth_token=use_auth_token,
+                            **kwargs,
+                        )
+                    except Exception as err:
+                        logger.error(
+                            "Could not load Asset from the Hub. "
+                            "If the asset is in a private repo, please provide a valid token."
+                        )
+                        raise err
+
+                if asset_cache is not None:
+                    asset_cache.set_resolved_path(
+                        repo_id, filename, file_path, repo_type, subfolder=subfolder, revision=revision
                     )
-                    raise err
 
         nodes = load_gltf_as_tree(
-            file_path=file_path, file_type=file_type, repo_id=repo_id, subfolder=subfolder, revision=revision
+            file_path=file_path,
+            file_type=file_type,
+            repo_id=repo_id,
+            subfolder=subfolder,
+            revision=revision,
+            repo_type=repo_type,
+            lazy=lazy,
+            asset_cache=asset_cache,
         )
         if len(nodes) == 1:
             root = nodes[0]  # If we have a single root node in the GLTF, we use it for our scene
@@ -559,6 +779,8 @@ class Asset(NodeMixin, object):
         revision: Optional[str] = None,
         is_local: Optional[bool] = None,
         hf_hub_kwargs: Optional[dict] = None,
+        lazy: bool = False,
+        use_cache: bool = False,
         **kwargs: Any,
     ) -> "Asset":
         """
@@ -582,6 +804,12 @@ class Asset(NodeMixin, object):
                 (use 'is_local=True/False' to force from the Hub or from local file)
             hf_hub_kwargs (`dict`, *optional*, defaults to `None`):
                 Additional keyword arguments to pass to the HuggingFace Hub API.
+            lazy (`bool`, *optional*, defaults to `False`):
+                Whether to only build the node tree and load the meshes and textures on first access.
+                Use `prefetch()` to load them all at once.
+            use_cache (`bool`, *optional*, defaults to `False`):
+                Whether to use the local asset cache (see `AssetCache`): the following loads of the same file
+                don't query the hub again and restore the tree from a binary snapshot instead of parsing the file.
 
         Returns:
             root (`Asset`):
@@ -598,6 +826,8 @@ class Asset(NodeMixin, object):
             use_auth_token=use_auth_token,
             revision=revision,
             is_local=is_local,
+            lazy=lazy,
+            use_cache=use_cache,
             **(hf_hub_kwargs if hf_hub_kwargs is not None else {}),
         )
 
@@ -682,13 +912,31 @@ class Asset(NodeMixin, object):
                 hub_urls.append(hub_url)
         return repo_url
 
-    def save(self, file_path: str) -> List[str]:
+    def save(
+        self,
+        file_path: str,
+        gpu_instancing: bool = False,
+        embed_resources: bool = True,
+        max_buffer_size: Optional[int] = None,
+        quantize: bool = False,
+    ) -> List[str]:
         """
         Save in a GLTF file + additional (binary) resource files if it should be the case.
+        Saving in a `.glb` file stores everything in a single binary file.
 
         Args:
             file_path (`str`):
-                Path to the file to save.
+                Path to the file to save, with a `.gltf` or `.glb` extension.
+            gpu_instancing (`bool`, *optional*, defaults to `False`):
+                Whether to export sibling instances of a same mesh (see `instantiate`)
+                with the `EXT_mesh_gpu_instancing` extension.
+            embed_resources (`bool`, *optional*, defaults to `True`):
+                For `.gltf` files, whether to embed the buffers and images in the JSON as base64 data
+                or to save them next to the glTF file in `.bin` and image files.
+            max_buffer_size (`int`, *optional*, defaults to `None`):
+                For `.gltf` files with external resources, the maximum size in bytes of each `.bin` file.
+            quantize (`bool`, *optional*, defaults to `False`):
+                Whether to store the meshes with quantized vertex attributes (`KHR_mesh_quantization` extension).
 
         Returns:
             saved_filepaths (`List[str]`):
@@ -697,13 +945,43 @@ class Asset(NodeMixin, object):
         # We import here to avoid circular deps
         from .gltf_export import save_tree_to_gltf_file
 
-        return save_tree_to_gltf_file(file_path=file_path, root_node=self)
+        return save_tree_to_gltf_file(
+            file_path=file_path,
+            root_node=self,
+            gpu_instancing=gpu_instancing,
+            embed_resources=embed_resources,
+            max_buffer_size=max_buffer_size,
+            quantize=quantize,
+        )
 
-    def as_glb_bytes(self) -> bytes:
+    def as_glb_bytes(self, gpu_instancing: bool = False, quantize: bool = False) -> bytes:
         # We import here to avoid circular deps
         from .gltf_export import tree_as_glb_bytes
 
-        return tree_as_glb_bytes(self)
+        return tree_as_glb_bytes(self, gpu_instancing=gpu_instancing, quantize=quantize)
+
+    def write_glb(self, sink: Any, gpu_instancing: bool = False, quantize: bool = False) -> int:
+        """
+        Stream the asset tree as GLB to a file, a socket or a writable buffer, without building the GLB bytes first.
+
+        Args:
+            sink (`BinaryIO`, `socket.socket` or writable bytes-like object):
+                Where to write the GLB: a file opened in binary mode (or any object with a `write` method),
+                a socket (or any object with a `sendall` method) or a `bytearray`/`memoryview` large enough.
+            gpu_instancing (`bool`, *optional*, defaults to `False`):
+                Whether to export sibling instances of a same mesh (see `instantiate`)
+                with the `EXT_mesh_gpu_instancing` extension.
+            quantize (`bool`, *optional*, defaults to `False`):
+                Whether to store the meshes with quantized vertex attributes (`KHR_mesh_quantization` extension).
+
+        Returns:
+            bytelength (`int`):
+                The number of bytes written.
+        """
+        # We import here to avoid circular deps
+        from .gltf_export import write_tree_to_glb
+
+        return write_tree_to_glb(self, sink, gpu_instancing=gpu_instancing, quantize=quantize)
 
     def translate(self, vector: Optional[List[float]] = None) -> "Asset":
         """
@@ -719,7 +997,7 @@ class Asset(NodeMixin, object):
         """
         if vector is None:
             return self
-        self.position += np.array(vector)
+        self.position = self.position + np.array(vector)
         return self
 
     def translate_x(self, amount: float = 0.0) -> "Asset":
@@ -734,7 +1012,7 @@ class Asset(NodeMixin, object):
             self (`Asset`):
                 The translated asset.
         """
-        self.position += np.array((float(amount), 0.0, 0.0))
+        self.position = self.position + np.array((float(amount), 0.0, 0.0))
         return self
 
     def translate_y(self, amount: float = 0.0) -> "Asset":
@@ -749,7 +1027,7 @@ class Asset(NodeMixin, object):
             self (`Asset`):
                 The translated asset.
         """
-        self.position += np.array((0.0, float(amount), 0.0))
+        self.position = self.position + np.array((0.0, float(amount), 0.0))
         return self
 
     def translate_z(self, amount: float = 0.0) -> "Asset":
@@ -764,7 +1042,7 @@ class Asset(NodeMixin, object):
             self (`Asset`):
                 The translated asset.
         """
-        self.position += np.array((0.0, 0.0, float(amount)))
+        self.position = self.position + np.array((0.0, 0.0, float(amount)))
         return self
 
     def rotate_by_quaternion(self, quaternion: Optional[List[float]] = None) -> "Asset":
@@ -922,11 +1200,185 @@ class Asset(NodeMixin, object):
         return self.scale(scaling=[0.0, 0.0, value])
 
     ##############################
-    # Properties copied from Asset()
-    # We need to redefine them here otherwise the dataclass lose them since
-    # they are also in the __init__ signature
+    # Structural hash of the subtree
+    ##############################
+    _structural_hash: Optional[str] = None
+    # Caches which are not part of the hash (the transformation matrix is composed lazily from the TRS,
+    # whose setters invalidate the hash, so reading the matrix doesn't count as a modification)
+    _UNTRACKED_ATTRIBUTES: ClassVar[frozenset] = frozenset(
+        ["_structural_hash", "_actor_cache", "_export_cache", "_transformation_matrix", "_trs_matrix"]
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name not in self._UNTRACKED_ATTRIBUTES:
+            self._invalidate_structural_hash()
+            if name not in _TRANSFORM_ATTRIBUTES:
+                self._invalidate_actor_cache()
+
+    def _invalidate_structural_hash(self):
+        """Reset the cached structural hash of the asset and of its ancestors."""
+        # A cached hash implies cached hashes for all the descendants, we can stop at the first empty one
+        node = self
+        while node is not None and node._structural_hash is not None:
+            node._structural_hash = None
+            node = node.tree_parent
+
+    ##############################
+    # Cache of the spaces and tags of the actors
+    ##############################
+    _actor_cache: Optional[typing.Dict[str, Any]] = None
+
+    def _get_cached_actor_attribute(self, attribute: str, build_fn: typing.Callable[[], Any]) -> Any:
+        """
+        Get an attribute of the actor (spaces and tags) built from its subtree, built once and cached until an
+        attribute of a node of the subtree (other than its transform) is set or a node is added or removed.
+        Like for the structural hash, in-place modifications (e.g. of the attributes of an actuator) are not tracked.
+        """
+        if self._actor_cache is None or attribute not in self._actor_cache:
+            value = build_fn()
+            if self._actor_cache is None:
+                # Like for the structural hash, a cache on a node implies caches (maybe empty) on its descendants
+                for descendant in self.tree_descendants:
+                    if descendant._actor_cache is None:
+                        descendant._actor_cache = {}
+                self._actor_cache = {}
+            self._actor_cache[attribute] = value
+        return self._actor_cache[attribute]
+
+    def _invalidate_actor_cache(self):
+        """Reset the cached spaces and tags of the asset and of its ancestors."""
+        # A cache implies caches for all the descendants, we can stop at the first empty one
+        node = self
+        while node is not None and node._actor_cache is not None:
+            node._actor_cache = None
+            node = node.tree_parent
+
+    def _structural_content(self) -> Tuple:
+        """
+        The content of the node (without its name, transform and children) identifying its structure.
+        Sub-classes with additional content which is not a dataclass field should extend it.
+        """
+        content = (type(self).__qualname__, self.is_actor, _structural_value(self.extensions))
+        if dataclasses.is_dataclass(self):
+            content += tuple(_structural_value(getattr(self, f.name)) for f in dataclasses.fields(self))
+        content += tuple((name, _structural_value(component)) for name, component in self.named_components)
+        return content
+
+    @property
+    def structural_hash(self) -> str:
+        """
+        A hash of the structure of the subtree rooted at this asset (Merkle hash).
+
+        Computed from the components and dataclass fields of the nodes, the identity of their mesh and material
+        objects and, recursively, the local transforms and hashes of the children. The name and the transform of
+        the asset itself are not part of the hash, so two copies of a same subtree placed at different positions
+        share the same hash (as long as they share their meshes and materials, e.g. with `instantiate`).
+
+        The hash is cached and invalidated when an attribute of a node of the subtree is set.
+        In-place modifications (e.g. of the points of a mesh or of the arrays of a `TransformStore`) are not tracked,
+        the glTF exporter thus recomputes the hashes of the tree (see `_refresh_structural_hash`) before keying on them.
+        Since meshes and materials are identified by their `id`, the hash is only meaningful within a process.
+
+        Returns:
+            structural_hash (`str`):
+                The hexadecimal hash digest.
+        """
+        if self._structural_hash is None:
+            self._structural_hash = self._hash_structure([child.structural_hash for child in self.tree_children])
+        return self._structural_hash
+
+    def _refresh_structural_hash(self) -> str:
+        """
+        Recompute the structural hashes of the subtree without trusting the cached ones, which miss in-place
+        modifications. The cached hashes which didn't change are kept (the same string objects).
+
+        Returns:
+            structural_hash (`str`):
+                The hexadecimal hash digest.
+        """
+        structural_hash = self._hash_structure([child._refresh_structural_hash() for child in self.tree_children])
+        if structural_hash != self._structural_hash:
+            self._structural_hash = structural_hash
+        return self._structural_hash
+
+    def _hash_structure(self, children_hashes: List[str]) -> str:
+        """Hash the structural content of the node with the local transforms and hashes of its children."""
+        h = hashlib.md5(repr(self._structural_content()).encode("utf-8"))
+        for child, child_hash in zip(self.tree_children, children_hashes):
+            for array in (child._position, child._rotation, child._scaling):
+                h.update(np.asarray(array, dtype=float).tobytes())
+            h.update(child_hash.encode("utf-8"))
+        return h.hexdigest()
+
+    ##############################
+    # Storage of the transform: in the TransformStore if the asset is bound to one, else on the asset
+    ##############################
+    @property
+    def _position(self) -> Optional[np.ndarray]:
+        if self._transform_store is None:
+            return self._trs_position
+        return self._transform_store.positions[self._transform_index]
+
+    @_position.setter
+    def _position(self, value: Optional[np.ndarray]):
+        if self._transform_store is None:
+            self._trs_position = value
+        elif value is not None:
+            self._transform_store.positions[self._transform_index] = value
+
+    @property
+    def _rotation(self) -> Optional[np.ndarray]:
+        if self._transform_store is None:
+            return self._trs_rotation
+        return self._transform_store.rotations[self._transform_index]
+
+    @_rotation.setter
+    def _rotation(self, value: Optional[np.ndarray]):
+        if self._transform_store is None:
+            self._trs_rotation = value
+        elif value is not None:
+            self._transform_store.rotations[self._transform_index] = value
+
+    @property
+    def _scaling(self) -> Optional[np.ndarray]:
+        if self._transform_store is None:
+            return self._trs_scaling
+        return self._transform_store.scalings[self._transform_index]
+
+    @_scaling.setter
+    def _scaling(self, value: Optional[np.ndarray]):
+        if self._transform_store is None:
+            self._trs_scaling = value
+        elif value is not None:
+            self._transform_store.scalings[self._transform_index] = value
+
+    @property
+    def _transformation_matrix(self) -> Optional[np.ndarray]:
+        if self._transform_store is None:
+            return self._trs_matrix
+        return self._transform_store._get_matrix(self._transform_index)
+
+    @_transformation_matrix.setter
+    def _transformation_matrix(self, value: Optional[np.ndarray]):
+        if self._transform_store is None:
+            self._trs_matrix = value
+        else:
+            self._transform_store._set_matrix(self._transform_index, value)
+
+    def _own_transform(self, name: str) -> np.ndarray:
+        """Replace the shared default stored in `name` by a writable copy owned by the asset and return it."""
+        value = getattr(self, name).copy()
+        # Set without going through `__setattr__`: the value didn't change, so the caches stay valid
+        object.__setattr__(self, name, value)
+        return value
+
+    ##############################
+    # Transform properties
+    # Dataclass subclasses re-expose them (`position = Asset.position`, ...)
+    # since their InitVar fields of the same names shadow them.
     #
-    # Need to be updated if Asset() is updated
+    # The transformation matrix is only composed from the TRS when it is read.
     ##############################
     @property
     def position(self) -> Union[List[float], np.ndarray]:
@@ -935,8 +1387,11 @@ class Asset(NodeMixin, object):
 
         Returns:
             position (`List[float]` or `np.ndarray`):
-                The position of the asset in the scene.
+                The position of the asset in the scene (for an asset bound to a `TransformStore`,
+                a view of its row in the store).
         """
+        if self._position is IDENTITY_POSITION:
+            return self._own_transform("_trs_position")
         return self._position
 
     @property
@@ -946,8 +1401,11 @@ class Asset(NodeMixin, object):
 
         Returns:
             rotation (`List[float]` or `np.ndarray`):
-                The rotation of the asset in the scene.
+                The rotation of the asset in the scene (for an asset bound to a `TransformStore`,
+                a view of its row in the store).
         """
+        if self._rotation is IDENTITY_ROTATION:
+            return self._own_transform("_trs_rotation")
         return self._rotation
 
     @property
@@ -957,14 +1415,18 @@ class Asset(NodeMixin, object):
 
         Returns:
             scaling (`List[float]` or `np.ndarray`):
-                The scaling of the asset in the scene.
+                The scaling of the asset in the scene (for an asset bound to a `TransformStore`,
+                a view of its row in the store).
         """
+        if self._scaling is IDENTITY_SCALING:
+            return self._own_transform("_trs_scaling")
         return self._scaling
 
     @property
     def transformation_matrix(self) -> np.ndarray:
         """
         Get the transformation matrix of the asset in the scene.
+        The matrix is composed from the position, rotation and scaling on the first access after they change.
 
         Returns:
             transformation_matrix (`np.ndarray`):
@@ -972,6 +1434,8 @@ class Asset(NodeMixin, object):
         """
         if self._transformation_matrix is None:
             self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
+        elif self._transformation_matrix is IDENTITY_TRANSFORMATION_MATRIX:
+            return self._own_transform("_trs_matrix")
         return self._transformation_matrix
 
     # setters for position/rotation/scale
@@ -1000,7 +1464,7 @@ class Asset(NodeMixin, object):
         new_position = np.array(value)
         if not np.array_equal(self._position, new_position):
             self._position = new_position
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
+            self._transformation_matrix = None
 
             self._post_asset_modification()
 
@@ -1028,7 +1492,7 @@ class Asset(NodeMixin, object):
         new_rotation = np.array(value) / np.linalg.norm(value)
         if not np.array_equal(self._rotation, new_rotation):
             self._rotation = new_rotation
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
+            self._transformation_matrix = None
 
             self._post_asset_modification()
 
@@ -1056,7 +1520,7 @@ class Asset(NodeMixin, object):
         new_scaling = np.array(value)
         if not np.array_equal(self._scaling, new_scaling):
             self._scaling = new_scaling
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
+            self._transformation_matrix = None
 
             self._post_asset_modification()
 
@@ -1069,11 +1533,11 @@ class Asset(NodeMixin, object):
             value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
                 The transformation matrix of the asset in the scene.
         """
-        # Default to setting up from TRS if None
+        # Default to (lazily) setting up from TRS if None
         if (value is None or isinstance(value, property)) and (
             self._position is not None and self._rotation is not None and self._scaling is not None
         ):
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
+            self._transformation_matrix = None
             return
 
         if self.dimensionality == 3:
@@ -1103,8 +1567,26 @@ class Asset(NodeMixin, object):
         ):
             getattr(self.tree_root, "engine").update_asset(self)
 
+    def _check_child(self, child: "Asset"):
+        """
+        Check that a node can be attached as a child of the asset, called before attaching it.
+        Sub-classes with restrictions on their children should raise a `TreeError`.
+        """
+        pass
+
+    def _pre_attach_parent(self, parent: "Asset"):
+        """NodeMixing method call before attaching to a `parent`."""
+        parent._check_child(self)
+
+    def _post_attach_parent(self, parent: "Asset"):
+        """NodeMixing method call after attaching to a `parent`."""
+        parent._invalidate_structural_hash()
+        parent._invalidate_actor_cache()
+
     def _post_detach_parent(self, parent: "Asset"):
         """NodeMixing method call after detaching from a `parent`."""
+        parent._invalidate_structural_hash()
+        parent._invalidate_actor_cache()
         engine = getattr(self.tree_root, "engine", None)
         if engine is not None and engine.auto_update:
             engine.remove_asset(self)
@@ -0,0 +1,302 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+""" A local content-addressed cache of the assets loaded from the hub or from local files."""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from huggingface_hub.constants import hf_cache_home
+
+from ..utils import logging
+
+
+if TYPE_CHECKING:
+    from .asset import Asset
+
+
+logger = logging.get_logger(__name__)
+
+default_cache_path = os.path.join(hf_cache_home, "simulate")
+SIMULATE_ASSET_CACHE = os.getenv("SIMULATE_ASSET_CACHE", default_cache_path)
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class _SnapshotPickler(pickle.Pickler):
+    # The pyvista meshes and textures are stored as plain numpy arrays instead of through VTK writers
+    def persistent_id(self, obj: Any) -> Optional[Tuple]:
+        import pyvista as pv
+
+        if isinstance(obj, pv.MultiBlock):
+            return "MultiBlock", [obj[i] for i in range(obj.n_blocks)]
+        if type(obj) is pv.PolyData:
+            point_data = obj.GetPointData()
+            active_names = [
+                array.GetName() if array is not None else None
+                for array in (point_data.GetNormals(), point_data.GetTCoords(), point_data.GetScalars())
+            ]
+            return (
+                "PolyData",
+                np.asarray(obj.points),
+                {name: getattr(obj, name) for name in ("verts", "lines", "faces", "strips")},
+                {name: np.asarray(obj.point_data[name]) for name in obj.point_data.keys()},
+                {name: np.asarray(obj.cell_data[name]) for name in obj.cell_data.keys()},
+                active_names,
+            )
+        if isinstance(obj, pv.Texture):
+            return "Texture", obj.to_array()
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Tuple) -> Any:
+        import pyvista as pv
+
+        if pid[0] == "MultiBlock":
+            return pv.MultiBlock(pid[1])
+        if pid[0] == "PolyData":
+            _, points, cells, point_arrays, cell_arrays, active_names = pid
+            mesh = pv.PolyData()  # Not built from the points to avoid creating a vertex cell per point
+            if len(points):
+                mesh.points = points
+            for name, cell_array in cells.items():
+                if len(cell_array):
+                    setattr(mesh, name, cell_array)
+            for name, array in point_arrays.items():
+                mesh.point_data.set_array(array, name)
+            for name, array in cell_arrays.items():
+                mesh.cell_data.set_array(array, name)
+            normals_name, t_coords_name, scalars_name = active_names
+            if normals_name is not None:
+                mesh.GetPointData().SetActiveNormals(normals_name)
+            if t_coords_name is not None:
+                mesh.GetPointData().SetActiveTCoords(t_coords_name)
+            if scalars_name is not None:
+                mesh.GetPointData().SetActiveScalars(scalars_name)
+            return mesh
+        if pid[0] == "Texture":
+            return pv.numpy_to_texture(pid[1])
+        raise pickle.UnpicklingError(f"Unsupported persistent object {pid[0]}")
+
+
+def _write_atomic(file_path: str, write_fn: Any, mode: str = "wb"):
+    """Write a file through a temporary file renamed at the end, so concurrent workers never read partial files."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write_fn(f)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class AssetCache:
+    """
+    Local cache of the assets loaded with `Asset.create_from(..., use_cache=True)`, shared by all the processes
+    using the same cache directory.
+
+    The cache holds:
+    - an index of the local paths of the files downloaded from the hub (and of the type of repository they come from),
+        so the following loads of the same hub path and revision don't make any network call.
+        Clear the cache to get the new version of an asset loaded without an explicit revision.
+    - binary snapshots of the node trees built from the glTF files, keyed by the hash of the file and of its
+        resources and by the version of simulate, so the following loads skip the parsing and decoding of the file.
+        The meshes and textures are stored as numpy arrays and the nodes with pickle.
+
+    Args:
+        cache_dir (`str`, *optional*, defaults to `None`):
+            The directory of the cache. Defaults to the `SIMULATE_ASSET_CACHE` environment variable
+            or `~/.cache/huggingface/simulate`.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir if cache_dir is not None else SIMULATE_ASSET_CACHE
+
+    def __repr__(self) -> str:
+        return f"AssetCache(cache_dir={self.cache_dir})"
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _read_index(self) -> Dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"paths": {}, "hashes": {}}
+
+    def _update_index(self, section: str, key: str, value: Any):
+        index = self._read_index()
+        index.setdefault(section, {})[key] = value
+        _write_atomic(self.index_path, lambda f: json.dump(index, f), mode="w")
+
+    @staticmethod
+    def _hub_key(repo_id: str, filename: str, subfolder: Optional[str], revision: Optional[str]) -> str:
+        return json.dumps([repo_id, subfolder or "", filename, revision or ""])
+
+    def get_resolved_path(
+        self, repo_id: str, filename: str, subfolder: Optional[str] = None, revision: Optional[str] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Get the local path of a file already downloaded from the hub.
+
+        Args:
+            repo_id (`str`):
+                The id of the repository.
+            filename (`str`):
+                The name of the file in the repository.
+            subfolder (`str`, *optional*, defaults to `None`):
+                The subfolder of the file in the repository.
+            revision (`str`, *optional*, defaults to `None`):
+                The revision of the repository.
+
+        Returns:
+            resolved (`Tuple[str, str]`):
+                The local path of the file and the type of the repository, or `None` if the file is not in the index
+                (or was removed from the drive).
+        """
+        entry = self._read_index().get("paths", {}).get(self._hub_key(repo_id, filename, subfolder, revision))
+        if entry is None or not os.path.isfile(entry["path"]):
+            return None
+        return entry["path"], entry["repo_type"]
+
+    def set_resolved_path(
+        self,
+        repo_id: str,
+        filename: str,
+        local_path: str,
+        repo_type: str,
+        subfolder: Optional[str] = None,
+        revision: Optional[str] = None,
+    ):
+        """
+        Record the local path of a file downloaded from the hub (see `get_resolved_path`).
+
+        Args:
+            repo_id (`str`):
+                The id of the repository.
+            filename (`str`):
+                The name of the file in the repository.
+            local_path (`str`):
+                The local path of the downloaded file.
+            repo_type (`str`):
+                The type of the repository the file was downloaded from (`space` or `dataset`).
+            subfolder (`str`, *optional*, defaults to `None`):
+                The subfolder of the file in the repository.
+            revision (`str`, *optional*, defaults to `None`):
+                The revision of the repository.
+        """
+        key = self._hub_key(repo_id, filename, subfolder, revision)
+        self._update_index("paths", key, {"path": os.path.abspath(local_path), "repo_type": repo_type})
+
+    def file_hash(self, file_path: str) -> str:
+        """
+        Get the sha256 hash of the content of a file.
+        The hash is kept in the index and only computed again when the size or modification time of the file change.
+
+        Args:
+            file_path (`str`):
+                The path of the file.
+
+        Returns:
+            hash (`str`):
+                The hexadecimal sha256 hash of the file.
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        entry = self._read_index().get("hashes", {}).get(file_path)
+        if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return entry[2]
+
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(block)
+        file_hash = sha256.hexdigest()
+        self._update_index("hashes", file_path, [stat.st_size, stat.st_mtime_ns, file_hash])
+        return file_hash
+
+    def _snapshot_path(self, file_hash: str) -> str:
+        from .. import __version__
+
+        return os.path.join(self.cache_dir, "snapshots", __version__, f"{file_hash}.pkl")
+
+    def load_snapshot(self, file_path: str) -> Optional[List["Asset"]]:
+        """
+        Load the snapshot of the node tree of a glTF file, if the file and its resources didn't change.
+
+        Args:
+            file_path (`str`):
+                The path of the glTF file.
+
+        Returns:
+            nodes (`List[Asset]`):
+                The main nodes of the file (like `load_gltf_as_tree`), or `None` if there is no valid snapshot.
+        """
+        snapshot_path = self._snapshot_path(self.file_hash(file_path))
+        if not os.path.isfile(snapshot_path):
+            return None
+        try:
+            with open(snapshot_path, "rb") as f:
+                header = pickle.load(f)
+                if header.get("format") != SNAPSHOT_FORMAT_VERSION:
+                    return None
+                for resource_path, resource_hash in header["resources"].items():
+                    if not os.path.isfile(resource_path) or self.file_hash(resource_path) != resource_hash:
+                        return None
+                return _SnapshotUnpickler(f).load()
+        except Exception as e:
+            logger.warning(f"Could not load the snapshot {snapshot_path} of {file_path}: {e}")
+            return None
+
+    def save_snapshot(self, file_path: str, nodes: List["Asset"], resource_paths: Optional[List[str]] = None):
+        """
+        Save a snapshot of the node tree built from a glTF file.
+
+        Args:
+            file_path (`str`):
+                The path of the glTF file.
+            nodes (`List[Asset]`):
+                The main nodes built from the file (see `load_gltf_as_tree`).
+            resource_paths (`List[str]`, *optional*, defaults to `None`):
+                The local paths of the external resources (buffers, images) of the file.
+                The snapshot is only used again while none of them changed.
+        """
+        resources = {
+            os.path.abspath(resource_path): self.file_hash(resource_path) for resource_path in resource_paths or []
+        }
+        header = {"format": SNAPSHOT_FORMAT_VERSION, "resources": resources}
+
+        def write_snapshot(f):
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _SnapshotPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(nodes)
+
+        try:
+            _write_atomic(self._snapshot_path(self.file_hash(file_path)), write_snapshot)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not save a snapshot of {file_path}: {e}")
+
+    def clear(self):
+        """Remove all the content of the cache (index and snapshots)."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
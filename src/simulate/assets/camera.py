@@ -15,7 +15,7 @@
 # Lint as: python3
 """ A simulate Camera."""
 import itertools
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -149,6 +149,21 @@ class Camera(Asset):
         """
         return spaces.Box(low=0, high=255, shape=[3, self.height, self.width], dtype=np.uint8)
 
+    def _structural_content(self) -> Tuple:
+        """Add the parameters of the camera to the structural content of the node."""
+        return super()._structural_content() + (
+            self.width,
+            self.height,
+            self.camera_type,
+            self.sensor_tag,
+            self.aspect_ratio,
+            self.yfov,
+            self.zfar,
+            self.znear,
+            self.xmag,
+            self.ymag,
+        )
+
     def copy(self, with_children: bool = True, **kwargs: Any):
         """
         Make a copy of the Camera with copy of the children attached to the copy.
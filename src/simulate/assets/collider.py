@@ -17,16 +17,20 @@
 import dataclasses
 import itertools
 from dataclasses import InitVar, dataclass, fields
-from typing import Any, ClassVar, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Tuple, Union
 
 import numpy as np
-import pyvista as pv
 
-from .asset import Asset, get_transform_from_trs, get_trs_from_transform_matrix, rotation_from_euler_degrees
+from .anytree import TreeError
+from .asset import Asset
 from .gltf_extension import GltfExtensionMixin
 from .physic_material import PhysicMaterial
 
 
+if TYPE_CHECKING:
+    import pyvista as pv
+
+
 ALLOWED_COLLIDER_TYPES = ["box", "sphere", "capsule", "mesh"]
 
 
@@ -87,7 +91,7 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
     physic_material: Optional[int] = None
 
     name: InitVar[Optional[str]] = None
-    mesh: InitVar[Optional[Union[pv.UnstructuredGrid, pv.PolyData, pv.MultiBlock]]] = None
+    mesh: InitVar[Optional[Union["pv.UnstructuredGrid", "pv.PolyData", "pv.MultiBlock"]]] = None
     material: InitVar[Optional[Any]] = None
     position: InitVar[Optional[Union[List[float], np.ndarray]]] = None
     rotation: InitVar[Optional[Union[List[float], np.ndarray]]] = None
@@ -102,7 +106,7 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
     def __post_init__(
         self,
         name: Optional[str] = None,
-        mesh: Optional[Union[pv.UnstructuredGrid, pv.PolyData, pv.MultiBlock]] = None,
+        mesh: Optional[Union["pv.UnstructuredGrid", "pv.PolyData", "pv.MultiBlock"]] = None,
         material: Optional[Any] = None,
         position: Optional[Union[List[float], np.ndarray]] = None,
         rotation: Optional[Union[List[float], np.ndarray]] = None,
@@ -128,6 +132,8 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
         # Avoid having averaging normals at shared points
         # (pyvista behavior:https://docs.pyvista.org/api/core/_autosummary/pyvista.PolyData.compute_normals.html)
         if self.mesh is not None:
+            import pyvista as pv
+
             if isinstance(self.mesh, pv.MultiBlock):
                 for i in range(self.mesh.n_blocks):
                     self.mesh[i].compute_normals(inplace=True, cell_normals=False, split_vertices=True)
@@ -154,6 +160,10 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
         if self.bounding_box is not None and len(self.bounding_box) != 3:
             raise ValueError("Collider bounding_box must be a list of 3 numbers")
 
+    def _check_child(self, child: "Asset"):
+        """Colliders can not have children."""
+        raise TreeError(f"Colliders can not have children but {child.name} is attached to the collider {self.name}")
+
     def copy(self, with_children: bool = True, **kwargs: Any) -> "Collider":
         """
         Copy an Object3D node in a new (returned) object.
@@ -208,10 +218,16 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
 
         return instance_copy
 
+    def _structural_content(self) -> Tuple:
+        """Add the identity of the mesh and material objects to the structural content of the node."""
+        return super()._structural_content() + (id(self.mesh), id(self.material))
+
     def __repr__(self) -> str:
         fields_str = ", ".join([f"{f.name}={getattr(self, f.name)}" for f in fields(self)])
         mesh_str = ""
         if getattr(self, "mesh", None) is not None:
+            import pyvista as pv
+
             if isinstance(self.mesh, pv.MultiBlock):
                 mesh_str = f"Mesh(Multiblock, n_blocks={self.mesh.n_blocks}"
             else:
@@ -226,174 +242,11 @@ class Collider(Asset, GltfExtensionMixin, gltf_extension_name="HF_colliders", ob
             self.mesh.plot(**kwargs)
 
     ##############################
-    # Properties copied from Asset()
-    # We need to redefine them here otherwise the dataclass lose them since
+    # Transform properties shared with Asset()
+    # We need to re-expose them here otherwise the dataclass lose them since
     # they are also in the __init__ signature
-    #
-    # Need to be updated if Asset() is updated
     ##############################
-    @property
-    def position(self) -> np.ndarray:
-        """
-        Get the position of the collider in the scene.
-
-        Returns:
-            position (`List[float]` or `np.ndarray`):
-                The position of the collider in the scene.
-        """
-        return self._position
-
-    @property
-    def rotation(self) -> np.ndarray:
-        """
-        Get the rotation of the collider in the scene.
-
-        Returns:
-            rotation (`List[float]` or `np.ndarray`):
-                The rotation of the collider in the scene.
-        """
-        return self._rotation
-
-    @property
-    def scaling(self) -> np.ndarray:
-        """
-        Get the scaling of the collider in the scene.
-
-        Returns:
-            scaling (`List[float]` or `np.ndarray`):
-                The scaling of the collider in the scene.
-        """
-        return self._scaling
-
-    @property
-    def transformation_matrix(self) -> np.ndarray:
-        """
-        Get the transformation matrix of the collider in the scene.
-
-        Returns:
-            transformation_matrix (`np.ndarray`):
-                The transformation matrix of the collider in the scene.
-        """
-        if self._transformation_matrix is None:
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-        return self._transformation_matrix
-
-    # setters for position/rotation/scale
-    @position.setter
-    def position(self, value: Optional[Union[property, List, Tuple, np.ndarray]]):
-        """
-        Set the position of the collider in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The position of the collider in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
-        if not np.array_equal(self._position, new_position):
-            self._position = new_position
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @rotation.setter
-    def rotation(self, value: Optional[Union[property, List, Tuple, np.ndarray]]):
-        """
-        Set the rotation of the collider in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The rotation of the collider in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
-        if not np.array_equal(self._rotation, new_rotation):
-            self._rotation = new_rotation
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @scaling.setter
-    def scaling(self, value: Optional[Union[property, List, Tuple, np.ndarray]]):
-        """
-        Set the scaling of the collider in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The scaling of the collider in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
-        if not np.array_equal(self._scaling, new_scaling):
-            self._scaling = new_scaling
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @transformation_matrix.setter
-    def transformation_matrix(self, value: Optional[Union[property, List, Tuple, np.ndarray]]):
-        """
-        Set the transformation matrix of the collider in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The transformation matrix of the collider in the scene.
-        """
-        # Default to setting up from TRS if None
-        if (value is None or isinstance(value, property)) and (
-            self._position is not None and self._rotation is not None and self._scaling is not None
-        ):
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-            return
-
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_transformation_matrix = np.array(value)
-        if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
-            self._transformation_matrix = new_transformation_matrix
-
-            translation, rotation, scale = get_trs_from_transform_matrix(self._transformation_matrix)
-            self._position = translation
-            self._rotation = rotation
-            self._scaling = scale
-
-            self._post_asset_modification()
+    position = Asset.position
+    rotation = Asset.rotation
+    scaling = Asset.scaling
+    transformation_matrix = Asset.transformation_matrix
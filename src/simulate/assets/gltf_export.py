@@ -15,7 +15,14 @@
 # Lint as: python3
 """ Export a Scene as a GLTF file."""
 import hashlib
-from typing import Any, ByteString, Dict, List, Optional, Set, Union
+import mimetypes
+import os
+import threading
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, ByteString, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import numpy as np
 import pyvista as pv
@@ -23,12 +30,14 @@ import pyvista as pv
 from ..config import Config
 from . import Asset, Camera, Collider, Light, Material, Object3D, PhysicMaterial
 from . import gltflib as gl
-from .gltf_extension import GLTF_NODES_EXTENSION_CLASS, process_tree_after_gltf, process_tree_before_gltf
+from .gltf_extension import GLTF_NODES_EXTENSION_CLASS
 
 
 # Conversion of Numpy dtype and shapes in GLTF equivalents
 NP_FLOAT32 = np.dtype("<f4")
 NP_UINT32 = np.dtype("<u4")
+NP_UINT16 = np.dtype("<u2")
+NP_INT16 = np.dtype("<i2")
 NP_UINT8 = np.dtype("<u1")
 
 numpy_to_gltf_dtypes_mapping = {
@@ -78,7 +87,7 @@ def _get_digest(data: Any) -> bytes:
     return digest
 
 
-def is_data_cached(data: Any, cache: Dict) -> Optional[int]:
+def is_data_cached(data: Any, cache: Dict, digest: Optional[bytes] = None) -> Optional[int]:
     """
     Helper function to check if data is already in the cache dict
 
@@ -87,6 +96,8 @@ def is_data_cached(data: Any, cache: Dict) -> Optional[int]:
             The data to check in the cache.
         cache (`Dict`):
             The cache dictionary.
+        digest (`bytes`, *optional*, defaults to `None`):
+            The hash digest of the data if already computed.
 
     Returns:
         data_id (`int`):
@@ -95,14 +106,15 @@ def is_data_cached(data: Any, cache: Dict) -> Optional[int]:
     if not isinstance(cache, dict):
         raise ValueError("Cache should be a dict")
 
-    digest = _get_digest(data)
+    if digest is None:
+        digest = _get_digest(data)
 
     if digest in cache:
         return cache[digest]
     return None
 
 
-def cache_data(data: Any, data_id: int, cache: Dict) -> dict:
+def cache_data(data: Any, data_id: int, cache: Dict, digest: Optional[bytes] = None) -> dict:
     """
     Helper function to add some data (numpy array, material, texture, anything hashable)
     in the cache dict as pointer to a provided data_id integer.
@@ -114,6 +126,8 @@ def cache_data(data: Any, data_id: int, cache: Dict) -> dict:
             The data id to reference in the cache.
         cache (`Dict`):
             The cache dictionary.
+        digest (`bytes`, *optional*, defaults to `None`):
+            The hash digest of the data if already computed.
 
     Returns:
         cache (`Dict`):
@@ -122,7 +136,8 @@ def cache_data(data: Any, data_id: int, cache: Dict) -> dict:
     if not isinstance(cache, dict):
         raise ValueError("Cache should be a dict")
 
-    digest = _get_digest(data)
+    if digest is None:
+        digest = _get_digest(data)
     cache[digest] = data_id
     return cache
 
@@ -133,6 +148,8 @@ def add_data_to_gltf(
     buffer_data: bytearray,
     buffer_id: int = 0,
     cache: Optional[Dict] = None,
+    digest: Optional[bytes] = None,
+    byte_stride: Optional[int] = None,
 ) -> int:
     """
     Add byte data to the buffer_data, create/add a new buffer view for it in the scene and
@@ -149,12 +166,18 @@ def add_data_to_gltf(
             The buffer id to add the buffer view to.
         cache (`Dict`, *optional*, defaults to `None`):
             The cache dictionary.
+        digest (`bytes`, *optional*, defaults to `None`):
+            The hash digest of the data if already computed.
+        byte_stride (`int`, *optional*, defaults to `None`):
+            The stride in bytes between two vertex attributes, for padded attributes.
 
     Returns:
         buffer_view_id (`int`):
             The id of the added buffer view.
     """
-    cached_id = is_data_cached(data=new_data, cache=cache)
+    if digest is None:
+        digest = _get_digest(new_data)
+    cached_id = is_data_cached(data=new_data, cache=cache, digest=digest)
     if cached_id is not None:
         return cached_id
 
@@ -168,16 +191,118 @@ def add_data_to_gltf(
     buffer_data.extend(new_data)
 
     # Create/add a new bufferView
-    buffer_view = gl.BufferView(buffer=buffer_id, byteLength=byte_length, byteOffset=byte_offset, byteStride=None)
+    buffer_view = gl.BufferView(
+        buffer=buffer_id, byteLength=byte_length, byteOffset=byte_offset, byteStride=byte_stride
+    )
     gltf_model.bufferViews.append(buffer_view)
     buffer_view_id = len(gltf_model.bufferViews) - 1
 
-    cache_data(data=new_data, data_id=buffer_view_id, cache=cache)
+    cache_data(data=new_data, data_id=buffer_view_id, cache=cache, digest=digest)
     return buffer_view_id
 
 
+class EncodedArray(NamedTuple):
+    """A numpy array encoded for a glTF accessor (see `encode_numpy_array`)."""
+
+    data: bytes
+    digest: bytes
+    component_type: gl.ComponentType
+    accessor_type: gl.AccessorType
+    count: int
+    min: List[float]
+    max: List[float]
+    normalized: bool = False
+    byte_stride: Optional[int] = None
+
+
+def encode_numpy_array(np_array: np.ndarray) -> EncodedArray:
+    """
+    Encode a numpy array as the bytes, hash digest and metadata of a glTF accessor.
+
+    Args:
+        np_array (`np.ndarray`):
+            The numpy array to encode.
+
+    Returns:
+        encoded_array (`EncodedArray`):
+            The encoded array.
+    """
+    component_type: gl.ComponentType = numpy_to_gltf_dtypes_mapping[np_array.dtype]
+    accessor_type: gl.AccessorType = numpy_to_gltf_shapes_mapping[np_array.shape[1:]]
+
+    if (
+        accessor_type == gl.AccessorType.MAT2
+        and component_type in [gl.ComponentType.BYTE, gl.ComponentType.UNSIGNED_BYTE]
+    ) or (
+        accessor_type == gl.AccessorType.MAT3
+        and component_type
+        in [
+            gl.ComponentType.BYTE,
+            gl.ComponentType.UNSIGNED_BYTE,
+            gl.ComponentType.SHORT,
+            gl.ComponentType.UNSIGNED_SHORT,
+        ]
+    ):
+        raise NotImplementedError(
+            "Column padding should be implemented in these cases."
+            "Cf https://www.khronos.org/registry/glTF/specs/2.0/glTF-2.0.html#data-alignment"
+        )
+
+    return EncodedArray(
+        data=np_array.tobytes(),
+        digest=_get_digest(np_array),
+        component_type=component_type,
+        accessor_type=accessor_type,
+        count=np_array.shape[0],
+        min=np_array.min(axis=0).reshape(-1).tolist(),
+        max=np_array.max(axis=0).reshape(-1).tolist(),
+    )
+
+
+def encode_quantized_array(np_array: np.ndarray, normalized: bool = True) -> EncodedArray:
+    """
+    Encode a (N, C) integer numpy array of quantized vertex attributes (see `KHR_mesh_quantization`).
+    Rows are padded with zeros to a multiple of 4 bytes as required for vertex attributes,
+    the padding being skipped with the byte stride of the buffer view.
+
+    Args:
+        np_array (`np.ndarray`):
+            The quantized vertex attributes.
+        normalized (`bool`, *optional*, defaults to `True`):
+            Whether the integers are normalized (mapped to [-1, 1] or [0, 1] when read).
+
+    Returns:
+        encoded_array (`EncodedArray`):
+            The encoded array.
+    """
+    n_rows, n_components = np_array.shape
+    byte_stride = None
+    padded_array = np_array
+    if (n_components * np_array.itemsize) % 4 != 0:
+        n_padded_components = -(-n_components * np_array.itemsize // 4) * 4 // np_array.itemsize
+        padded_array = np.zeros((n_rows, n_padded_components), dtype=np_array.dtype)
+        padded_array[:, :n_components] = np_array
+        byte_stride = n_padded_components * np_array.itemsize
+
+    # The digest covers the interpretation of the data as well, to only share accessors with the same layout
+    h = hashlib.md5(np.ascontiguousarray(padded_array))
+    h.update(f"{n_components}-{normalized}-{byte_stride}".encode("utf-8"))
+
+    return EncodedArray(
+        data=padded_array.tobytes(),
+        digest=h.digest(),
+        component_type=numpy_to_gltf_dtypes_mapping[np_array.dtype],
+        accessor_type=numpy_to_gltf_shapes_mapping[(n_components,)],
+        count=n_rows,
+        min=np_array.min(axis=0).tolist(),
+        max=np_array.max(axis=0).tolist(),
+        normalized=normalized,
+        byte_stride=byte_stride,
+    )
+
+
 def add_numpy_to_gltf(
-    np_array: np.ndarray,
+    np_array: Union[np.ndarray, EncodedArray],
     gltf_model: gl.GLTFModel,
     buffer_data: Union[bytearray, ByteString],
     normalized: bool = False,
@@ -189,8 +314,8 @@ def add_numpy_to_gltf(
     add the numpy array in the buffer_data.
 
     Args:
-        np_array (`np.ndarray`):
-            The numpy array to add to the buffer.
+        np_array (`np.ndarray` or `EncodedArray`):
+            The numpy array to add to the buffer (or the array already encoded with `encode_numpy_array`).
         gltf_model (`GLTFModel`):
             The gltf model to add the buffer view to.
         buffer_data (`bytearray`):
@@ -206,67 +331,175 @@ def add_numpy_to_gltf(
         accessor_id (`int`):
             The id of the added accessor.
     """
+    if isinstance(np_array, EncodedArray):
+        encoded_array = np_array
+    else:
+        cached_id = is_data_cached(data=np_array, cache=cache)
+        if cached_id is not None:
+            return cached_id
+        encoded_array = encode_numpy_array(np_array)
 
-    cached_id = is_data_cached(data=np_array, cache=cache)
+    cached_id = is_data_cached(data=None, cache=cache, digest=encoded_array.digest)
     if cached_id is not None:
         return cached_id
 
-    component_type: gl.ComponentType = numpy_to_gltf_dtypes_mapping[np_array.dtype]
-    accessor_type: gl.AccessorType = numpy_to_gltf_shapes_mapping[np_array.shape[1:]]
-
-    if (
-        accessor_type == gl.AccessorType.MAT2
-        and component_type in [gl.ComponentType.BYTE, gl.ComponentType.UNSIGNED_BYTE]
-    ) or (
-        accessor_type == gl.AccessorType.MAT3
-        and component_type
-        in [
-            gl.ComponentType.BYTE,
-            gl.ComponentType.UNSIGNED_BYTE,
-            gl.ComponentType.SHORT,
-            gl.ComponentType.UNSIGNED_SHORT,
-        ]
-    ):
-        raise NotImplementedError(
-            "Column padding should be implemented in these cases."
-            "Cf https://www.khronos.org/registry/glTF/specs/2.0/glTF-2.0.html#data-alignment"
-        )
-
-    count: int = np_array.shape[0]
-    max_value = np_array.max(axis=0).reshape(-1).tolist()
-    min_value = np_array.min(axis=0).reshape(-1).tolist()
-
-    new_data = np_array.tobytes()
     buffer_view_id = add_data_to_gltf(
-        new_data=new_data, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+        new_data=encoded_array.data,
+        gltf_model=gltf_model,
+        buffer_data=buffer_data,
+        buffer_id=buffer_id,
+        cache=cache,
+        digest=encoded_array.digest,
+        byte_stride=encoded_array.byte_stride,
     )
 
     # Create and add a new Accessor
     accessor = gl.Accessor(
         bufferView=buffer_view_id,
         byteOffset=0,
-        componentType=component_type.value,
-        normalized=normalized,
-        type=accessor_type.value,
-        count=count,
-        min=min_value,
-        max=max_value,
+        componentType=encoded_array.component_type.value,
+        normalized=normalized or encoded_array.normalized,
+        type=encoded_array.accessor_type.value,
+        count=encoded_array.count,
+        min=encoded_array.min,
+        max=encoded_array.max,
         sparse=None,
     )
     gltf_model.accessors.append(accessor)
     accessor_id = len(gltf_model.accessors) - 1
 
-    cache_data(data=np_array, data_id=accessor_id, cache=cache)
+    cache_data(data=None, data_id=accessor_id, cache=cache, digest=encoded_array.digest)
 
     return accessor_id
 
 
+def _checksum_vtk_arrays(dataset: pv.DataSet) -> int:
+    """
+    Compute a CRC32 checksum of the points, cells and data arrays of a dataset (without copying them).
+    Used to detect the modifications made through numpy views, which don't bump the VTK modification time.
+    """
+    from vtkmodules.util.numpy_support import vtk_to_numpy
+    from vtkmodules.vtkCommonDataModel import vtkPointSet, vtkPolyData, vtkUnstructuredGrid
+
+    arrays = [dataset.GetPointData().GetAbstractArray(i) for i in range(dataset.GetPointData().GetNumberOfArrays())]
+    arrays += [dataset.GetCellData().GetAbstractArray(i) for i in range(dataset.GetCellData().GetNumberOfArrays())]
+    if isinstance(dataset, vtkPointSet) and dataset.GetPoints() is not None:
+        arrays.append(dataset.GetPoints().GetData())
+    if isinstance(dataset, vtkPolyData):
+        cell_arrays = [dataset.GetVerts(), dataset.GetLines(), dataset.GetPolys(), dataset.GetStrips()]
+    elif isinstance(dataset, vtkUnstructuredGrid):
+        cell_arrays = [dataset.GetCells()] if dataset.GetCells() is not None else []
+        arrays.append(dataset.GetCellTypesArray())
+    else:
+        cell_arrays = []
+    for cell_array in cell_arrays:
+        arrays += [cell_array.GetOffsetsArray(), cell_array.GetConnectivityArray()]
+
+    checksum = 0
+    for array in arrays:
+        if array is not None and array.IsNumeric():
+            checksum = zlib.crc32(np.ascontiguousarray(vtk_to_numpy(array)), checksum)
+    return checksum
+
+
+class GltfExportCache:
+    """
+    Persistent cache of the encoded meshes and textures of a tree, reused between successive exports.
+
+    Entries are keyed on the identity of the pyvista objects and validated with their VTK modification time
+    (`GetMTime()`, bumped by VTK on each modification) and a checksum of their arrays (modifications through
+    numpy views don't bump the modification time), so repeated exports of a mostly unchanged scene
+    (e.g. each `show()` or map reset) only triangulate, convert and hash the meshes and textures that changed.
+    Entries not used during an export are dropped at the end of it.
+    Several encodings of a same object (e.g. quantized or not) can be cached under different keys.
+
+    The cache used by default is attached to the root node of the exported tree.
+    It can be shared by exports running concurrently in several threads.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, Any], Tuple[weakref.ref, Tuple[int, int], Any]] = {}
+        self._used: Set[Tuple[int, Any]] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        return {}  # The lock and the weak references can't be pickled: copies start with an empty cache
+
+    def __setstate__(self, state: dict):
+        self.__init__()
+
+    @staticmethod
+    def _version(obj: Union[pv.DataSet, pv.MultiBlock, pv.Texture]) -> Tuple[int, int]:
+        """The VTK modification time of the object (and of its blocks or input image) and the checksum of its arrays."""
+        if isinstance(obj, pv.MultiBlock):
+            versions = [GltfExportCache._version(block) for block in obj if block is not None]
+            checksums = b"".join(checksum.to_bytes(4, "little") for _, checksum in versions)
+            return max([obj.GetMTime()] + [mtime for mtime, _ in versions]), zlib.crc32(checksums)
+        if isinstance(obj, pv.Texture) and obj.GetInput() is not None:
+            return max(obj.GetMTime(), obj.GetInput().GetMTime()), _checksum_vtk_arrays(obj.GetInput())
+        return obj.GetMTime(), _checksum_vtk_arrays(obj)
+
+    def get(self, obj: Union[pv.DataSet, pv.MultiBlock, pv.Texture], key: Any = None) -> Optional[Any]:
+        """
+        Get the encoded value of an object if it is cached and was not modified since.
+
+        Args:
+            obj (`pyvista.DataSet` or `pyvista.MultiBlock` or `pyvista.Texture`):
+                The mesh or texture.
+            key (`Any`, *optional*, defaults to `None`):
+                The kind of encoding of the object.
+
+        Returns:
+            value (`Any`):
+                The cached encoded value or `None`.
+        """
+        entry = self._entries.get((id(obj), key))
+        if entry is None or entry[0]() is not obj or entry[1] != self._version(obj):
+            return None
+        with self._lock:
+            self._used.add((id(obj), key))
+        return entry[2]
+
+    def set(self, obj: Union[pv.DataSet, pv.MultiBlock, pv.Texture], value: Any, key: Any = None):
+        """
+        Cache the encoded value of an object.
+
+        Args:
+            obj (`pyvista.DataSet` or `pyvista.MultiBlock` or `pyvista.Texture`):
+                The mesh or texture.
+            value (`Any`):
+                The encoded value.
+            key (`Any`, *optional*, defaults to `None`):
+                The kind of encoding of the object.
+        """
+        entry = (weakref.ref(obj), self._version(obj), value)
+        with self._lock:
+            self._entries[(id(obj), key)] = entry
+            self._used.add((id(obj), key))
+
+    def prune(self):
+        """Drop the entries which were not used since the last call."""
+        with self._lock:
+            self._entries = {key: entry for key, entry in self._entries.items() if key in self._used}
+            self._used = set()
+
+    def clear(self):
+        """Drop all the entries."""
+        with self._lock:
+            self._entries = {}
+            self._used = set()
+
+
 def add_texture_to_gltf(
     texture: pv.Texture,
     gltf_model: gl.GLTFModel,
     buffer_data: bytearray,
     buffer_id: int = 0,
     cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
 ) -> int:
     """
     Create/add GLTF accessor and buffer view to the GLTF scene to store a texture and
@@ -283,21 +516,60 @@ def add_texture_to_gltf(
             The buffer id to add the buffer view to.
         cache (`Dict`, *optional*, defaults to `None`):
             The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded textures.
 
     Returns:
         texture_id (`int`):
             The id of the added texture.
     """
+    encoded_texture = export_cache.get(texture) if export_cache is not None else None
+    if encoded_texture is None:
+        encoded_texture = encode_texture(texture)
+        if export_cache is not None:
+            export_cache.set(texture, encoded_texture)
+    cached_digest, png_data = encoded_texture
+
+    # Is the data already cached?
+    cached_id = is_data_cached(data=None, cache=cache, digest=cached_digest)
+    if cached_id is not None:
+        return cached_id
+
+    buffer_view_id = add_data_to_gltf(
+        new_data=bytearray(png_data), gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+    )
+
+    gltf_image = gl.Image(bufferView=buffer_view_id, mimeType="image/png")
+    gltf_model.images.append(gltf_image)
+    image_id = len(gltf_model.images) - 1
+
+    gltf_model.textures.append(gl.Texture(source=image_id))
+    texture_id = len(gltf_model.textures) - 1
+
+    cache_data(data=None, data_id=texture_id, cache=cache, digest=cached_digest)
+
+    return texture_id
+
+
+def encode_texture(texture: pv.Texture) -> Tuple[bytes, bytes]:
+    """
+    Encode a texture in PNG.
+
+    Args:
+        texture (`pv.Texture`):
+            The texture to encode.
 
+    Returns:
+        digest (`bytes`):
+            The hash digest of the raw texture data.
+        png_data (`bytes`):
+            The texture encoded in PNG.
+    """
     inp = texture.GetInput()  # Get a UniformGrid - safety check
     if not inp or not inp.GetPointData().GetScalars():
         raise NotImplementedError("Cannot cast texture")
 
-    # Is the data already cached?
-    cached_buffer = bytearray(memoryview(inp.GetPointData().GetScalars()).tobytes())
-    cached_id = is_data_cached(data=cached_buffer, cache=cache)
-    if cached_id is not None:
-        return cached_id
+    raw_buffer = memoryview(inp.GetPointData().GetScalars())
 
     # This is some dark vtk magic inspired by
     # https://github.com/Kitware/VTK/blob/0718b3697bf4bd81c155a20d4f12bf5665ebe7c4/IO/Geometry/vtkGLTFWriter.cxx#L192
@@ -315,23 +587,7 @@ def add_texture_to_gltf(
     writer.Write()
     data = writer.GetResult()
 
-    mem_view = memoryview(data)
-    byte_array = bytearray(mem_view.tobytes())
-
-    buffer_view_id = add_data_to_gltf(
-        new_data=byte_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
-    )
-
-    gltf_image = gl.Image(bufferView=buffer_view_id, mimeType="image/png")
-    gltf_model.images.append(gltf_image)
-    image_id = len(gltf_model.images) - 1
-
-    gltf_model.textures.append(gl.Texture(source=image_id))
-    texture_id = len(gltf_model.textures) - 1
-
-    cache_data(data=cached_buffer, data_id=texture_id, cache=cache)
-
-    return texture_id
+    return _get_digest(raw_buffer), memoryview(data).tobytes()
 
 
 def add_material_to_gltf(
@@ -340,6 +596,7 @@ def add_material_to_gltf(
     buffer_data: Union[bytearray, ByteString],
     buffer_id: int = 0,
     cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
 ) -> int:
     """
     Add GLTF accessor and buffer view to the GLTF scene to store a Material and
@@ -356,6 +613,8 @@ def add_material_to_gltf(
             The buffer id to add the buffer view to.
         cache (`Dict`, *optional*, defaults to `None`):
             The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded textures.
 
     Returns:
         material_id (`int`):
@@ -380,7 +639,12 @@ def add_material_to_gltf(
         textures_ids[key] = None
         if texture is not None:
             texture_id = add_texture_to_gltf(
-                texture=texture, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+                texture=texture,
+                gltf_model=gltf_model,
+                buffer_data=buffer_data,
+                buffer_id=buffer_id,
+                cache=cache,
+                export_cache=export_cache,
             )
             textures_ids[key] = gl.TextureInfo(index=texture_id)
 
@@ -413,6 +677,205 @@ def add_material_to_gltf(
     return material_id
 
 
+class EncodedPrimitive(NamedTuple):
+    """A primitive of a mesh encoded for glTF (see `encode_mesh`)."""
+
+    mode: int
+    indices: EncodedArray
+
+
+class EncodedMeshBlock(NamedTuple):
+    """A block of a mesh encoded for glTF: the vertex attributes shared by the primitives of the block."""
+
+    position: EncodedArray
+    normal: Optional[EncodedArray]
+    texcoord_0: Optional[EncodedArray]
+    primitives: List[EncodedPrimitive]
+    # For quantized meshes, the (translation, scale) mapping the normalized positions back to the mesh positions
+    dequantization: Optional[Tuple[List[float], List[float]]] = None
+
+
+def encode_mesh(
+    meshes: Union[pv.UnstructuredGrid, pv.PolyData, pv.MultiBlock], quantize: bool = False
+) -> List[EncodedMeshBlock]:
+    """
+    Encode the vertices, normals, texture coordinates and (triangulated) indices of a mesh for glTF.
+
+    Args:
+        meshes (`pyvista.UnstructuredGrid` or `pyvista.PolyData` or `pyvista.MultiBlock`):
+            The mesh(es) to encode.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the vertex attributes (`KHR_mesh_quantization`): positions and normals are stored
+            as normalized int16, texture coordinates in [0, 1] as normalized uint16 and indices as uint16 when
+            the mesh has less than 65535 points. The positions are normalized in the bounding box of the mesh,
+            given by the `dequantization` transform of the blocks.
+
+    Returns:
+        encoded_blocks (`List[EncodedMeshBlock]`):
+            The encoded blocks of the mesh.
+    """
+    if not isinstance(meshes, pv.MultiBlock):
+        meshes = [meshes]
+
+    dequantization = None
+    if quantize:
+        # The same transform for all the blocks, since they are the primitives of a single glTF mesh
+        low = np.min([mesh.points.min(axis=0) for mesh in meshes if mesh.n_points], axis=0)
+        high = np.max([mesh.points.max(axis=0) for mesh in meshes if mesh.n_points], axis=0)
+        translation = (low + high) / 2
+        scale = (high - low) / 2
+        scale[scale == 0] = 1.0
+        dequantization = (translation.tolist(), scale.tolist())
+
+    encoded_blocks = []
+    for mesh in meshes:
+        if mesh.n_verts == 0 and mesh.n_lines == 0 and mesh.n_faces == 0:
+            raise NotImplementedError()
+
+        # Store points in gltf
+        if quantize:
+            points = np.round((mesh.points - translation) / scale * 32767)
+            position = encode_quantized_array(points.clip(-32767, 32767).astype(NP_INT16))
+        else:
+            position = encode_numpy_array(mesh.points.astype(NP_FLOAT32))
+
+        # Store vertex normals in gltf (TODO maybe not always necessary?)
+        normal = None
+        if mesh.active_normals is not None:
+            if quantize:
+                normals = np.round(np.clip(mesh.active_normals, -1.0, 1.0) * 32767)
+                normal = encode_quantized_array(normals.astype(NP_INT16))
+            else:
+                normal = encode_numpy_array(mesh.active_normals.astype(NP_FLOAT32))
+
+        # Store texture coord in gltf (TODO maybe not always necessary?)
+        texcoord_0 = None
+        if mesh.active_t_coords is not None:
+            t_coords = mesh.active_t_coords
+            if quantize and t_coords.min() >= 0.0 and t_coords.max() <= 1.0:
+                texcoord_0 = encode_quantized_array(np.round(t_coords * 65535).astype(NP_UINT16))
+            else:
+                texcoord_0 = encode_numpy_array(t_coords.astype(NP_FLOAT32))
+
+        # Indices fitting in 16 bits are stored as uint16 for quantized meshes (65535 is reserved in glTF)
+        indices_dtype = NP_UINT16 if quantize and mesh.n_points < 65535 else NP_UINT32
+
+        # Indices are written differently in gltf depending on the type (POINTS, LINES, TRIANGLES)
+        primitives = []
+        # Add verts as a Primitive if we have some
+        if mesh.n_verts:
+            np_array = mesh.verts.copy().reshape((-1, 1)).astype(indices_dtype)
+            primitives.append(EncodedPrimitive(gl.PrimitiveMode.POINTS.value, encode_numpy_array(np_array)))
+
+        # Add lines as a Primitive if we have some
+        if mesh.n_lines:
+            np_array = mesh.lines.copy().reshape((-1, 1)).astype(indices_dtype)
+            primitives.append(EncodedPrimitive(gl.PrimitiveMode.LINES.value, encode_numpy_array(np_array)))
+
+        # Add faces as a Primitive if we have some
+        if mesh.n_faces:
+            tri_mesh = mesh.triangulate()  # Triangulate the mesh (gltf can nly store triangulated meshes)
+            np_array = (
+                tri_mesh.faces.copy().reshape((-1, 4))[:, 1:].reshape(-1, 1).astype(indices_dtype)
+            )  # We drop the number of indices per face
+            primitives.append(EncodedPrimitive(gl.PrimitiveMode.TRIANGLES.value, encode_numpy_array(np_array)))
+
+        encoded_blocks.append(EncodedMeshBlock(position, normal, texcoord_0, primitives, dequantization))
+
+    return encoded_blocks
+
+
+# The exports share a bounded pool of threads, created on the first export with enough resources to encode
+MAX_ENCODING_THREADS = 8
+MIN_PARALLEL_ENCODING_JOBS = 4
+_encoding_pool: Optional[ThreadPoolExecutor] = None
+_encoding_pool_lock = threading.Lock()
+
+
+def _get_encoding_pool() -> ThreadPoolExecutor:
+    """Get the thread pool encoding the meshes and textures, created on the first call."""
+    global _encoding_pool
+    with _encoding_pool_lock:
+        if _encoding_pool is None:
+            # The threads are only started when needed, up to the largest number of threads used by an export
+            _encoding_pool = ThreadPoolExecutor(max_workers=MAX_ENCODING_THREADS, thread_name_prefix="gltf_encode")
+    return _encoding_pool
+
+
+def encode_tree_resources(
+    root_node: "Asset", export_cache: GltfExportCache, max_workers: Optional[int] = None, quantize: bool = False
+) -> GltfExportCache:
+    """
+    Encode the meshes and textures of a tree which are not up-to-date in the export cache, in parallel.
+
+    Triangulating, converting and hashing the meshes and compressing the textures is mostly done in numpy/VTK
+    code, so this "encode" phase runs in a thread pool shared by all the exports (only when there are at least
+    `MIN_PARALLEL_ENCODING_JOBS` resources to encode). The (serial) assembly of the glTF buffer then only reads
+    the encoded data from the cache, so the output is identical to the one of a serial export.
+
+    Args:
+        root_node (`Asset`):
+            The root node of the tree.
+        export_cache (`GltfExportCache`):
+            The cache to fill with the encoded meshes and textures.
+        max_workers (`int`, *optional*, defaults to `None`):
+            The maximum number of threads used to encode (defaults to the number of CPUs, at most
+            `MAX_ENCODING_THREADS`). Use `1` to encode serially.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether the meshes of the Object3D are exported quantized (see `encode_mesh`).
+
+    Returns:
+        export_cache (`GltfExportCache`):
+            The export cache.
+    """
+    meshes, textures = {}, {}
+    for node in (root_node,) + root_node.tree_descendants:
+        if not isinstance(node, (Object3D, Collider)):
+            continue
+        mesh = node.shared_mesh if isinstance(node, Object3D) else node.mesh
+        if mesh is None:
+            continue
+        mesh_key = "quantized" if quantize and isinstance(node, Object3D) else None
+        meshes[(id(mesh), mesh_key)] = (mesh, mesh_key)
+        materials = node.material if isinstance(node.material, list) else [node.material]
+        for material in materials:
+            if not isinstance(material, Material):
+                continue
+            for texture in (
+                material.base_color_texture,
+                material.emissive_texture,
+                material.normal_texture,
+                material.occlusion_texture,
+                material.metallic_roughness_texture,
+            ):
+                if texture is not None:
+                    textures[id(texture)] = texture
+
+    # The cache is checked once per unique mesh and texture (the check computes a checksum of their arrays)
+    meshes = {key: value for key, value in meshes.items() if export_cache.get(value[0], key=value[1]) is None}
+    textures = {key: texture for key, texture in textures.items() if export_cache.get(texture) is None}
+
+    jobs = [(partial(encode_mesh, quantize=key is not None), mesh, key) for mesh, key in meshes.values()]
+    jobs += [(encode_texture, texture, None) for texture in textures.values()]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    n_chunks = min(max_workers, MAX_ENCODING_THREADS, len(jobs))
+    if n_chunks > 1 and len(jobs) >= MIN_PARALLEL_ENCODING_JOBS:
+        # Each of the (at most `max_workers`) threads encodes every n-th resource
+        chunks = [jobs[i::n_chunks] for i in range(n_chunks)]
+        chunks_values = _get_encoding_pool().map(lambda chunk: [encode(obj) for encode, obj, _ in chunk], chunks)
+        values = [None] * len(jobs)
+        for i, chunk_values in enumerate(chunks_values):
+            values[i::n_chunks] = chunk_values
+    else:
+        values = [encode(obj) for encode, obj, _ in jobs]
+
+    # Versions are read here, in the main thread, like in a serial export
+    for (_, obj, key), value in zip(jobs, values):
+        export_cache.set(obj, value, key=key)
+    return export_cache
+
+
 def add_mesh_to_model(
     meshes: Union[pv.UnstructuredGrid, pv.MultiBlock],
     materials: Union[Material, None],
@@ -420,6 +883,8 @@ def add_mesh_to_model(
     buffer_data: ByteString,
     buffer_id: int = 0,
     cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
+    quantize: bool = False,
 ) -> int:
     """
     Add GLTF accessor and buffer view to the GLTF scene to store a mesh and
@@ -438,53 +903,58 @@ def add_mesh_to_model(
             The buffer id to add the buffer view to.
         cache (`Dict`, *optional*, defaults to `None`):
             The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded meshes and textures.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the vertex attributes (see `encode_mesh`). The dequantization transform
+            of the mesh is stored in the cache under the `("dequantization", mesh_id)` key.
 
     Returns:
         mesh_id (`int`):
             The id of the added mesh.
     """
-    if not isinstance(meshes, pv.MultiBlock):
-        meshes = [meshes]
-        materials = [materials]
-    else:
-        pass
-
-    # handle case if Material is None
-    if materials is None:
+    # Instances (see `Asset.instantiate`) share the same mesh and material objects:
+    # we can skip encoding and hashing them again
+    instance_key = (id(meshes), id(materials), quantize)
+    if isinstance(cache, dict) and instance_key in cache:
+        return cache[instance_key]
+
+    export_key = "quantized" if quantize else None
+    encoded_blocks = export_cache.get(meshes, key=export_key) if export_cache is not None else None
+    if encoded_blocks is None:
+        encoded_blocks = encode_mesh(meshes, quantize=quantize)
+        if export_cache is not None:
+            export_cache.set(meshes, encoded_blocks, key=export_key)
+    dequantization = encoded_blocks[0].dequantization if encoded_blocks else None
+
+    if not isinstance(meshes, pv.MultiBlock) or materials is None:
         materials = [materials]
 
     primitives = []
 
-    for mesh, material in zip(meshes, materials):
-        if mesh.n_verts == 0 and mesh.n_lines == 0 and mesh.n_faces == 0:
-            raise NotImplementedError()
-
-        # Store points in gltf
-        np_array = mesh.points.astype(NP_FLOAT32)
-        point_accessor = add_numpy_to_gltf(
-            np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
-        )
-
-        # Store vertex normals in gltf (TODO maybe not always necessary?)
-        normal_accessor = None
-        if mesh.active_normals is not None:
-            np_array = mesh.active_normals.astype(NP_FLOAT32)
-            normal_accessor = add_numpy_to_gltf(
-                np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
-            )
-
-        # Store texture coord in gltf (TODO maybe not always necessary?)
-        tcoord_accessor = None
-        if mesh.active_t_coords is not None:
-            np_array = mesh.active_t_coords.astype(NP_FLOAT32)
-            tcoord_accessor = add_numpy_to_gltf(
-                np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+    for encoded_block, material in zip(encoded_blocks, materials):
+        point_accessor, normal_accessor, tcoord_accessor = [
+            add_numpy_to_gltf(
+                np_array=encoded_array,
+                gltf_model=gltf_model,
+                buffer_data=buffer_data,
+                buffer_id=buffer_id,
+                cache=cache,
             )
+            if encoded_array is not None
+            else None
+            for encoded_array in (encoded_block.position, encoded_block.normal, encoded_block.texcoord_0)
+        ]
 
         if material is not None and isinstance(material, Material):
             # Add a material and/or texture if we want
             material_id = add_material_to_gltf(
-                material=material, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+                material=material,
+                gltf_model=gltf_model,
+                buffer_data=buffer_data,
+                buffer_id=buffer_id,
+                cache=cache,
+                export_cache=export_cache,
             )
         else:
             material_id = None
@@ -492,57 +962,41 @@ def add_mesh_to_model(
         attributes = gl.Attributes(POSITION=point_accessor, NORMAL=normal_accessor, TEXCOORD_0=tcoord_accessor)
         # attributes.COLOR_0 = vertex_accessor  # TODO Add back vertex color if we want to
 
-        # Add verts as a Primitive if we have some
-        if mesh.n_verts:
-            primitive = gl.Primitive(mode=gl.PrimitiveMode.POINTS.value, attributes=attributes)
-            # Stores and add indices (indices are written differently in gltf depending on the type
-            # (POINTS, LINES, TRIANGLES))
-            np_array = mesh.verts.copy().reshape((-1, 1)).astype(NP_UINT32)
-            primitive.indices = add_numpy_to_gltf(
-                np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
-            )
-            primitive.material = material_id
-            primitives.append(primitive)
-
-        # Add lines as a Primitive if we have some
-        if mesh.n_lines:
-            primitive = gl.Primitive(mode=gl.PrimitiveMode.LINES.value, attributes=attributes)
-            # Stores and add indices (indices are written differently in gltf depending on the type
-            # (POINTS, LINES, TRIANGLES))
-            np_array = mesh.lines.copy().reshape((-1, 1)).astype(NP_UINT32)
-            primitive.indices = add_numpy_to_gltf(
-                np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
-            )
-            primitive.material = material_id
-            primitives.append(primitive)
-
-        # Add faces as a Primitive if we have some
-        if mesh.n_faces:
-            primitive = gl.Primitive(mode=gl.PrimitiveMode.TRIANGLES.value, attributes=attributes)
-            # Stores and add indices (indices are written differently in gltf depending on the type
-            # (POINTS, LINES, TRIANGLES))
-            tri_mesh = mesh.triangulate()  # Triangulate the mesh (gltf can nly store triangulated meshes)
-            np_array = (
-                tri_mesh.faces.copy().reshape((-1, 4))[:, 1:].reshape(-1, 1).astype(NP_UINT32)
-            )  # We drop the number of indices per face
+        for encoded_primitive in encoded_block.primitives:
+            primitive = gl.Primitive(mode=encoded_primitive.mode, attributes=attributes)
             primitive.indices = add_numpy_to_gltf(
-                np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+                np_array=encoded_primitive.indices,
+                gltf_model=gltf_model,
+                buffer_data=buffer_data,
+                buffer_id=buffer_id,
+                cache=cache,
             )
             primitive.material = material_id
             primitives.append(primitive)
 
-    # Create a final new mesh with all the primitives
-    gltf_mesh = gl.Mesh(primitives=primitives)
-
-    # If we have already created exactly the same mesh we avoid double storing
-    cached_id = is_data_cached(data=gltf_mesh.to_json(), cache=cache)
+    # If we have already created exactly the same mesh (same accessors and materials) we avoid double storing
+    mesh_key = (
+        "mesh",
+        tuple(
+            (p.mode, p.attributes.POSITION, p.attributes.NORMAL, p.attributes.TEXCOORD_0, p.indices, p.material)
+            for p in primitives
+        ),
+    )
+    if dequantization is not None:
+        mesh_key += (tuple(dequantization[0]), tuple(dequantization[1]))
+    cached_id = cache.get(mesh_key)
     if cached_id is not None:
+        cache[instance_key] = cached_id
         return cached_id
 
-    gltf_model.meshes.append(gltf_mesh)
+    # Create a final new mesh with all the primitives
+    gltf_model.meshes.append(gl.Mesh(primitives=primitives))
     mesh_id = len(gltf_model.meshes) - 1
 
-    cache_data(data=gltf_mesh.to_json(), data_id=mesh_id, cache=cache)
+    cache[mesh_key] = mesh_id
+    cache[instance_key] = mesh_id
+    if dequantization is not None:
+        cache[("dequantization", mesh_id)] = dequantization
 
     return mesh_id
 
@@ -656,83 +1110,184 @@ def add_light_to_model(
     return light_id
 
 
-def add_node_to_scene(
-    node: "Asset",
+def _split_instanced_nodes(nodes: List["Asset"]) -> Tuple[List[List["Object3D"]], List["Asset"]]:
+    """
+    Split a list of sibling nodes in groups of leaf Object3D sharing the same mesh and material objects
+    (which can be exported as a single GPU instanced node) and the remaining nodes.
+
+    Args:
+        nodes (`List[Asset]`):
+            The sibling nodes to split.
+
+    Returns:
+        instanced_groups (`List[List[Object3D]]`):
+            The groups of (at least two) nodes to export with GPU instancing.
+        other_nodes (`List[Asset]`):
+            The nodes to export as separate glTF nodes.
+    """
+    groups = {}
+    for node in nodes:
+        if (
+            isinstance(node, Object3D)
+            and not node.tree_children
+            and not list(node.named_components)
+            and not node.is_actor
+            and not node.extensions
+        ):
+            groups.setdefault((id(node.shared_mesh), id(node.material)), []).append(node)
+
+    instanced_groups = [group for group in groups.values() if len(group) > 1]
+    instanced_ids = {id(node) for group in instanced_groups for node in group}
+    other_nodes = [node for node in nodes if id(node) not in instanced_ids]
+    return instanced_groups, other_nodes
+
+
+def add_instanced_nodes_to_scene(
+    nodes: List["Object3D"],
     gltf_model: gl.GLTFModel,
     buffer_data: ByteString,
     gl_parent_node_id: Optional[int] = None,
     buffer_id: Optional[int] = 0,
     cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
 ) -> Set[str]:
     """
-    Add a node to a scene.
+    Add a group of Object3D sharing the same mesh and material as a single node
+    using the `EXT_mesh_gpu_instancing` extension.
 
     Args:
-        node (`Asset`):
-            The node to add to the GLTF scene.
+        nodes (`List[Object3D]`):
+            The nodes to add to the GLTF scene.
         gltf_model (`GLTFModel`):
-            The GLTF model to add the node to.
+            The GLTF model to add the nodes to.
         buffer_data (`ByteString`):
-            The buffer data to add the node to.
+            The buffer data to add the nodes to.
         gl_parent_node_id (`int`, *optional*, defaults to `None`):
-            The parent node id to add the node to.
+            The parent node id to add the nodes to.
         buffer_id (`int`, *optional*, defaults to `0`):
-            The buffer id to add the node to.
+            The buffer id to add the nodes to.
         cache (`Dict`, *optional*, defaults to `None`):
             The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded meshes and textures.
 
     Returns:
         extensions_used (`Set[str]`):
             The extensions used by the GLTF scene.
     """
-    translation = list(node.position) if node.position is not None else None
-    rotation = list(node.rotation) if node.rotation is not None else None
-    scale = list(node.scaling) if node.scaling is not None else None
+    mesh_id = add_mesh_to_model(
+        meshes=nodes[0].shared_mesh,
+        materials=nodes[0].material,
+        gltf_model=gltf_model,
+        buffer_data=buffer_data,
+        buffer_id=buffer_id,
+        cache=cache,
+        export_cache=export_cache,
+    )
 
-    if translation is None and rotation is None and scale is None and node.transformation_matrix is not None:
-        # We transpose to get Column major format for gltf
-        matrix = node.transformation_matrix.transpose().tolist() if node.transformation_matrix is not None else None
-    else:
-        matrix = None
+    attributes = {
+        "TRANSLATION": np.array([node._position for node in nodes], dtype=NP_FLOAT32),
+        "ROTATION": np.array([node._rotation for node in nodes], dtype=NP_FLOAT32),
+        "SCALE": np.array([node._scaling for node in nodes], dtype=NP_FLOAT32),
+    }
+    for key, np_array in attributes.items():
+        attributes[key] = add_numpy_to_gltf(
+            np_array=np_array, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
+        )
 
+    extensions = gl.Extensions()
+    extensions.EXT_mesh_gpu_instancing = gl.EXTMeshGpuInstancing(attributes=attributes)
     gl_node = gl.Node(
-        name=node.name,
-        translation=translation,
-        rotation=rotation,
-        scale=scale,
-        matrix=matrix,
+        name=nodes[0].name + "_instances",
+        mesh=mesh_id,
+        extensions=extensions,
+        extras={"instance_names": [node.name for node in nodes]},
     )
 
-    extensions = gl.Extensions()
-    extras = dict()
-    extension_used = set()
+    gltf_model.nodes.append(gl_node)
+    gl_node_id = len(gltf_model.nodes) - 1
+
+    if gl_parent_node_id is not None:
+        if gltf_model.nodes[gl_parent_node_id].children is None:
+            gltf_model.nodes[gl_parent_node_id].children = [gl_node_id]
+        else:
+            gltf_model.nodes[gl_parent_node_id].children.append(gl_node_id)
+
+    return {"EXT_mesh_gpu_instancing"}
+
+
+class NodeResources(NamedTuple):
+    """The ids of the glTF objects added for the content of a node (see `add_node_resources_to_model`)."""
+
+    camera: Optional[int]
+    light: Optional[int]
+    mesh: Optional[int]
+    node_objects: List[int]  # Extension objects of the special nodes (RewardFunction, Sensors, Colliders, etc)
+    components: List[int]  # Extension objects of the components, in the order of `named_components`
+
+
+def add_node_resources_to_model(
+    node: "Asset",
+    gltf_model: gl.GLTFModel,
+    buffer_data: ByteString,
+    buffer_id: Optional[int] = 0,
+    cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
+    quantize: bool = False,
+) -> NodeResources:
+    """
+    Add the camera, light, mesh and extension objects of a node (without its name and transform) to the model.
+
+    Args:
+        node (`Asset`):
+            The node whose content is added to the GLTF model.
+        gltf_model (`GLTFModel`):
+            The GLTF model to add the objects to.
+        buffer_data (`ByteString`):
+            The buffer data to add the objects to.
+        buffer_id (`int`, *optional*, defaults to `0`):
+            The buffer id to add the objects to.
+        cache (`Dict`, *optional*, defaults to `None`):
+            The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded meshes and textures.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes of the Object3D (see `encode_mesh`).
+
+    Returns:
+        resources (`NodeResources`):
+            The ids of the added (or already added) objects.
+    """
+    camera_id, light_id, mesh_id, node_objects = None, None, None, []
 
     if isinstance(node, Camera):
-        gl_node.camera = add_camera_to_model(
+        camera_id = add_camera_to_model(
             camera=node, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
         )
     elif isinstance(node, Light):
         light_id = add_light_to_model(
             node=node, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=buffer_id, cache=cache
         )
-        extensions.KHR_lights_punctual = gl.KHRLightsPunctual(light=light_id)
-        extension_used.add("KHR_lights_punctual")
 
     elif isinstance(node, Object3D):
         # For Object3D and for Collider we can have a mesh
-        gl_node.mesh = add_mesh_to_model(
-            meshes=node.mesh,
+        mesh_id = add_mesh_to_model(
+            meshes=node.shared_mesh,
             materials=getattr(node, "material", None),
             gltf_model=gltf_model,
             buffer_data=buffer_data,
             buffer_id=buffer_id,
             cache=cache,
+            export_cache=export_cache,
+            quantize=quantize,
         )
     else:
         for cls in GLTF_NODES_EXTENSION_CLASS:
             # One of our special type of nodes (RewardFunction, Sensors, Colliders, etc)
             if isinstance(node, cls):
                 # For the colliders we add the physic material and mesh manually
+                # (the physic material id is only set in the stored copy of the collider)
+                overrides = None
                 if isinstance(node, Collider):
                     material = getattr(node, "material", None)
                     if material is not None:
@@ -740,40 +1295,137 @@ def add_node_to_scene(
                         if material_id is None:
                             material_id = material.add_component_to_gltf_model(gltf_model.extensions)
                             cache_data(data=material.to_json(), data_id=material_id, cache=cache)
-                        node.physic_material = material_id
                     else:
-                        node.physic_material = None
+                        material_id = None
+                    overrides = {"physic_material": material_id}
 
                     if node.mesh is not None:
-                        gl_node.mesh = add_mesh_to_model(
+                        mesh_id = add_mesh_to_model(
                             meshes=node.mesh,
                             materials=None,
                             gltf_model=gltf_model,
                             buffer_data=buffer_data,
                             buffer_id=buffer_id,
                             cache=cache,
+                            export_cache=export_cache,
                         )
 
                 # If the special node is not cached
                 # (here we test only the fields of the dataclass and thus must add te mesh manually above)
-                object_id = is_data_cached(data=node.to_json(), cache=cache)
+                node_json = node.gltf_json(overrides)
+                object_id = is_data_cached(data=node_json, cache=cache)
                 if object_id is None:
-                    object_id = node.add_component_to_gltf_model(gltf_model.extensions)
-                    cache_data(data=node.to_json(), data_id=object_id, cache=cache)
-
-                new_extension_used = node.add_component_to_gltf_node(
-                    extensions, object_id=object_id, object_name=node.name
-                )
-                extension_used.add(new_extension_used)
+                    object_id = node.add_component_to_gltf_model(gltf_model.extensions, overrides)
+                    cache_data(data=node_json, data_id=object_id, cache=cache)
+                node_objects.append(object_id)
 
-    # Add all the automatic components of the node
-    for component_name, component in node.named_components:
+    components = []
+    for _, component in node.named_components:
         # If we have already created exactly the same collider we avoid double storing
-        object_id = is_data_cached(data=component.to_json(), cache=cache)
+        component_json = component.gltf_json()
+        object_id = is_data_cached(data=component_json, cache=cache)
         if object_id is None:
             object_id = component.add_component_to_gltf_model(gltf_model.extensions)
-            cache_data(data=component.to_json(), data_id=object_id, cache=cache)
+            cache_data(data=component_json, data_id=object_id, cache=cache)
+        components.append(object_id)
+
+    return NodeResources(
+        camera=camera_id, light=light_id, mesh=mesh_id, node_objects=node_objects, components=components
+    )
+
+
+def add_node_to_scene(
+    node: "Asset",
+    gltf_model: gl.GLTFModel,
+    buffer_data: ByteString,
+    gl_parent_node_id: Optional[int] = None,
+    buffer_id: Optional[int] = 0,
+    cache: Optional[Dict] = None,
+    export_cache: Optional[GltfExportCache] = None,
+    gpu_instancing: bool = False,
+    quantize: bool = False,
+) -> Set[str]:
+    """
+    Add a node to a scene.
+
+    The nodes with the same structural hash reuse the meshes and glTF objects of the first one, the structural
+    hashes of the tree should thus be up to date (see `Asset._refresh_structural_hash`).
+
+    Args:
+        node (`Asset`):
+            The node to add to the GLTF scene.
+        gltf_model (`GLTFModel`):
+            The GLTF model to add the node to.
+        buffer_data (`ByteString`):
+            The buffer data to add the node to.
+        gl_parent_node_id (`int`, *optional*, defaults to `None`):
+            The parent node id to add the node to.
+        buffer_id (`int`, *optional*, defaults to `0`):
+            The buffer id to add the node to.
+        cache (`Dict`, *optional*, defaults to `None`):
+            The cache dictionary.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded meshes and textures.
+        gpu_instancing (`bool`, *optional*, defaults to `False`):
+            Whether to export the leaf Object3D children sharing the same mesh and material
+            (see `Asset.instantiate`) as a single node with the `EXT_mesh_gpu_instancing` extension.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes of the Object3D (see `encode_mesh`). The mesh is then attached to
+            a child glTF node holding the dequantization transform (with a `"dequantization"` extras field).
+
+    Returns:
+        extensions_used (`Set[str]`):
+            The extensions used by the GLTF scene.
+    """
+    translation = list(node._position) if node._position is not None else None
+    rotation = list(node._rotation) if node._rotation is not None else None
+    scale = list(node._scaling) if node._scaling is not None else None
+
+    if translation is None and rotation is None and scale is None and node.transformation_matrix is not None:
+        # We transpose to get Column major format for gltf
+        matrix = node.transformation_matrix.transpose().tolist() if node.transformation_matrix is not None else None
+    else:
+        matrix = None
+
+    gl_node = gl.Node(
+        name=node.name,
+        translation=translation,
+        rotation=rotation,
+        scale=scale,
+        matrix=matrix,
+    )
+
+    extensions = gl.Extensions()
+    extras = dict()
+    extension_used = set()
+
+    # The nodes with the same structural hash (refreshed by `tree_as_gltf`) share their meshes and glTF objects
+    resources = cache.get(("node", node.structural_hash))
+    if resources is None:
+        resources = add_node_resources_to_model(
+            node=node,
+            gltf_model=gltf_model,
+            buffer_data=buffer_data,
+            buffer_id=buffer_id,
+            cache=cache,
+            export_cache=export_cache,
+            quantize=quantize,
+        )
+        cache[("node", node.structural_hash)] = resources
+
+    gl_node.camera = resources.camera
+    gl_node.mesh = resources.mesh
+    if resources.light is not None:
+        extensions.KHR_lights_punctual = gl.KHRLightsPunctual(light=resources.light)
+        extension_used.add("KHR_lights_punctual")
 
+    # One of our special type of nodes (RewardFunction, Sensors, Colliders, etc)
+    for object_id in resources.node_objects:
+        new_extension_used = node.add_component_to_gltf_node(extensions, object_id=object_id, object_name=node.name)
+        extension_used.add(new_extension_used)
+
+    # Add all the automatic components of the node
+    for (component_name, component), object_id in zip(node.named_components, resources.components):
         new_extension_used = component.add_component_to_gltf_node(
             extensions, object_id=object_id, object_name=component_name
         )
@@ -808,8 +1460,38 @@ def add_node_to_scene(
         else:
             gltf_model.nodes[gl_parent_node_id].children.append(gl_node_id)
 
+    # Quantized meshes are moved to a child node applying the dequantization transform (KHR_mesh_quantization)
+    dequantization = cache.get(("dequantization", gl_node.mesh)) if quantize and gl_node.mesh is not None else None
+    if dequantization is not None:
+        gltf_model.nodes.append(
+            gl.Node(
+                name=node.name + "_mesh",
+                mesh=gl_node.mesh,
+                translation=dequantization[0],
+                scale=dequantization[1],
+                extras={"dequantization": True},
+            )
+        )
+        gl_node.mesh = None
+        gl_node.children = [len(gltf_model.nodes) - 1]
+
     # Add the child nodes to the scene
-    for child_node in node.tree_children:
+    child_nodes = node.tree_children
+    if gpu_instancing:
+        instanced_groups, child_nodes = _split_instanced_nodes(child_nodes)
+        for group in instanced_groups:
+            new_extensions = add_instanced_nodes_to_scene(
+                nodes=group,
+                gl_parent_node_id=gl_node_id,
+                gltf_model=gltf_model,
+                buffer_data=buffer_data,
+                buffer_id=buffer_id,
+                cache=cache,
+                export_cache=export_cache,
+            )
+            extension_used.update(new_extensions)
+
+    for child_node in child_nodes:
         new_extensions = add_node_to_scene(
             node=child_node,
             gl_parent_node_id=gl_node_id,
@@ -817,19 +1499,51 @@ def add_node_to_scene(
             buffer_data=buffer_data,
             buffer_id=buffer_id,
             cache=cache,
+            export_cache=export_cache,
+            gpu_instancing=gpu_instancing,
+            quantize=quantize,
         )
         extension_used.update(new_extensions)
 
     return extension_used
 
 
-def tree_as_gltf(root_node: "Asset") -> gl.GLTF:
+def _uses_mesh_quantization(gltf_model: gl.GLTFModel) -> bool:
+    """Whether some vertex attributes of the meshes are stored with the integer types of KHR_mesh_quantization."""
+    for mesh in gltf_model.meshes:
+        for primitive in mesh.primitives:
+            attributes = primitive.attributes
+            for accessor_id in (attributes.POSITION, attributes.NORMAL, attributes.TEXCOORD_0):
+                if (
+                    accessor_id is not None
+                    and gltf_model.accessors[accessor_id].componentType != gl.ComponentType.FLOAT.value
+                ):
+                    return True
+    return False
+
+
+def tree_as_gltf(
+    root_node: "Asset",
+    gpu_instancing: bool = False,
+    export_cache: Optional[GltfExportCache] = None,
+    max_workers: Optional[int] = None,
+    quantize: bool = False,
+) -> gl.GLTF:
     """
     Return the tree of Assets as GLTF object.
 
     Args:
         root_node (`Asset`):
             The root node of the tree to export as glTF.
+        gpu_instancing (`bool`, *optional*, defaults to `False`):
+            Whether to export sibling instances of a same mesh with the `EXT_mesh_gpu_instancing` extension.
+        export_cache (`GltfExportCache`, *optional*, defaults to `None`):
+            The persistent cache of the encoded meshes and textures to reuse between exports.
+            Defaults to the cache attached to the root node (created on the first export).
+        max_workers (`int`, *optional*, defaults to `None`):
+            The maximum number of threads used to encode the meshes and textures (see `encode_tree_resources`).
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes with the `KHR_mesh_quantization` extension (see `encode_mesh`).
 
     Returns:
         gltf (`GLTF`):
@@ -855,13 +1569,32 @@ def tree_as_gltf(root_node: "Asset") -> gl.GLTF:
         extensions=gl.Extensions(),
     )
     cache = {}  # A mapping for Mesh/material/Texture already added
+    if export_cache is None:
+        if root_node._export_cache is None:
+            root_node._export_cache = GltfExportCache()
+        export_cache = root_node._export_cache
+
+    # The cached structural hashes don't see in-place modifications, recompute them before keying on them
+    root_node._refresh_structural_hash()
 
-    process_tree_before_gltf(root_node)
+    # Encode the new or modified meshes and textures in parallel, then assemble the glTF serially
+    encode_tree_resources(root_node, export_cache, max_workers=max_workers, quantize=quantize)
 
     # Add all the nodes and get back all the extensions used
     extension_used = add_node_to_scene(
-        node=root_node, gltf_model=gltf_model, buffer_data=buffer_data, buffer_id=0, cache=cache
+        node=root_node,
+        gltf_model=gltf_model,
+        buffer_data=buffer_data,
+        buffer_id=0,
+        cache=cache,
+        export_cache=export_cache,
+        gpu_instancing=gpu_instancing,
+        quantize=quantize,
     )
+    export_cache.prune()  # Forget the meshes and textures which are not in the tree anymore
+    if quantize and _uses_mesh_quantization(gltf_model):
+        extension_used.add("KHR_mesh_quantization")
+        gltf_model.extensionsRequired = ["KHR_mesh_quantization"]
 
     # Add scene-level extensions - only config metadata for now
     config: Optional[Config] = getattr(root_node, "config", None)
@@ -869,8 +1602,6 @@ def tree_as_gltf(root_node: "Asset") -> gl.GLTF:
         new_extension_used = config.add_component_to_gltf_scene(gltf_model.extensions)
         extension_used.add(new_extension_used)
 
-    process_tree_after_gltf(root_node)
-
     # Update scene requirements with the GLTF extensions we need
     if extension_used:
         gltf_model.extensionsUsed = list(extension_used)
@@ -891,42 +1622,189 @@ def tree_as_gltf(root_node: "Asset") -> gl.GLTF:
     return gl.GLTF(model=gltf_model, resources=[resource])
 
 
-def tree_as_glb_bytes(root_node: "Asset") -> bytes:
+def tree_as_glb_bytes(root_node: "Asset", gpu_instancing: bool = False, quantize: bool = False) -> bytes:
     """
     Return the tree of Assets as GLB bytes.
 
     Args:
         root_node (`Asset`):
             The root node of the tree to export as GLB bytes.
+        gpu_instancing (`bool`, *optional*, defaults to `False`):
+            Whether to export sibling instances of a same mesh with the `EXT_mesh_gpu_instancing` extension.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes with the `KHR_mesh_quantization` extension (see `encode_mesh`).
 
     Returns:
         glb_bytes (`bytes`):
             The glTF scene exported as GLB bytes.
     """
-    gltf = tree_as_gltf(root_node=root_node)
-    return gltf.as_glb_bytes()
+    gltf = tree_as_gltf(root_node=root_node, gpu_instancing=gpu_instancing, quantize=quantize)
+    # The glTF object is not reused so there is no need to clone it like in `as_glb_bytes()`
+    # noinspection PyProtectedMember
+    return gltf._as_glb_bytes()
+
+
+def write_tree_to_glb(root_node: "Asset", sink: Any, gpu_instancing: bool = False, quantize: bool = False) -> int:
+    """
+    Stream the tree of Assets as GLB to a file-like object, a socket or a writable buffer
+    without assembling the GLB in memory.
+
+    Args:
+        root_node (`Asset`):
+            The root node of the tree to export as GLB.
+        sink (`BinaryIO`, `socket.socket` or writable bytes-like object):
+            Where to write the GLB: an object with a `write` method (e.g. a file opened in binary mode),
+            an object with a `sendall` method (e.g. a socket) or a writable buffer (e.g. a `bytearray`).
+        gpu_instancing (`bool`, *optional*, defaults to `False`):
+            Whether to export sibling instances of a same mesh with the `EXT_mesh_gpu_instancing` extension.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes with the `KHR_mesh_quantization` extension (see `encode_mesh`).
+
+    Returns:
+        bytelength (`int`):
+            The number of bytes written.
+    """
+    gltf = tree_as_gltf(root_node=root_node, gpu_instancing=gpu_instancing, quantize=quantize)
+    # noinspection PyProtectedMember
+    return gltf._write_glb_to_sink(sink)
+
+
+def split_gltf_resources(gltf: gl.GLTF, name: str, max_buffer_size: Optional[int] = None) -> gl.GLTF:
+    """
+    Move the data of a glTF object created by `tree_as_gltf` in external files: the images are stored
+    in their own image files and the other buffer views are stored in one or several `.bin` buffer files.
 
+    Args:
+        gltf (`GLTF`):
+            The glTF object to modify in place. It should have a single buffer.
+        name (`str`):
+            The prefix of the names of the resource files (usually the name of the glTF file without extension).
+        max_buffer_size (`int`, *optional*, defaults to `None`):
+            If provided, the buffer views are split in several `.bin` files of at most this size in bytes
+            (a single buffer view bigger than this size is stored alone in its own file).
 
-def save_tree_to_gltf_file(file_path: str, root_node: "Asset") -> List[str]:
+    Returns:
+        gltf (`GLTF`):
+            The modified glTF object.
+    """
+    model = gltf.model
+    data = memoryview(gltf.get_resource(model.buffers[0].uri).data)
+
+    images_by_buffer_view = {}
+    for image in model.images or []:
+        if image.bufferView is not None:
+            images_by_buffer_view.setdefault(image.bufferView, []).append(image)
+
+    resources = []
+    buffers_parts = [[]]
+    buffers_bytelength = [0]
+    buffer_views = []
+    new_indices = {}
+    for index, buffer_view in enumerate(model.bufferViews or []):
+        offset = buffer_view.byteOffset or 0
+        segment = data[offset : offset + buffer_view.byteLength]
+        if index in images_by_buffer_view:
+            mime_type = images_by_buffer_view[index][0].mimeType
+            extension = (mimetypes.guess_extension(mime_type) if mime_type else None) or ".bin"
+            image_resource = gl.FileResource(f"{name}_image{len(resources)}{extension}", data=bytes(segment))
+            resources.append(image_resource)
+            for image in images_by_buffer_view[index]:
+                image.bufferView = None
+                image.uri = image_resource.uri
+            continue
+
+        # Buffer views are aligned on 4 bytes like in `add_data_to_gltf`
+        bytelength = buffers_bytelength[-1]
+        padding = (-bytelength) % 4
+        if max_buffer_size is not None and bytelength > 0 and bytelength + padding + len(segment) > max_buffer_size:
+            buffers_parts.append([])
+            buffers_bytelength.append(0)
+            bytelength, padding = 0, 0
+        buffers_parts[-1] += [bytes(padding), segment]
+        buffers_bytelength[-1] = bytelength + padding + len(segment)
+
+        buffer_view.buffer = len(buffers_parts) - 1
+        buffer_view.byteOffset = bytelength + padding
+        new_indices[index] = len(buffer_views)
+        buffer_views.append(buffer_view)
+
+    # Remove the buffer views of the images and update the indices in the accessors
+    for accessor in model.accessors or []:
+        if accessor.bufferView is not None:
+            accessor.bufferView = new_indices[accessor.bufferView]
+        if accessor.sparse is not None:
+            accessor.sparse.indices.bufferView = new_indices[accessor.sparse.indices.bufferView]
+            accessor.sparse.values.bufferView = new_indices[accessor.sparse.values.bufferView]
+    model.bufferViews = buffer_views or None
+
+    model.buffers = []
+    for i, (parts, bytelength) in enumerate(zip(buffers_parts, buffers_bytelength)):
+        if bytelength == 0:
+            continue
+        uri = f"{name}.bin" if len(buffers_parts) == 1 else f"{name}_{i}.bin"
+        model.buffers.append(gl.Buffer(uri=uri, byteLength=bytelength))
+        resources.append(gl.FileResource(uri, data=b"".join(parts)))
+    model.buffers = model.buffers or None
+
+    gltf.resources = resources
+    return gltf
+
+
+def save_tree_to_gltf_file(
+    file_path: str,
+    root_node: "Asset",
+    gpu_instancing: bool = False,
+    embed_resources: bool = True,
+    max_buffer_size: Optional[int] = None,
+    quantize: bool = False,
+) -> List[str]:
     """
     Save the tree in a GLTF file + additional (binary) resource files if it should be the case.
     Return the list of all the path to the saved files (glTF file + resource files)
 
+    The format is inferred from the extension of the file:
+        - `.glb`: a single binary glTF file (streamed to the file, see `write_tree_to_glb`),
+        - `.gltf`: a JSON glTF file, with the buffers and images either embedded as base64 data URIs
+            (`embed_resources=True`) or saved next to the glTF file as `.bin` and image files (`embed_resources=False`).
+
     Args:
         file_path (`str`):
             The path to the file to save the scene to.
         root_node (`Asset`):
             The root node of the tree to export as glTF.
+        gpu_instancing (`bool`, *optional*, defaults to `False`):
+            Whether to export sibling instances of a same mesh with the `EXT_mesh_gpu_instancing` extension.
+        embed_resources (`bool`, *optional*, defaults to `True`):
+            For `.gltf` files, whether to embed the buffers and images in the JSON as base64 data URIs
+            or to save them in external files.
+        max_buffer_size (`int`, *optional*, defaults to `None`):
+            For `.gltf` files with external resources, the maximum size in bytes of each `.bin` buffer file.
+            By default, all the buffer data is saved in a single `.bin` file.
+        quantize (`bool`, *optional*, defaults to `False`):
+            Whether to quantize the meshes with the `KHR_mesh_quantization` extension (see `encode_mesh`).
 
     Returns:
         file_paths (`List[str]`):
             The list of all the path to the saved files (glTF file + resource files)
     """
-    gltf = tree_as_gltf(root_node=root_node)
-
-    # For now let's convert all in GLTF with embedded resources
-    for resource in gltf.resources:
-        gltf.convert_to_base64_resource(resource)
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in (".gltf", ".glb"):
+        raise ValueError(f"Unsupported file extension {extension}, the scene can be saved in .gltf or .glb files.")
+
+    gltf = tree_as_gltf(root_node=root_node, gpu_instancing=gpu_instancing, quantize=quantize)
+
+    if extension == ".glb":
+        gl.create_parent_dirs(file_path)
+        with open(file_path, "wb") as f:
+            # noinspection PyProtectedMember
+            gltf._write_glb_to_sink(f)
+        return [file_path]
+
+    if embed_resources:
+        for resource in gltf.resources:
+            gltf.convert_to_base64_resource(resource)
+    else:
+        split_gltf_resources(gltf, os.path.splitext(os.path.basename(file_path))[0], max_buffer_size=max_buffer_size)
 
     file_names = gltf.export_gltf(file_path)
     return file_names
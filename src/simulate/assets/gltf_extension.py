@@ -15,10 +15,12 @@
 # Lint as: python3
 """ Store a python dataclass as a glTF extension."""
 import copy
+import json
 from dataclasses import field, fields, is_dataclass, make_dataclass
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
+from dataclasses_json.core import _asdict, _ExtendedEncoder
 
 
 if TYPE_CHECKING:
@@ -36,6 +38,48 @@ GLTF_NODES_EXTENSION_CLASS = []
 # We use this to define all the component class in our scene which are defined as GLTF extensions
 GLTF_COMPONENTS_EXTENSION_CLASS = []
 
+# Names of the fields of each dataclass which can point to another asset ("Any" or "Optional[Any]" fields)
+_POINTER_FIELDS = {}
+
+
+def _get_pointer_fields(cls: type) -> Tuple[str, ...]:
+    """Get (and cache) the names of the fields of a dataclass with type "Any" or "Optional[Any]"."""
+    pointer_fields = _POINTER_FIELDS.get(cls)
+    if pointer_fields is None:
+        pointer_fields = tuple(f.name for f in fields(cls) if f.type == Any or f.type == Optional[Any])
+        _POINTER_FIELDS[cls] = pointer_fields
+    return pointer_fields
+
+
+def _collect_pointers(obj_dataclass, memo: Dict[int, Any]):
+    """
+    Map the assets pointed by the "Any" fields of a dataclass (and of its nested dataclasses) to their names.
+
+    Args:
+        obj_dataclass ():
+            The dataclass to explore.
+        memo (`Dict[int, Any]`):
+            A `copy.deepcopy` memo where the id of each pointed asset is mapped to the name of the asset.
+    """
+    pointer_fields = _get_pointer_fields(type(obj_dataclass))
+    for f in fields(obj_dataclass):
+        value = getattr(obj_dataclass, f.name)
+        if f.name in pointer_fields:
+            if not isinstance(value, str) and hasattr(value, "name"):
+                memo[id(value)] = value.name
+        elif is_dataclass(value):
+            _collect_pointers(value, memo)
+        elif isinstance(value, (list, tuple)) and len(value) and is_dataclass(value[0]):
+            for obj in value:
+                _collect_pointers(obj, memo)
+        elif isinstance(value, dict):
+            for val in value.values():
+                if is_dataclass(val):
+                    _collect_pointers(val, memo)
+                elif isinstance(val, (list, tuple)) and len(val) and is_dataclass(val[0]):
+                    for obj in val:
+                        _collect_pointers(obj, memo)
+
 
 class GltfExtensionMixin(DataClassJsonMixin):
     """
@@ -120,22 +164,62 @@ class GltfExtensionMixin(DataClassJsonMixin):
         else:
             raise ValueError(f"The object type {object_type} is not supported.")
 
-    def gltf_copy(self) -> "GltfExtensionMixin":
+    def gltf_fields(self, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get a deep copy of the dataclass fields of the object, as stored in a glTF file.
+
+        The pointers to other assets stored in the "Any" fields (also in nested dataclasses)
+        are replaced by the names of the assets, without modifying the object.
+
+        Args:
+            overrides (`Dict[str, Any]`, *optional*, defaults to `None`):
+                Values replacing some of the fields in the copy.
+
+        Returns:
+            fields (`Dict[str, Any]`):
+                The copied fields.
+        """
+        memo = {}
+        _collect_pointers(self, memo)
+        overrides = overrides or {}
+        return {
+            f.name: overrides[f.name] if f.name in overrides else copy.deepcopy(getattr(self, f.name), memo)
+            for f in fields(self)
+        }
+
+    def gltf_json(self, overrides: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Serialize the dataclass fields of the object (see `gltf_fields`) in JSON.
+
+        Args:
+            overrides (`Dict[str, Any]`, *optional*, defaults to `None`):
+                Values replacing some of the fields.
+
+        Returns:
+            json (`str`):
+                The JSON string.
+        """
+        return json.dumps(_asdict(self.gltf_fields(overrides), False), cls=_ExtendedEncoder)
+
+    def gltf_copy(self, overrides: Optional[Dict[str, Any]] = None) -> "GltfExtensionMixin":
         """
         Create a deep copy of the object with a deep copy of only the dataclass fields.
 
-        In several cases we are modifying this asset and want to create picklable copies
-        (e.g. at importation from GLTF or during the GLTF conversion to replace node pointers with string names).
+        In several cases we want to create picklable copies of the asset
+        (e.g. at importation from GLTF or during the GLTF conversion, with node pointers replaced by string names).
 
         We then want to deep copy only the fields of the dataclass, thus we don't
         use copy.deepcopy since some other properties (renderer, etc.) are not picklable.
 
+        Args:
+            overrides (`Dict[str, Any]`, *optional*, defaults to `None`):
+                Values replacing some of the fields in the copy.
+
         Returns:
             copy (`GltfExtensionMixin`):
                 A deep copy of the object with a deep copy of only the dataclass fields.
         """
-        self_dict = {f.name: copy.deepcopy(getattr(self, f.name)) for f in fields(self)}
-        copy_self = type(self)(**self_dict)
+        copy_self = type(self)(**self.gltf_fields(overrides))
         return copy_self
 
     def add_component_to_gltf_scene(self, gltf_model_extensions) -> str:
@@ -162,7 +246,7 @@ class GltfExtensionMixin(DataClassJsonMixin):
             raise ValueError(f"The glTF model extensions already has the {self._gltf_extension_name} extension.")
         return self._gltf_extension_name
 
-    def add_component_to_gltf_model(self, gltf_model_extensions) -> int:
+    def add_component_to_gltf_model(self, gltf_model_extensions, overrides: Optional[Dict[str, Any]] = None) -> int:
         """
         Add a component to a glTF model.
 
@@ -170,12 +254,14 @@ class GltfExtensionMixin(DataClassJsonMixin):
         Args:
             gltf_model_extensions ():
                 The glTF model extensions.
+            overrides (`Dict[str, Any]`, *optional*, defaults to `None`):
+                Values replacing some of the fields in the stored copy of the component.
 
         Returns:
             id (`int`):
                 The index of the component in the glTF model extensions.
         """
-        copy_self = self.gltf_copy()  # Create a deep copy of the object keeping only the fields
+        copy_self = self.gltf_copy(overrides)  # Create a deep copy of the object keeping only the fields
 
         if getattr(gltf_model_extensions, self._gltf_extension_name, None) is None:
             objects = [copy_self]
@@ -214,7 +300,9 @@ class GltfExtensionMixin(DataClassJsonMixin):
         return self._gltf_extension_name
 
 
-def _process_dataclass_after(obj_dataclass, node: "Asset", object_name: Optional[str] = None):
+def _process_dataclass_after(
+    obj_dataclass, node: "Asset", nodes_by_name: Dict[str, "Asset"], object_name: Optional[str] = None
+):
     """
     Process the dataclass after the deserialization.
 
@@ -224,21 +312,23 @@ def _process_dataclass_after(obj_dataclass, node: "Asset", object_name: Optional
             The dataclass to process.
         node (`Asset`):
             The node to which the dataclass belongs.
+        nodes_by_name (`Dict[str, Asset]`):
+            The nodes of the tree indexed by name.
         object_name (`str`, *optional*, defaults to `None`):
             The name of the object.
     """
+    pointer_fields = _get_pointer_fields(type(obj_dataclass))
     for f in fields(obj_dataclass):
         value = getattr(obj_dataclass, f.name)
-        type_ = f.type
         # If the attribute of the component has the right type:
         # "Any" or "Optional[Any]" with a name attribute in the pointed object
         # Then we assume it's a node in the tree + we replace a name of a pointed node by a direct pointer to the node
         # We check the named node exist for safety
         # Note that this only investigate the fields of the dataclass
         # and thus not the "children" or "parent" attribute of an Asset, thus keeping the tree in good shape
-        if type_ == Any or type_ == Optional[Any]:
+        if f.name in pointer_fields:
             if isinstance(value, str):
-                node_pointer = node.get_node(value)
+                node_pointer = nodes_by_name.get(value)
                 if node_pointer is None:
                     raise ValueError(
                         f"The field {f.name} '{'of component' + object_name if object_name is not None else ''}'"
@@ -251,20 +341,20 @@ def _process_dataclass_after(obj_dataclass, node: "Asset", object_name: Optional
                 setattr(obj_dataclass, f.name, node_pointer)  # We convert it in the node pointer
         # Recursively explore child and nested dataclasses
         elif is_dataclass(value):
-            _process_dataclass_after(value, node, object_name)
+            _process_dataclass_after(value, node, nodes_by_name, object_name)
         elif isinstance(value, (list, tuple)) and len(value) and is_dataclass(value[0]):
             for obj in value:
-                _process_dataclass_after(obj, node, object_name)
+                _process_dataclass_after(obj, node, nodes_by_name, object_name)
         elif isinstance(value, dict):
             for key, val in value.items():
                 if is_dataclass(val):
-                    _process_dataclass_after(val, node, object_name)
+                    _process_dataclass_after(val, node, nodes_by_name, object_name)
                 elif isinstance(val, (list, tuple)) and len(val) and is_dataclass(val[0]):
                     for obj in val:
-                        _process_dataclass_after(obj, node, object_name)
+                        _process_dataclass_after(obj, node, nodes_by_name, object_name)
 
 
-def process_tree_after_gltf(node: Union["Asset", List]):
+def process_tree_after_gltf(node: Union["Asset", List], nodes_by_name: Optional[Dict[str, "Asset"]] = None):
     """
     Set up the attributes of each component of the asset which refers to assets.
     Sometime components referred to assets by names (when loading from a glTF file).
@@ -273,88 +363,22 @@ def process_tree_after_gltf(node: Union["Asset", List]):
     Args:
         node (`Asset` or `list`):
             The node to process.
+        nodes_by_name (`Dict[str, Asset]`, *optional*, defaults to `None`):
+            The nodes of the whole tree indexed by name. Computed from the root of the tree if not provided.
     """
-    if node.__class__ in GLTF_NODES_EXTENSION_CLASS:
-        _process_dataclass_after(node, node, None)
-
-    for component_name, component in node.named_components:
-        if component.__class__ in GLTF_COMPONENTS_EXTENSION_CLASS:
-            _process_dataclass_after(component, node, component_name)
-
-    # Recursively through the tree
-    for child in node.tree_children:
-        process_tree_after_gltf(child)
-
-
-def _process_dataclass_before(obj_dataclass, node: "Asset", object_name: Optional[str] = None):
-    """
-    Process the dataclass before the serialization.
-
-    Args:
-        obj_dataclass ():
-            The dataclass to process.
-        node (`Asset`):
-            The node to which the dataclass belongs.
-        object_name (`str`, *optional*, defaults to `None`):
-            The name of the object.
-    """
-    for f in fields(obj_dataclass):
-        value = getattr(obj_dataclass, f.name)
-        type_ = f.type
-        # If the attribute of the component has the right type:
-        # "Any" or "Optional[Any]" with a name attribute in the pointed object
-        # Then we assume it's a node in the tree + we replace a pointer with a name of the node
-        # We check the named node exist for safety
-        # Note that this only investigate the fields of the dataclass
-        # and thus not the "children" or "parent" attribute of an Asset, thus keeping the tree in good shape
-        if type_ == Any or type_ == Optional[Any]:
-            if isinstance(value, str):
-                node_pointer = node.get_node(value)
-                if node_pointer is None:
-                    raise ValueError(
-                        f"The field {f.name} '{'of component' + object_name if object_name is not None else ''}' "
-                        f"of node '{node.name}' has type 'Any' "
-                        f"point to a second asset called '{value}' but this second asset cannot be found "
-                        f"in the asset tree. Please check the name of the second asset is correct "
-                        f"and the second asset is present in the scene "
-                        f"or change the type of the component to be a string."
-                    )
-            # And is the value of the attribute is currently a node
-            if not isinstance(value, str) and hasattr(value, "name"):
-                setattr(obj_dataclass, f.name, value.name)  # We convert it in the node name
-        # Recursively explore child and nested dataclasses
-        elif is_dataclass(value):
-            _process_dataclass_before(value, node, object_name)
-        elif isinstance(value, (list, tuple)) and len(value) and is_dataclass(value[0]):
-            for obj in value:
-                _process_dataclass_before(obj, node, object_name)
-        elif isinstance(value, dict):
-            for key, val in value.items():
-                if is_dataclass(val):
-                    _process_dataclass_before(val, node, object_name)
-                elif isinstance(val, (list, tuple)) and len(val) and is_dataclass(val[0]):
-                    for obj in val:
-                        _process_dataclass_before(obj, node, object_name)
-
-
-def process_tree_before_gltf(node: "Asset"):
-    """
-    Set up the attributes of each GLTFExtension tree/components of the asset which refers to assets.
-    Sometime components referred to assets by names (when loading from a glTF file)
-    We convert them to string of the names of the assets (which are unique)
-
-    Args:
-        node (`Asset`):
-            The node to process.
-    """
+    if nodes_by_name is None:
+        root = node.tree_root
+        nodes_by_name = {}
+        for tree_node in root.tree_descendants + (root,):
+            nodes_by_name.setdefault(tree_node.name, tree_node)  # Same precedence as `get_node`
 
     if node.__class__ in GLTF_NODES_EXTENSION_CLASS:
-        _process_dataclass_before(node, node, None)
+        _process_dataclass_after(node, node, nodes_by_name, None)
 
     for component_name, component in node.named_components:
         if component.__class__ in GLTF_COMPONENTS_EXTENSION_CLASS:
-            _process_dataclass_before(component, node, component_name)
+            _process_dataclass_after(component, node, nodes_by_name, component_name)
 
     # Recursively through the tree
     for child in node.tree_children:
-        process_tree_before_gltf(child)
+        process_tree_after_gltf(child, nodes_by_name)
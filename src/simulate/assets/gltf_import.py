@@ -14,10 +14,11 @@
 
 # Lint as: python3
 """ Load a GLTF file in a Scene."""
+import functools
 import io
 import os
-import tempfile
-from typing import ByteString, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import ByteString, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import PIL.Image
@@ -25,12 +26,16 @@ import pyvista as pv
 from huggingface_hub import hf_hub_download
 
 from . import Asset, Camera, Light, Material, Object3D
+from .asset_cache import AssetCache
 from .gltf_extension import GLTF_EXTENSIONS_REGISTER, GLTF_NODES_EXTENSION_CLASS, process_tree_after_gltf
-from .gltflib import GLTF, Base64Resource, FileResource, TextureInfo
-from .gltflib.enums import AccessorType, ComponentType
+from .gltflib import GLTF, FileResource, Primitive, TextureInfo
+from .gltflib.enums import AccessorType, ComponentType, PrimitiveMode
+from .utils import LazyLoader
 
 
 UNSUPPORTED_REQUIRED_EXTENSIONS = ["KHR_draco_mesh_compression"]
+# Vertex attributes that we don't decode from the accessors, the meshes using them are read with the VTK reader
+NUMPY_UNSUPPORTED_ATTRIBUTES = ["TANGENT", "TEXCOORD_1", "COLOR_0", "JOINTS_0", "WEIGHTS_0"]
 
 
 # TODO remove this GLTFReader once the new version of pyvista is released 0.34+ (included in it)
@@ -69,9 +74,9 @@ gltf_to_numpy_shapes_mapping = {
 
 
 # A couple of data extraction methods
-def get_buffer_as_bytes(gltf_scene: GLTF, buffer_view_id: int) -> ByteString:
+def get_buffer_as_bytes(gltf_scene: GLTF, buffer_view_id: int) -> memoryview:
     """
-    Get a `ByteString` of the data stored in a GLTF buffer view.
+    Get a read-only view of the data stored in a GLTF buffer view (without copying the buffer).
 
     Args:
         gltf_scene (`gltflib.GLTF`):
@@ -80,7 +85,7 @@ def get_buffer_as_bytes(gltf_scene: GLTF, buffer_view_id: int) -> ByteString:
             The id of the buffer view to extract.
 
     Returns:
-        data (`ByteString`):
+        data (`memoryview`):
             The data stored in the buffer view.
     """
     gltf_model = gltf_scene.model
@@ -93,7 +98,7 @@ def get_buffer_as_bytes(gltf_scene: GLTF, buffer_view_id: int) -> ByteString:
 
     byte_offset = buffer_view.byteOffset
     length = buffer_view.byteLength
-    data = resource.data[byte_offset : byte_offset + length]
+    data = memoryview(resource.data)[byte_offset : byte_offset + length].toreadonly()
 
     return data
 
@@ -148,18 +153,202 @@ def get_accessor_as_numpy(gltf_scene: GLTF, accessor_id: int) -> np.ndarray:
     dtype: np.dtype = gltf_to_numpy_dtypes_mapping[accessor.componentType]
     item_shape = gltf_to_numpy_shapes_mapping[accessor.type]
     total_shape = np.append(accessor.count, item_shape)
-    total_size = np.abs(np.product(total_shape))
+    total_size = np.abs(np.prod(total_shape))
 
     if accessor.sparse is not None:
         raise NotImplementedError
     else:
         data = get_buffer_as_bytes(gltf_scene=gltf_scene, buffer_view_id=accessor.bufferView)
-        array = np.frombuffer(buffer=data, offset=accessor.byteOffset, count=total_size, dtype=dtype)
+        byte_stride = gltf_model.bufferViews[accessor.bufferView].byteStride
+        item_size = int(np.prod(item_shape)) * dtype.itemsize
+        if byte_stride is not None and byte_stride != item_size:
+            # Interleaved or padded vertex attributes (e.g. quantized VEC3 padded to 4 bytes)
+            array = np.ndarray(
+                shape=(accessor.count, int(np.prod(item_shape))),
+                dtype=dtype,
+                buffer=data,
+                offset=accessor.byteOffset or 0,
+                strides=(byte_stride, dtype.itemsize),
+            )
+        else:
+            array = np.frombuffer(buffer=data, offset=accessor.byteOffset or 0, count=total_size, dtype=dtype)
         array = array.reshape(total_shape)
 
     return array
 
 
+def get_attribute_as_numpy(gltf_scene: GLTF, accessor_id: int) -> np.ndarray:
+    """
+    Get a float32 numpy array of the vertex attribute stored in a GLTF accessor,
+    converting normalized integers (e.g. quantized attributes of `KHR_mesh_quantization`) to floats.
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        accessor_id (`int`):
+            The id of the accessor to extract.
+
+    Returns:
+        data (`np.ndarray`):
+            The float32 data stored in the accessor.
+    """
+    array = get_accessor_as_numpy(gltf_scene, accessor_id)
+    if array.dtype.kind == "f":
+        return array.astype(np.float32)
+    if not gltf_scene.model.accessors[accessor_id].normalized:
+        return array.astype(np.float32)
+    max_value = np.iinfo(array.dtype).max
+    # Per the glTF specification, signed normalized values are clamped to -1
+    return np.maximum(array.astype(np.float32) / max_value, -1.0)
+
+
+def check_primitive_support(gltf_scene: GLTF, primitive: Primitive):
+    """
+    Check that a GLTF mesh primitive can be decoded from the accessors by `get_primitive_as_pyvista`
+    (without reading its data). Raise a `NotImplementedError` for the features only decoded by the VTK reader
+    (other vertex attributes, morph targets, sparse accessors, strips and fans).
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        primitive (`gltflib.Primitive`):
+            The primitive to check.
+    """
+    attributes = primitive.attributes
+    unsupported_attributes = [
+        name for name in NUMPY_UNSUPPORTED_ATTRIBUTES if getattr(attributes, name, None) is not None
+    ]
+    if unsupported_attributes or primitive.targets:
+        raise NotImplementedError(f"Primitive attributes {unsupported_attributes or ['targets']} are not supported.")
+
+    mode = primitive.mode if primitive.mode is not None else PrimitiveMode.TRIANGLES.value
+    if mode not in (PrimitiveMode.TRIANGLES.value, PrimitiveMode.LINES.value, PrimitiveMode.POINTS.value):
+        raise NotImplementedError(f"Primitive mode {mode} is not supported.")
+
+    accessor_ids = [primitive.indices, attributes.POSITION, attributes.NORMAL, attributes.TEXCOORD_0]
+    for accessor_id in accessor_ids:
+        if accessor_id is not None and gltf_scene.model.accessors[accessor_id].sparse is not None:
+            raise NotImplementedError("Sparse accessors are not supported.")
+
+
+def get_primitive_as_pyvista(gltf_scene: GLTF, primitive: Primitive) -> pv.PolyData:
+    """
+    Decode a GLTF mesh primitive in a pyvista mesh directly from the accessors.
+    Raise a `NotImplementedError` for the features only decoded by the VTK reader (see `check_primitive_support`).
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        primitive (`gltflib.Primitive`):
+            The primitive to decode.
+
+    Returns:
+        mesh (`pyvista.PolyData`):
+            The mesh with the `NORMAL` and `TEXCOORD_0` point arrays, like the meshes read by `GLTFReader`.
+    """
+    check_primitive_support(gltf_scene, primitive)
+    attributes = primitive.attributes
+    points = get_attribute_as_numpy(gltf_scene, attributes.POSITION)
+    if primitive.indices is not None:
+        indices = get_accessor_as_numpy(gltf_scene, primitive.indices).reshape(-1).astype(np.int64)
+    else:
+        indices = np.arange(len(points), dtype=np.int64)
+
+    mode = primitive.mode if primitive.mode is not None else PrimitiveMode.TRIANGLES.value
+    mesh = pv.PolyData()  # Not built from the points to avoid creating a vertex cell per point
+    mesh.points = points
+    if mode == PrimitiveMode.TRIANGLES.value:
+        cells = np.hstack([np.full((len(indices) // 3, 1), 3), indices.reshape(-1, 3)])
+        mesh.faces = cells.reshape(-1)
+    elif mode == PrimitiveMode.LINES.value:
+        cells = np.hstack([np.full((len(indices) // 2, 1), 2), indices.reshape(-1, 2)])
+        mesh.lines = cells.reshape(-1)
+    else:
+        mesh.verts = np.hstack([np.ones((len(indices), 1), dtype=np.int64), indices[:, None]]).reshape(-1)
+
+    if attributes.NORMAL is not None:
+        mesh.point_data.set_array(get_attribute_as_numpy(gltf_scene, attributes.NORMAL), "NORMAL")
+        mesh.GetPointData().SetActiveNormals("NORMAL")
+    if attributes.TEXCOORD_0 is not None:
+        mesh.point_data.set_array(get_attribute_as_numpy(gltf_scene, attributes.TEXCOORD_0), "TEXCOORD_0")
+        mesh.GetPointData().SetActiveTCoords("TEXCOORD_0")
+    return mesh
+
+
+def get_mesh_as_pyvista(gltf_scene: GLTF, mesh_id: int) -> pv.MultiBlock:
+    """
+    Decode a GLTF mesh directly from the accessors.
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        mesh_id (`int`):
+            The id of the mesh to decode.
+
+    Returns:
+        mesh (`pyvista.MultiBlock`):
+            The mesh with one block per primitive.
+    """
+    primitives = gltf_scene.model.meshes[mesh_id].primitives
+    return pv.MultiBlock([get_primitive_as_pyvista(gltf_scene, primitive) for primitive in primitives])
+
+
+def read_pyvista_meshes(gltf_scene: GLTF) -> Dict:
+    """
+    Decode the meshes of a GLTF scene from the accessors, with the same layout as the output of `GLTFReader`:
+    a `Node_{id}` entry per node containing the entries of its children and a `Mesh_{id}` `pyvista.MultiBlock`
+    with one block per primitive of its mesh.
+
+    This avoids parsing the file a second time with the VTK reader and also decodes the meshes that the VTK reader
+    can't load (e.g. quantized meshes of `KHR_mesh_quantization`).
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+
+    Returns:
+        meshes (`Dict`):
+            The nested dictionaries of meshes of the nodes.
+    """
+    gltf_model = gltf_scene.model
+
+    def node_meshes(node_id: int) -> Dict:
+        gltf_node = gltf_model.nodes[node_id]
+        meshes = {f"Node_{child_id}": node_meshes(child_id) for child_id in gltf_node.children or []}
+        if gltf_node.mesh is not None:
+            # Each node gets its own copy of the mesh, like with the VTK reader
+            meshes[f"Mesh_{gltf_node.mesh}"] = get_mesh_as_pyvista(gltf_scene, gltf_node.mesh)
+        return meshes
+
+    gltf_main_scene = gltf_model.scenes[gltf_model.scene if gltf_model.scene else 0]
+    return {f"Node_{node_id}": node_meshes(node_id) for node_id in gltf_main_scene.nodes}
+
+
+def dequantize_pyvista_mesh(
+    mesh: pv.MultiBlock, translation: Optional[List[float]], scale: Optional[List[float]]
+) -> pv.MultiBlock:
+    """
+    Apply the dequantization transform of a quantized mesh (`KHR_mesh_quantization`) to its positions.
+
+    Args:
+        mesh (`pyvista.MultiBlock`):
+            The primitives of the mesh, modified in place.
+        translation (`List[float]`):
+            The translation of the dequantization transform.
+        scale (`List[float]`):
+            The scale of the dequantization transform.
+
+    Returns:
+        mesh (`pyvista.MultiBlock`):
+            The dequantized mesh.
+    """
+    translation = np.zeros(3) if translation is None else np.array(translation)
+    scale = np.ones(3) if scale is None else np.array(scale)
+    for block in mesh:
+        block.points = block.points * scale + translation
+    return mesh
+
+
 def get_texture_as_pillow(gltf_scene: GLTF, texture_info: Optional[TextureInfo]) -> Optional[PIL.Image.Image]:
     """
     Get a Pillow image of the data stored in a GLTF texture.
@@ -197,7 +386,49 @@ def get_texture_as_pillow(gltf_scene: GLTF, texture_info: Optional[TextureInfo])
     return image
 
 
-def get_texture_as_pyvista(gltf_scene: GLTF, texture_info: Optional[TextureInfo]) -> Optional[pv.Texture]:
+def get_image_as_numpy(gltf_scene: GLTF, image_id: int) -> np.ndarray:
+    """
+    Decode a GLTF image in a numpy array.
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        image_id (`int`):
+            The id of the image to decode.
+
+    Returns:
+        image (`np.ndarray`):
+            The decoded image, of shape (height, width) or (height, width, channels).
+    """
+    image = PIL.Image.open(io.BytesIO(get_image_as_bytes(gltf_scene=gltf_scene, image_id=image_id)))
+    if image.mode not in ("L", "LA", "RGB", "RGBA"):
+        # Palette and high bit depth images are expanded to 8 bits channels
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode.endswith("A") else "RGB")
+    return np.array(image)
+
+
+def decode_images(gltf_scene: GLTF, max_workers: Optional[int] = None) -> Dict[int, np.ndarray]:
+    """
+    Decode all the images used by the textures of a GLTF scene, in parallel.
+
+    Args:
+        gltf_scene (`gltflib.GLTF`):
+            The GLTF scene.
+        max_workers (`int`, *optional*, defaults to `None`):
+            The maximum number of threads used to decode the images (defaults to the number of CPUs).
+
+    Returns:
+        images (`Dict[int, np.ndarray]`):
+            The decoded images indexed by image id.
+    """
+    image_ids = sorted({texture.source for texture in gltf_scene.model.textures or [] if texture.source is not None})
+    images = thread_map(functools.partial(get_image_as_numpy, gltf_scene), image_ids, max_workers=max_workers)
+    return dict(zip(image_ids, images))
+
+
+def get_texture_as_pyvista(
+    gltf_scene: GLTF, texture_info: Optional[TextureInfo], images: Optional[Dict[int, np.ndarray]] = None
+) -> Optional[pv.Texture]:
     """
     Get a PyVista texture of the data stored in a GLTF texture.
 
@@ -206,6 +437,8 @@ def get_texture_as_pyvista(gltf_scene: GLTF, texture_info: Optional[TextureInfo]
             The GLTF scene.
         texture_info (`gltflib.TextureInfo`):
             The texture info to extract.
+        images (`Dict[int, np.ndarray]`, *optional*, defaults to `None`):
+            The images already decoded with `decode_images`. The other images are decoded here.
 
     Returns:
         texture (`pyvista.Texture`):
@@ -214,39 +447,49 @@ def get_texture_as_pyvista(gltf_scene: GLTF, texture_info: Optional[TextureInfo]
     if texture_info is None:
         return None
 
-    gltf_textures = gltf_scene.model.textures
-    gltf_images = gltf_scene.model.images
-    # gltf_samplers = gltf_scene.model.samplers
+    image_id = gltf_scene.model.textures[texture_info.index].source
+    if images is not None and image_id in images:
+        image = images[image_id]
+    else:
+        image = get_image_as_numpy(gltf_scene, image_id)
 
-    gltf_texture = gltf_textures[texture_info.index]
-    gltf_image = gltf_images[gltf_texture.source]
+    # Each material gets its own texture, like when they are read from the file one by one
+    return pv.numpy_to_texture(image)
 
-    if gltf_image.bufferView is not None:
-        # Temporarily store the image for loading with vtk
-        buffer_bytes = get_buffer_as_bytes(gltf_scene=gltf_scene, buffer_view_id=gltf_image.bufferView)
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            filename = gltf_image.mimeType.replace("/", ".")  # Will convert mimeType 'image/png' in 'image.png'
-            filepath = os.path.join(tmpdirname, filename)
-            with open(filepath, "wb") as file:
-                file.write(bytearray(buffer_bytes))
-            texture = pv.read_texture(filepath)
-    else:
-        resource = gltf_scene.get_resource(gltf_image.uri)
-        if isinstance(resource, Base64Resource):
-            image = PIL.Image.open(io.BytesIO(resource.data))
-            texture = pv.numpy_to_texture(np.array(image))
-        else:
-            texture = pv.read_texture(resource.fullpath)
 
-    return texture
+def thread_map(function: Callable, items: List, max_workers: Optional[int] = None) -> List:
+    """
+    Apply a function to a list of items in a bounded thread pool and return the results in order.
+
+    Args:
+        function (`Callable`):
+            The function to apply.
+        items (`List`):
+            The items to apply the function to.
+        max_workers (`int`, *optional*, defaults to `None`):
+            The maximum number of threads (defaults to the number of CPUs). Use `1` to run serially.
+
+    Returns:
+        results (`List`):
+            The results of the function for each item.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(items))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(function, items))
+    return [function(item) for item in items]
 
 
 # Build a tree of simulate nodes from a GLTF object
 def build_node_tree(
     gltf_scene: GLTF,
-    pyvista_meshes: Union[np.ndarray, pv.MultiBlock],
+    pyvista_meshes: Optional[Union[Dict, pv.MultiBlock]],
     gltf_node_id: int,
     parent: Optional["Asset"] = None,
+    lazy: bool = False,
+    images: Optional[Dict[int, np.ndarray]] = None,
 ) -> List:
     """
     Build the node tree of simulate objects from the GLTF scene.
@@ -254,12 +497,16 @@ def build_node_tree(
     Args:
         gltf_scene (`gltflib.GLTF`):
             The GLTF scene.
-        pyvista_meshes (`pyvista.MultiBlock`):
-            The pyvista meshes of the GLTF scene.
+        pyvista_meshes (`pyvista.MultiBlock` or `Dict`):
+            The pyvista meshes of the GLTF scene. If `None`, the meshes are decoded from the accessors.
         gltf_node_id (`int`):
             The id of the GLTF node to build the tree from.
         parent (`simulate.Asset`):
             The parent of the node to build the tree from.
+        lazy (`bool`, *optional*, defaults to `False`):
+            Whether to give the meshes and textures to the objects as `LazyLoader` loading them on first access.
+        images (`Dict[int, np.ndarray]`, *optional*, defaults to `None`):
+            The images of the GLTF scene already decoded with `decode_images`.
 
     Returns:
         nodes (`List[Asset]`):
@@ -298,6 +545,40 @@ def build_node_tree(
                 else:
                     common_kwargs[component_name] = component  # component
 
+    # Quantized meshes (KHR_mesh_quantization) are stored in a child node holding the dequantization transform
+    gltf_mesh_id = gltf_node.mesh
+    gltf_children_ids = list(gltf_node.children or [])
+    mesh_node_meshes = pyvista_meshes
+    dequantization = None
+    for child_id in gltf_children_ids:
+        gltf_child = gltf_model.nodes[child_id]
+        if (
+            isinstance(gltf_child.extras, dict)
+            and gltf_child.extras.get("dequantization")
+            and gltf_child.mesh is not None
+        ):
+            gltf_children_ids.remove(child_id)
+            gltf_mesh_id = gltf_child.mesh
+            dequantization = (gltf_child.translation, gltf_child.scale)
+            if pyvista_meshes is not None:
+                mesh_node_meshes = pyvista_meshes[f"Node_{child_id}"]
+            break
+
+    def load_mesh() -> Union[pv.PolyData, pv.MultiBlock]:
+        if mesh_node_meshes is not None:
+            mesh_blocks = mesh_node_meshes[f"Mesh_{gltf_mesh_id}"]
+        else:
+            mesh_blocks = get_mesh_as_pyvista(gltf_scene, gltf_mesh_id)
+        if dequantization is not None:
+            mesh_blocks = dequantize_pyvista_mesh(mesh_blocks, *dequantization)
+        # A pv.PolyData for a single primitive, else a pv.MultiBlock
+        return mesh_blocks[0] if len(gltf_model.meshes[gltf_mesh_id].primitives) == 1 else mesh_blocks
+
+    def load_texture(texture_info: Optional[TextureInfo]) -> Optional[Union[pv.Texture, LazyLoader]]:
+        if lazy and texture_info is not None:
+            return LazyLoader(functools.partial(get_texture_as_pyvista, gltf_scene, texture_info))
+        return get_texture_as_pyvista(gltf_scene, texture_info, images=images)
+
     # Add material to collider
     gltf_collider = None
     if gltf_node.extensions is not None and gltf_node.extensions.HF_colliders is not None:
@@ -362,18 +643,17 @@ def build_node_tree(
                 f"please check that the file is conform with the KHR_lights_punctual specifications"
             )
     # Is it an Object3D
-    elif gltf_node.mesh is not None:
+    elif gltf_mesh_id is not None:
         # Let's add a mesh
-        gltf_mesh = gltf_model.meshes[gltf_node.mesh]
+        gltf_mesh = gltf_model.meshes[gltf_mesh_id]
         primitives = gltf_mesh.primitives
         common_kwargs["with_rigid_body"] = False
         common_kwargs["with_articulation_body"] = False
-        if len(primitives) > 1:
-            mesh = pyvista_meshes[f"Mesh_{gltf_node.mesh}"]  # A pv.MultiBlock
+        # The meshes of the colliders and the meshes already read by the VTK reader are loaded right away
+        if lazy and gltf_collider is None and pyvista_meshes is None:
+            common_kwargs["mesh"] = LazyLoader(load_mesh)
         else:
-            mesh = pyvista_meshes[f"Mesh_{gltf_node.mesh}"][0]  # A pv.PolyData
-
-        common_kwargs["mesh"] = mesh
+            common_kwargs["mesh"] = load_mesh()
 
         if gltf_collider is None:
             material_ids = [p.material for p in primitives]
@@ -387,15 +667,13 @@ def build_node_tree(
                         Material(
                             name=mat.name,
                             base_color=pbr.baseColorFactor,
-                            base_color_texture=get_texture_as_pyvista(gltf_scene, pbr.baseColorTexture),
+                            base_color_texture=load_texture(pbr.baseColorTexture),
                             metallic_factor=pbr.metallicFactor,
-                            metallic_roughness_texture=get_texture_as_pyvista(
-                                gltf_scene, pbr.metallicRoughnessTexture
-                            ),
-                            normal_texture=get_texture_as_pyvista(gltf_scene, mat.normalTexture),
-                            occlusion_texture=get_texture_as_pyvista(gltf_scene, mat.occlusionTexture),
+                            metallic_roughness_texture=load_texture(pbr.metallicRoughnessTexture),
+                            normal_texture=load_texture(mat.normalTexture),
+                            occlusion_texture=load_texture(mat.occlusionTexture),
                             emissive_factor=mat.emissiveFactor,
-                            emissive_texture=get_texture_as_pyvista(gltf_scene, mat.emissiveTexture),
+                            emissive_texture=load_texture(mat.emissiveTexture),
                             alpha_mode=mat.alphaMode,
                             alpha_cutoff=mat.alphaCutoff,
                         )
@@ -415,6 +693,25 @@ def build_node_tree(
                 if key == "children":
                     key = "tree_children"
                 setattr(scene_node, key, value)
+        elif gltf_node.extensions is not None and gltf_node.extensions.EXT_mesh_gpu_instancing is not None:
+            # GPU instanced mesh: one Object3D per instance sharing the mesh and material, grouped under the node
+            instancing_attributes = gltf_node.extensions.EXT_mesh_gpu_instancing.attributes
+            template = Object3D(
+                mesh=common_kwargs.pop("mesh"),
+                material=common_kwargs.pop("material"),
+                with_rigid_body=common_kwargs.pop("with_rigid_body"),
+                with_articulation_body=common_kwargs.pop("with_articulation_body"),
+            )
+            scene_node = Asset(**common_kwargs)
+            # All the attributes are optional, the missing ones default to the identity transform
+            positions, rotations, scalings = (
+                get_accessor_as_numpy(gltf_scene, instancing_attributes[key]) if key in instancing_attributes else None
+                for key in ("TRANSLATION", "ROTATION", "SCALE")
+            )
+            instances = scene_node.instantiate(template, positions=positions, rotations=rotations, scalings=scalings)
+            if isinstance(gltf_node.extras, dict) and "instance_names" in gltf_node.extras:
+                for instance, instance_name in zip(instances, gltf_node.extras["instance_names"]):
+                    instance.name = instance_name
         else:
             scene_node = Object3D(**common_kwargs)
     else:
@@ -441,13 +738,15 @@ def build_node_tree(
             scene_node.is_actor = gltf_node.extras["is_actor"]
 
     # Recursively build the node tree
-    if gltf_node.children:
-        for child_id in gltf_node.children:
+    if gltf_children_ids:
+        for child_id in gltf_children_ids:
             _ = build_node_tree(
                 gltf_scene=gltf_scene,
-                pyvista_meshes=pyvista_meshes[f"Node_{child_id}"],
+                pyvista_meshes=pyvista_meshes[f"Node_{child_id}"] if pyvista_meshes is not None else None,
                 gltf_node_id=child_id,
                 parent=scene_node,
+                lazy=lazy,
+                images=images,
             )
 
     return scene_node
@@ -459,12 +758,23 @@ def load_gltf_as_tree(
     repo_id: Optional[str] = None,
     subfolder: Optional[str] = None,
     revision: Optional[str] = None,
+    repo_type: Optional[str] = None,
+    lazy: bool = False,
+    asset_cache: Optional[AssetCache] = None,
+    max_workers: Optional[int] = None,
 ) -> Union[List[List], List["Asset"]]:
     """
     Loading function to create a tree of asset nodes from a GLTF file.
     Return a list of the main nodes in the GLTF files (often only one main node).
     The tree can be walked from the main nodes.
 
+    In lazy mode, only the node tree (names, transforms, extensions, materials factors) is built:
+    the meshes of the objects and the textures of their materials are decoded on first access
+    (or all at once with `prefetch()`). The GLTF file stays memory-mapped as long as some of them are not loaded.
+
+    With an asset cache, the local paths of the resources downloaded from the hub are recorded in the cache
+    and the (non lazy) tree is loaded from a snapshot when the file and its resources didn't change since the last load.
+
     Args:
         file_path (`str`):
             Path to the GLTF file
@@ -479,33 +789,70 @@ def load_gltf_as_tree(
         revision (`str`, *optional*, defaults to `None`):
             The revision of the repo to load the file from.
             If `None`, the file will be loaded from the latest revision of the repo.
+        repo_type (`str`, *optional*, defaults to `None`):
+            The type of the repo to load the resources from (`space` or `dataset`). Defaults to `space`.
+        lazy (`bool`, *optional*, defaults to `False`):
+            Whether to load the meshes and textures on first access.
+        asset_cache (`AssetCache`, *optional*, defaults to `None`):
+            The local cache to use for the resources and the snapshot of the tree.
+        max_workers (`int`, *optional*, defaults to `None`):
+            The maximum number of threads used to download the resources and decode the images
+            (defaults to the number of CPUs). Use `1` to load serially.
 
     Returns:
         nodes (`List[Asset`):
             The list of the main nodes in the GLTF files.
     """
-    gltf_scene = GLTF.load(file_path)  # We load the other nodes (camera, lights, our extensions) ourselves
+    if asset_cache is not None and not lazy:
+        main_nodes = asset_cache.load_snapshot(file_path)
+        if main_nodes is not None:
+            return main_nodes
 
-    # Let's download all the other needed resources
+    # We load the other nodes (camera, lights, our extensions) ourselves.
+    # The binary buffers are memory-mapped: the accessors are views over the file and only the pages we decode are read.
+    gltf_scene = GLTF.load(file_path, use_mmap=True)
+
+    # Let's download all the other needed resources, concurrently
     if repo_id is not None:
+        repo_type = repo_type if repo_type is not None else "space"
+        file_resources = [resource for resource in gltf_scene.resources if isinstance(resource, FileResource)]
+
+        local_files = {}
+        if asset_cache is not None:
+            for resource in file_resources:
+                resolved = asset_cache.get_resolved_path(repo_id, resource.filename, subfolder, revision)
+                if resolved is not None:
+                    local_files[resource.filename] = resolved[0]
+
+        filenames_to_download = [
+            resource.filename for resource in file_resources if resource.filename not in local_files
+        ]
+        download = functools.partial(
+            hf_hub_download, repo_id=repo_id, subfolder=subfolder, revision=revision, repo_type=repo_type
+        )
+        downloaded_files = thread_map(
+            lambda filename: download(filename=filename), filenames_to_download, max_workers=max_workers
+        )
+        for filename, local_file in zip(filenames_to_download, downloaded_files):
+            local_files[filename] = local_file
+            if asset_cache is not None:
+                asset_cache.set_resolved_path(
+                    repo_id, filename, local_file, repo_type, subfolder=subfolder, revision=revision
+                )
+
         updated_resources = []
         for resource in gltf_scene.resources:
             if isinstance(resource, FileResource):
-                local_file = hf_hub_download(
-                    repo_id=repo_id,
-                    filename=resource.filename,
-                    subfolder=subfolder,
-                    revision=revision,
-                    repo_type="space",
-                )
-                basepath, basename = os.path.split(local_file)
+                basepath, basename = os.path.split(local_files[resource.filename])
                 former_file_name_and_uri = resource.filename
                 former_basename = os.path.basename(former_file_name_and_uri)
                 if former_basename != basename:
                     raise ValueError(f"Hub file {basename} not matching expected resource filename {former_basename}")
                 # We need to keep former_file_name_and_uri in the resource
                 # because it's the uri used everywhere in the glTF file
-                new_resource = FileResource(former_file_name_and_uri, basepath=basepath, mimetype=resource.mimetype)
+                new_resource = FileResource(
+                    former_file_name_and_uri, basepath=basepath, mimetype=resource.mimetype, use_mmap=True
+                )
                 updated_resources.append(new_resource)
             else:
                 updated_resources.append(resource)
@@ -524,11 +871,25 @@ def load_gltf_as_tree(
                     f"is required to load this scene but is not currently supported."
                 )
 
-    pyvista_reader = GLTFReader(
-        file_path
-    )  # We load the mesh already converted by pyvista/vtk instead of decoding our self
-    pyvista_reader.reader.ApplyDeformationsToGeometryOff()  # We don't want to apply the transforms to the various nodes
-    pyvista_meshes = pyvista_reader.read()
+    # We decode the meshes from the accessors of the already parsed file
+    # and only fall back to the VTK reader (which parses the file again) for the features we don't decode.
+    try:
+        if lazy:
+            for gltf_mesh in gltf_model.meshes or []:
+                for primitive in gltf_mesh.primitives:
+                    check_primitive_support(gltf_scene, primitive)
+            pyvista_meshes = None  # Decoded by each object on first access
+        else:
+            pyvista_meshes = read_pyvista_meshes(gltf_scene)
+    except NotImplementedError:
+        if "KHR_mesh_quantization" in (gltf_model.extensionsRequired or []):
+            raise  # The VTK reader doesn't support quantized meshes
+        pyvista_reader = GLTFReader(file_path)
+        pyvista_reader.reader.ApplyDeformationsToGeometryOff()  # We don't want to apply the transforms to the nodes
+        pyvista_meshes = pyvista_reader.read()
+    # The images are decoded in parallel (the decoding runs without the GIL), the textures are built from them
+    images = None if lazy else decode_images(gltf_scene, max_workers=max_workers)
+
     gltf_main_scene = gltf_model.scenes[gltf_model.scene if gltf_model.scene else 0]
     gltf_main_nodes = gltf_main_scene.nodes
 
@@ -538,12 +899,22 @@ def load_gltf_as_tree(
         main_nodes.append(
             build_node_tree(
                 gltf_scene=gltf_scene,
-                pyvista_meshes=pyvista_meshes[f"Node_{gltf_node_id}"],
+                pyvista_meshes=pyvista_meshes[f"Node_{gltf_node_id}"] if pyvista_meshes is not None else None,
                 gltf_node_id=gltf_node_id,
                 parent=None,
+                lazy=lazy,
+                images=images,
             )
         )
     for node in main_nodes:
         process_tree_after_gltf(node)
 
+    if asset_cache is not None and not lazy:
+        resource_paths = [
+            resource.fullpath
+            for resource in gltf_scene.resources
+            if isinstance(resource, FileResource) and os.path.isfile(resource.fullpath)
+        ]
+        asset_cache.save_snapshot(file_path, main_nodes, resource_paths=resource_paths)
+
     return main_nodes
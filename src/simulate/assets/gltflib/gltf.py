@@ -23,11 +23,10 @@
 # Lint as: python3
 import codecs
 import copy
-import io
 import struct
 import warnings
 from os import path
-from typing import BinaryIO, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from urllib.parse import unquote, urlparse
 
 from ...utils import logging
@@ -39,6 +38,7 @@ from .gltf_resource import (
     FileResource,
     GLBResource,
     GLTFResource,
+    map_file,
 )
 from .models import Buffer, BufferView, GLTFModel, Image
 from .utils import create_parent_dirs, padbytes
@@ -53,6 +53,7 @@ class GLTF:
     def __init__(self, model: GLTFModel = None, resources: List[GLTFResource] = None):
         self.model = model
         self.resources = resources
+        self._glb_segments: Optional[List[Tuple[int, bytes]]] = None
 
     @classmethod
     def load(
@@ -61,6 +62,7 @@ class GLTF:
         load_file_resources: bool = False,
         resources: Optional[List[GLTFResource]] = None,
         encoding: Optional[str] = None,
+        use_mmap: bool = False,
     ) -> "GLTF":
         """
         Loads a GLTF or GLB model from a filename. The model format will be inferred from the filename extension.
@@ -75,13 +77,16 @@ class GLTF:
             working with models that do not fully adhere to the spec, the file may be read with a different encoding.
             If not passed in, the encoding will be guessed from one of several supported encodings (based on BOM),
             defaulting to UTF-8 if it cannot be inferred.
+        :param use_mmap: If True, the binary data (GLB binary chunk and external file resources) is memory-mapped
+            instead of being read in memory: buffer views are zero-copy views over the file and the data is only paged
+            in when accessed. The files are kept mapped as long as the resources are alive.
         :return: GLTF instance
         """
         ext = path.splitext(filename)[1].lower()
         if ext == ".gltf":
-            return cls.load_gltf(filename, load_file_resources, resources, encoding)
+            return cls.load_gltf(filename, load_file_resources, resources, encoding, use_mmap)
         elif ext == ".glb":
-            return cls.load_glb(filename, load_file_resources, resources, encoding)
+            return cls.load_glb(filename, load_file_resources, resources, encoding, use_mmap)
         raise RuntimeError(
             f"File format could not be inferred from filename: {filename}. Ensure the filename has "
             f"the appropriate extension (.gltf or .glb), or call load_gltf or load_glb directly if "
@@ -95,6 +100,7 @@ class GLTF:
         load_file_resources: bool = False,
         resources: Optional[List[GLTFResource]] = None,
         encoding: Optional[str] = None,
+        use_mmap: bool = False,
     ) -> "GLTF":
         """
         Loads a model in GLTF format from a filename
@@ -108,6 +114,7 @@ class GLTF:
             accommodate working with models that do not fully adhere to the spec, the file may be read with a different
             encoding. If not passed in, the encoding will be guessed from one of several supported encodings (based on
             BOM), defaulting to UTF-8 if it cannot be inferred.
+        :param use_mmap: If True, the external file resources are memory-mapped instead of being read in memory.
         :return: GLTF instance
         """
         gltf = GLTF(model=None, resources=resources)
@@ -116,7 +123,7 @@ class GLTF:
             json = GLTF._decode_bytes(data, encoding)
             gltf.model = GLTFModel.from_json(json)
         basepath = path.dirname(filename)
-        gltf._load_resources(basepath, load_file_resources)
+        gltf._load_resources(basepath, load_file_resources, use_mmap)
         return gltf
 
     @classmethod
@@ -126,6 +133,7 @@ class GLTF:
         load_file_resources: bool = False,
         resources: Optional[List[GLTFResource]] = None,
         encoding: Optional[str] = None,
+        use_mmap: bool = False,
     ) -> "GLTF":
         """
         Loads a model in GLB format from a filename
@@ -139,13 +147,16 @@ class GLTF:
             encoded using UTF-8 (without BOM). However, to accommodate working with models that do not fully adhere to
             the spec, the JSON chunk may be read with a different encoding. If not passed in, the encoding will be
             guessed from one of several supported encodings (based on BOM), defaulting to UTF-8 if cannot be inferred.
+        :param use_mmap: If True, the GLB binary chunk and the external file resources are memory-mapped instead of
+            being read in memory.
         :return: GLTF instance
         """
         gltf = GLTF(model=None, resources=resources)
+        mapping = map_file(filename) if use_mmap else None
         with open(filename, "rb") as f:
-            gltf._load_glb(f, encoding)
+            gltf._load_glb(f, encoding, mapping)
         basepath = path.dirname(filename)
-        gltf._load_resources(basepath, load_file_resources)
+        gltf._load_resources(basepath, load_file_resources, use_mmap)
         return gltf
 
     @property
@@ -229,6 +240,37 @@ class GLTF:
         # noinspection PyProtectedMember
         return glb._as_glb_bytes()
 
+    def write_glb(self, sink: Any, embed_buffer_resources: bool = True, embed_image_resources: bool = True) -> int:
+        """
+        Stream the model as GLB to a writable sink.
+        The chunk layout is computed up front and the header, JSON chunk and resource data are written one after the
+        other, without assembling the GLB in memory (the resource data is never copied).
+        :param sink: Where to write the GLB. Either a binary file-like object (with a `write` method), a socket (with
+            a `sendall` method) or a writable bytes-like object (e.g. a `bytearray` or `memoryview`) large enough to
+            hold the GLB (see `glb_bytelength`).
+        :param embed_buffer_resources: If True, buffer resources will be embedded in the GLB (see `export_glb`).
+        :param embed_image_resources: If True, image resources will be embedded in the GLB (see `export_glb`).
+        :return: The number of bytes written.
+
+        The original GLTF instance is NOT mutated.
+        """
+        glb = self.clone()
+        # noinspection PyProtectedMember
+        return glb._write_glb_to_sink(sink, embed_buffer_resources, embed_image_resources)
+
+    def glb_bytelength(self, embed_buffer_resources: bool = True, embed_image_resources: bool = True) -> int:
+        """
+        Return the size in bytes of the model exported as GLB (e.g. to allocate the buffer given to `write_glb`).
+        :param embed_buffer_resources: If True, buffer resources will be embedded in the GLB (see `export_glb`).
+        :param embed_image_resources: If True, image resources will be embedded in the GLB (see `export_glb`).
+        :return: The size of the GLB in bytes.
+        """
+        glb = self.clone()
+        # noinspection PyProtectedMember
+        glb._embed_resources_by_reference(embed_buffer_resources, embed_image_resources)
+        glb._prepare_glb()
+        return glb._glb_bytelength()
+
     def clone(self) -> "GLTF":
         """
         Clones the model and its resources to a new instance.
@@ -461,10 +503,10 @@ class GLTF:
             # If BOM is present, it will be automatically stripped out.
             return data.decode("utf-8-sig", errors="replace")
 
-    def _load_resources(self, basepath: str, autoload: bool = False):
+    def _load_resources(self, basepath: str, autoload: bool = False, use_mmap: bool = False):
         self.resources = self.resources or []
         for uri in self._get_resource_uris_from_model():
-            resource = _get_resource(uri, basepath, autoload)
+            resource = _get_resource(uri, basepath, autoload, use_mmap)
             if resource is not None:
                 self.resources.append(resource)
 
@@ -481,13 +523,13 @@ class GLTF:
         for resource in self.resources:
             if isinstance(resource, FileResource):
                 file_name_ressource = resource.export(basepath)
-                file_names += file_name_ressource
+                file_names.append(file_name_ressource)
         return file_names
 
-    def _load_glb(self, f: BinaryIO, json_encoding: Optional[str] = None):
+    def _load_glb(self, f: BinaryIO, json_encoding: Optional[str] = None, mapping: Optional[memoryview] = None):
         self.resources = []
         bytelen = self._load_glb_header(f)
-        self._load_glb_chunks(f, json_encoding)
+        self._load_glb_chunks(f, json_encoding, mapping)
         pos = f.tell()
         if pos != bytelen:
             warnings.warn(
@@ -507,11 +549,13 @@ class GLTF:
         (bytelen,) = struct.unpack_from("<I", b, 8)
         return bytelen
 
-    def _load_glb_chunks(self, f: BinaryIO, json_encoding: Optional[str] = None):
-        while self._load_glb_chunk(f, json_encoding):
+    def _load_glb_chunks(self, f: BinaryIO, json_encoding: Optional[str] = None, mapping: Optional[memoryview] = None):
+        while self._load_glb_chunk(f, json_encoding, mapping):
             pass
 
-    def _load_glb_chunk(self, f: BinaryIO, json_encoding: Optional[str] = None) -> bool:
+    def _load_glb_chunk(
+        self, f: BinaryIO, json_encoding: Optional[str] = None, mapping: Optional[memoryview] = None
+    ) -> bool:
         b = f.read(8)
         if b == b"":
             return False
@@ -525,7 +569,7 @@ class GLTF:
         if chunk_type == GLB_JSON_CHUNK_TYPE:
             self._load_glb_json_chunk_body(f, chunk_length, json_encoding)
         else:
-            self._load_glb_binary_chunk_body(f, chunk_type, chunk_length)
+            self._load_glb_binary_chunk_body(f, chunk_type, chunk_length, mapping)
         return True
 
     def _load_glb_json_chunk_body(self, f: BinaryIO, bytelen: int, json_encoding: Optional[str] = None):
@@ -537,8 +581,16 @@ class GLTF:
         model_json = GLTF._decode_bytes(b, json_encoding)
         self.model = GLTFModel.from_json(model_json)
 
-    def _load_glb_binary_chunk_body(self, f: BinaryIO, chunk_type: int, bytelen: int):
-        b = f.read(bytelen)
+    def _load_glb_binary_chunk_body(
+        self, f: BinaryIO, chunk_type: int, bytelen: int, mapping: Optional[memoryview] = None
+    ):
+        if mapping is not None:
+            # Zero-copy view over the memory-mapped file, we just skip the chunk in the file
+            offset = f.tell()
+            b = mapping[offset : offset + bytelen]
+            f.seek(offset + len(b))
+        else:
+            b = f.read(bytelen)
         if len(b) != bytelen:
             warnings.warn(
                 "Unexpected EOF when parsing binary chunk body. The GLB file may be corrupt.", RuntimeWarning
@@ -588,11 +640,22 @@ class GLTF:
             self._export_file_resources(basepath)
 
     def _as_glb_bytes(self) -> bytes:
-        self._embed_buffer_resources()
-        self._embed_image_resources()
-        with io.BytesIO() as f:
-            self._write_glb(f)
-            return f.getvalue()
+        self._embed_resources_by_reference()
+        # A single copy of the data: join allocates the output once from the sizes of the parts
+        return b"".join(self._iter_glb_parts())
+
+    def _write_glb_to_sink(
+        self, sink: Any, embed_buffer_resources: bool = True, embed_image_resources: bool = True
+    ) -> int:
+        self._embed_resources_by_reference(embed_buffer_resources, embed_image_resources)
+        self._prepare_glb()
+        return _write_parts(self._iter_glb_parts(prepare=False), sink, self._glb_bytelength())
+
+    def _embed_resources_by_reference(self, embed_buffer_resources: bool = True, embed_image_resources: bool = True):
+        if embed_buffer_resources:
+            self._embed_buffer_resources(by_reference=True)
+        if embed_image_resources:
+            self._embed_image_resources(by_reference=True)
 
     def _get_resource_uris_from_model(self) -> Set:
         uris = set()
@@ -626,40 +689,52 @@ class GLTF:
 
     def _write_glb(self, f: BinaryIO):
         self._prepare_glb()
-        self._write_glb_header(f)
-        self._write_glb_body(f)
+        for part in self._iter_glb_parts(prepare=False):
+            f.write(part)
 
     def _prepare_glb(self):
         json_bytes = bytearray(self.model.to_json(separators=(",", ":")).encode("utf-8"))
         json_len = padbytes(json_bytes, 4, b"\x20")
-        json_chunk = (json_len, GLB_JSON_CHUNK_TYPE, json_bytes)
+        json_chunk = (json_len, GLB_JSON_CHUNK_TYPE, [json_bytes])
         self._chunks = [json_chunk]
-        for resource in self.glb_resources:
-            data = resource.data
-            bytelen = len(data)
+
+        # Resources embedded by reference are laid out as (offset, data) segments of the binary chunk,
+        # which must come first after the JSON chunk
+        resources = self.glb_resources
+        chunks_segments = []
+        if self._glb_segments is not None:
+            resources = [resource for resource in resources if resource.resource_type != GLB_BINARY_CHUNK_TYPE]
+            if self._glb_segments:
+                chunks_segments.append((GLB_BINARY_CHUNK_TYPE, self._glb_segments))
+        chunks_segments += [(resource.resource_type, [(0, resource.data)]) for resource in resources]
+
+        for chunk_type, segments in chunks_segments:
+            parts = []
+            bytelen = 0
+            for offset, data in segments:
+                if offset > bytelen:
+                    parts.append(bytes(offset - bytelen))
+                parts.append(data)
+                bytelen = offset + len(data)
             if bytelen % 4 != 0:
-                data = bytearray(data)
-                bytelen = padbytes(data, 4)
-            chunk = (bytelen, resource.resource_type, data)
-            self._chunks.append(chunk)
+                parts.append(bytes(4 - bytelen % 4))
+                bytelen += 4 - bytelen % 4
+            self._chunks.append((bytelen, chunk_type, parts))
 
-    def _write_glb_header(self, f: BinaryIO):
+    def _glb_bytelength(self) -> int:
         chunk_header_len = 8
-        bytelen = self.GLB_HEADER_BYTELENGTH + sum(chunk[0] + chunk_header_len for chunk in self._chunks)
-        output = bytearray()
-        output.extend(b"glTF")
-        output.extend(struct.pack("<I", 2))
-        output.extend(struct.pack("<I", bytelen))
-        f.write(output)
-
-    def _write_glb_body(self, f: BinaryIO):
-        for chunk in self._chunks:
-            bytelen, chunk_type, data = chunk
-            f.write(struct.pack("<I", bytelen))
-            f.write(struct.pack("<I", chunk_type))
-            f.write(data)
-
-    def _embed_buffer_resources(self):
+        return self.GLB_HEADER_BYTELENGTH + sum(chunk[0] + chunk_header_len for chunk in self._chunks)
+
+    def _iter_glb_parts(self, prepare: bool = True) -> Iterator[bytes]:
+        """Yield the successive parts of the GLB: header, then the header and data parts of each chunk."""
+        if prepare:
+            self._prepare_glb()
+        yield b"glTF" + struct.pack("<II", 2, self._glb_bytelength())
+        for bytelen, chunk_type, parts in self._chunks:
+            yield struct.pack("<II", bytelen, chunk_type)
+            yield from parts
+
+    def _embed_buffer_resources(self, by_reference: bool = False):
         if self.model.buffers is None:
             return
 
@@ -673,13 +748,16 @@ class GLTF:
                 resource = self.get_resource(buffer.uri)
                 if resource is None:
                     raise RuntimeError(f'Missing resource: "{buffer.uri}" (referenced in buffer with index {i})')
-                self.embed_resource(resource)
+                if by_reference:
+                    self._embed_resource_by_reference(resource)
+                else:
+                    self.embed_resource(resource)
 
                 # Restart enumeration since embedding resource may have removed more than one buffer
                 enumerated_buffers = None
                 break
 
-    def _embed_image_resources(self):
+    def _embed_image_resources(self, by_reference: bool = False):
         if self.model.images is None:
             return
 
@@ -693,12 +771,37 @@ class GLTF:
                 resource = self.get_resource(image.uri)
                 if resource is None:
                     raise RuntimeError(f'Missing resource: "{image.uri}" (referenced in image with index {i})')
-                self.embed_resource(resource)
+                if by_reference:
+                    self._embed_resource_by_reference(resource)
+                else:
+                    self.embed_resource(resource)
 
                 # Restart enumeration since embedding resource may have removed more than one image
                 enumerated_images = None
                 break
 
+    def _embed_resource_by_reference(self, resource: GLTFResource):
+        """
+        Embeds a resource like `embed_resource`, but without merging its data in the GLBResource: the data is only
+        referenced as a (offset, data) segment of the binary chunk, to be streamed by `_iter_glb_parts`.
+        """
+        if self._glb_segments is None:
+            glb_resource = self.get_glb_resource()
+            self._glb_segments = [] if glb_resource is None else [(0, glb_resource.data)]
+        if isinstance(resource, ExternalResource):
+            raise TypeError("Embedding an ExternalResource is not supported")
+        if isinstance(resource, FileResource) and not resource.loaded:
+            resource.load()
+        if isinstance(resource, FileResource) or isinstance(resource, Base64Resource):
+            data = resource.data
+            end = self._glb_segments[-1][0] + len(self._glb_segments[-1][1]) if self._glb_segments else 0
+            offset = end + (-end) % 4
+            self._glb_segments.append((offset, data))
+            buffer = self._get_or_create_glb_buffer()
+            buffer.byteLength = offset + len(data) + (-len(data)) % 4
+            self.resources.remove(resource)
+            self._update_model_after_embedding_resource(resource, offset, len(data))
+
     def _get_glb_buffer(self) -> Optional[Buffer]:
         """
         Returns the GLB buffer if present. The GLB buffer must be the first in the list, and have its URI undefined.
@@ -905,12 +1008,37 @@ class GLTF:
                 image.bufferView -= 1
 
 
-def _get_resource(uri, basepath: str, autoload: bool = False) -> Optional[GLTFResource]:
+def _get_resource(uri, basepath: str, autoload: bool = False, use_mmap: bool = False) -> Optional[GLTFResource]:
     scheme, netloc, urlpath, params, query, fragment = urlparse(uri)
     if netloc:
         return ExternalResource(uri)
     elif scheme == "data":
         return Base64Resource.from_uri(uri)
     elif not scheme:
-        return FileResource(unquote(uri), basepath, autoload)
+        return FileResource(unquote(uri), basepath, autoload, use_mmap=use_mmap)
     return None
+
+
+def _write_parts(parts: Iterable[bytes], sink: Any, bytelen: int) -> int:
+    """Write the parts of a GLB of a known size to a file-like object, a socket or a writable buffer."""
+    if hasattr(sink, "write"):
+        write = sink.write
+    elif hasattr(sink, "sendall"):
+        write = sink.sendall
+    else:
+        view = memoryview(sink).cast("B")
+        if view.readonly:
+            raise TypeError("The GLB sink must be a file-like object, a socket or a writable bytes-like object")
+        if len(view) < bytelen:
+            raise ValueError(f"The GLB sink is too small: {len(view)} bytes available but {bytelen} bytes needed")
+        offset = 0
+        for part in parts:
+            view[offset : offset + len(part)] = part
+            offset += len(part)
+        return offset
+
+    written = 0
+    for part in parts:
+        write(part)
+        written += len(part)
+    return written
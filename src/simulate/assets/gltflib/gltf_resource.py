@@ -23,10 +23,11 @@
 # Lint as: python3
 import base64
 import mimetypes
+import mmap
 import struct
 from abc import ABC, abstractmethod
 from os import path
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import quote
 
 from .utils import create_parent_dirs
@@ -36,6 +37,19 @@ from .utils import create_parent_dirs
 (GLB_BINARY_CHUNK_TYPE,) = struct.unpack("<I", b"BIN\x00")
 
 
+def map_file(filename: str) -> Union[bytes, memoryview]:
+    """
+    Memory-map a file read-only. The returned view stays valid after the file is closed, the pages of the file are only
+    read when the view is accessed and the mapping is released when the view (and its slices) are garbage collected.
+    :param filename: Path to the file
+    :return: A read-only memoryview over the content of the file (empty bytes for an empty file, which can't be mapped)
+    """
+    with open(filename, "rb") as f:
+        if path.getsize(filename) == 0:
+            return b""
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
 class GLTFResource(ABC):
     """
     Base class for a GLTF resource representation containing binary data. Note that depending on the resource type, the
@@ -67,7 +81,7 @@ class FileResource(GLTFResource):
     """
     GLTF resource that exists on the local filesystem. When exporting a GLTF model, all file resources will be saved to
     disk. When loading a GLTF model with load_file_resources set to True, any URIs that refer to a file will be imported
-    as file resources.
+    as file resources. With use_mmap set to True, the file is memory-mapped on load instead of being read in memory.
     """
 
     def __init__(
@@ -77,12 +91,14 @@ class FileResource(GLTFResource):
         autoload: bool = False,
         data: Optional[bytes] = None,
         mimetype: Optional[str] = None,
+        use_mmap: bool = False,
     ):
         super(FileResource, self).__init__(quote(filename), data)
         self._filename = filename
         self._loaded = self._data is not None
         self._basepath = basepath
         self._mimetype = mimetype
+        self._use_mmap = use_mmap
         if autoload:
             self.load()
 
@@ -111,9 +127,12 @@ class FileResource(GLTFResource):
         if not self._filename:
             raise ValueError("Attempted to load FileResource without filename")
         filename = path.join(self._basepath, self._filename) if self._basepath is not None else self._filename
-        with open(filename, "rb") as f:
-            self._data = f.read()
-            self._mimetype = self._mimetype or mimetypes.guess_type(filename)[0]
+        if self._use_mmap:
+            self._data = map_file(filename)
+        else:
+            with open(filename, "rb") as f:
+                self._data = f.read()
+        self._mimetype = self._mimetype or mimetypes.guess_type(filename)[0]
         self._loaded = True
 
     def export(self, basepath: Optional[str] = None) -> str:
@@ -130,7 +149,7 @@ class FileResource(GLTFResource):
         return filename
 
     def clone(self) -> "FileResource":
-        return FileResource(self._filename, self._basepath, False, self._data, self._mimetype)
+        return FileResource(self._filename, self._basepath, False, self._data, self._mimetype, self._use_mmap)
 
 
 class ExternalResource(GLTFResource):
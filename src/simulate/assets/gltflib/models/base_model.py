@@ -26,7 +26,18 @@ from typing import Any, List, Optional
 
 from dataclasses_json import dataclass_json
 
+from .... import config  # noqa: F401
+from ... import (  # noqa: F401
+    actuator,
+    articulation_body,
+    collider,
+    physic_material,
+    reward_functions,
+    rigid_body,
+    sensors,
+)
 from ...gltf_extension import GLTF_EXTENSIONS_REGISTER
+from .extensions.ext_mesh_gpu_instancing import EXTMeshGpuInstancing
 from .extensions.khr_lights_ponctual import KHRLightsPunctual
 
 
@@ -38,10 +49,20 @@ class OldExtensions:
     """
 
     KHR_lights_punctual: Optional[KHRLightsPunctual] = None
+    EXT_mesh_gpu_instancing: Optional[EXTMeshGpuInstancing] = None
     HF_custom: Optional[List[str]] = None
 
 
-Extensions = dataclass_json(make_dataclass("Extensions", fields=GLTF_EXTENSIONS_REGISTER, bases=(OldExtensions,)))
+# The classes register their glTF extension when they are defined: the modules defining them are imported above
+# so that the model knows all the extensions. They are imported lazily by the packages, in an order depending
+# on the attributes accessed first, so the extensions are sorted for the files not to depend on it.
+Extensions = dataclass_json(
+    make_dataclass(
+        "Extensions",
+        fields=sorted(GLTF_EXTENSIONS_REGISTER, key=lambda extension_field: extension_field[0]),
+        bases=(OldExtensions,),
+    )
+)
 
 
 @dataclass_json
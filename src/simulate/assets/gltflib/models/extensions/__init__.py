@@ -1 +1,2 @@
+from .ext_mesh_gpu_instancing import *
 from .khr_lights_ponctual import *
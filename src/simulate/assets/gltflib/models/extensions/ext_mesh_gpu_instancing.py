@@ -0,0 +1,34 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from dataclasses_json import dataclass_json
+
+
+@dataclass_json
+@dataclass
+class EXTMeshGpuInstancing:
+    """
+    GPU instancing of a mesh. A node with this extension is rendered once for each instance,
+    the per-instance transforms being stored in accessors (one element per instance).
+
+    Properties:
+    attributes (object) Dictionary mapping the instance attributes (TRANSLATION, ROTATION, SCALE)
+        to the index of the accessor storing them. (Required)
+    """
+
+    attributes: Optional[Dict[str, int]] = None
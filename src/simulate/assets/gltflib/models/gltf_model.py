@@ -22,12 +22,12 @@
 
 # Lint as: python3
 import json
-from dataclasses import asdict, dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
 
 from dataclasses_json import DataClassJsonMixin
 
-from ..utils import replace_unique_id_and_remove_none
+from ..utils import dataclass_from_json_dict, dataclass_to_json_dict
 from .accessor import Accessor
 from .animation import Animation
 from .asset import Asset
@@ -66,5 +66,11 @@ class GLTFModel(DataClassJsonMixin, BaseModel):
     extensionsUsed: Optional[List[str]] = None
 
     def to_json(self, **kwargs: Any) -> str:
-        data = replace_unique_id_and_remove_none(asdict(self))
+        data = dataclass_to_json_dict(self)
         return json.dumps(data, **kwargs)
+
+    @classmethod
+    def from_json(cls, s: Union[str, bytes, bytearray], *, infer_missing: bool = False, **kwargs: Any) -> "GLTFModel":
+        if infer_missing:
+            return super().from_json(s, infer_missing=infer_missing, **kwargs)
+        return dataclass_from_json_dict(cls, json.loads(s, **kwargs))
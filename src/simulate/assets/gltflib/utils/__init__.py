@@ -1,3 +1,3 @@
 from .data_utils import padbytes
 from .file_utils import create_parent_dirs
-from .json_utils import del_none, replace_unique_id_and_remove_none
+from .json_utils import dataclass_from_json_dict, dataclass_to_json_dict, del_none, replace_unique_id_and_remove_none
@@ -21,6 +21,25 @@
 # SOFTWARE.
 
 # Lint as: python3
+import warnings
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Union, get_args, get_origin, get_type_hints
+
+from dataclasses_json.core import (
+    _decode_dataclass,
+    _decode_type,
+    _is_supported_generic,
+    _support_extended_types,
+    _user_overrides_or_exts,
+)
+from dataclasses_json.utils import _is_optional, _undefined_parameter_action_safe
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Field names and decoders of the dataclasses, generated once per class
+_FIELD_NAMES: Dict[type, tuple] = {}
+_DATACLASS_DECODERS: Dict[type, Callable[[Any], Any]] = {}
 
 
 def del_none(d: dict) -> dict:
@@ -71,3 +90,163 @@ def replace_unique_id_and_remove_none(d: dict) -> dict:
                 if isinstance(item, dict):
                     del_none(item)
     return d  # For convenience
+
+
+def _field_names(cls: type) -> tuple:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def _to_json_value(value: Any, remove_none: bool) -> Any:
+    """
+    Convert a value like `dataclasses.asdict` followed by `del_none` would:
+    `None` values are removed from the dicts reached by `del_none` (dicts nested in dicts or directly in lists).
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    if value_type is list:
+        return [
+            item
+            if type(item) in _JSON_SCALARS
+            else _to_json_value(item, remove_none and not isinstance(item, (list, tuple)))
+            for item in value
+        ]
+    if value_type in _FIELD_NAMES or hasattr(value_type, "__dataclass_fields__"):
+        data = {}
+        for name in _field_names(value_type):
+            item = getattr(value, name)
+            if type(item) in _JSON_SCALARS:
+                if item is not None or not remove_none:
+                    data[name] = item
+            else:
+                data[name] = _to_json_value(item, remove_none)
+        return data
+    if isinstance(value, dict):
+        data = value_type()
+        for key, item in value.items():
+            if item is None and remove_none:
+                continue
+            data[_to_json_value(key, False)] = _to_json_value(item, remove_none)
+        return data
+    if isinstance(value, list):
+        return value_type(
+            item
+            if type(item) in _JSON_SCALARS
+            else _to_json_value(item, remove_none and not isinstance(item, (list, tuple)))
+            for item in value
+        )
+    if isinstance(value, tuple):
+        return [_to_json_value(item, False) for item in value]
+    return value
+
+
+def dataclass_to_json_dict(obj: Any) -> dict:
+    """
+    Fast equivalent of ``replace_unique_id_and_remove_none(dataclasses.asdict(obj))``.
+
+    The dataclass tree is converted in a single pass and the leaf values are not deep-copied
+    (the result is meant to be serialized right away).
+    """
+    data = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        if hasattr(value, "_unique_id") and not is_dataclass(value):
+            data[name] = value._unique_id
+        else:
+            data[name] = _to_json_value(value, True)
+    return data
+
+
+def _compile_type_decoder(type_: Any) -> Callable[[Any], Any]:
+    """Generate a decoder for the (non-None) JSON values of a type, matching `dataclasses_json`."""
+    if type_ is Any:
+        return lambda value: value
+    if type_ in (int, float, str, bool):
+        return lambda value: value if isinstance(value, type_) else type_(value)
+    if isinstance(type_, type) and is_dataclass(type_):
+        return lambda value: value if is_dataclass(value) else _decode_json_dataclass(type_, value)
+
+    origin, args = get_origin(type_), get_args(type_)
+    if origin is Union and len(args) == 2 and type(None) in args:
+        decode = _compile_type_decoder(args[0] if args[1] is type(None) else args[1])
+        return lambda value: None if value is None else decode(value)
+    if origin in (list, List) and len(args) == 1:
+        decode_item = _compile_type_decoder(args[0])
+        return lambda value: [decode_item(item) for item in value]
+    # Other types (dicts, enums, unions...): use the implementation of dataclasses_json
+    return lambda value: _decode_type(type_, value, False)
+
+
+def _compile_dataclass_decoder(cls: type) -> Callable[[Any], Any]:
+    """Generate the decoder of a dataclass, falling back to `dataclasses_json` for customized classes."""
+    overrides = _user_overrides_or_exts(cls).values()
+    if _undefined_parameter_action_safe(cls) is not None or any(
+        override.decoder is not None or override.letter_case is not None for override in overrides
+    ):
+        return lambda kvs: _decode_dataclass(cls, kvs, False)
+
+    types = get_type_hints(cls)
+    specs = []
+    for field in fields(cls):
+        if not field.init:
+            continue
+        field_type = types[field.name]
+        while hasattr(field_type, "__supertype__"):  # NewType
+            field_type = field_type.__supertype__
+        if (
+            field_type in (int, float, str, bool)
+            or is_dataclass(field_type)
+            or (_is_supported_generic(field_type) and field_type != str)
+        ):
+            decode = _compile_type_decoder(field_type)
+        else:
+            decode = lambda value, field_type=field_type: _support_extended_types(field_type, value)  # noqa: E731
+        specs.append((field.name, field.default, field.default_factory, _is_optional(field_type), decode))
+
+    def decode_dataclass(kvs: Any) -> Any:
+        if isinstance(kvs, cls):
+            return kvs
+        init_kwargs = {}
+        for name, default, default_factory, optional, decode in specs:
+            if name in kvs:
+                value = kvs[name]
+            elif default is not MISSING:
+                value = default
+            elif default_factory is not MISSING:
+                value = default_factory()
+            else:
+                raise KeyError(name)
+            if value is None:
+                if not optional:
+                    warnings.warn(
+                        f"'NoneType' object value of non-optional type {name} detected when decoding {cls.__name__}.",
+                        RuntimeWarning,
+                    )
+                init_kwargs[name] = None
+            else:
+                init_kwargs[name] = decode(value)
+        return cls(**init_kwargs)
+
+    return decode_dataclass
+
+
+def _decode_json_dataclass(cls: type, kvs: Any) -> Any:
+    decoder = _DATACLASS_DECODERS.get(cls)
+    if decoder is None:
+        decoder = _DATACLASS_DECODERS[cls] = _compile_dataclass_decoder(cls)
+    return decoder(kvs)
+
+
+def dataclass_from_json_dict(cls: type, kvs: dict) -> Any:
+    """
+    Fast equivalent of ``cls.from_dict(kvs)`` for `dataclasses_json` dataclasses.
+
+    A decoder is generated once per dataclass from its type hints, instead of inspecting the type hints
+    of every field of every decoded object.
+    """
+    return _decode_json_dataclass(cls, kvs)
@@ -14,7 +14,7 @@
 
 # Lint as: python3
 import itertools
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -100,6 +100,17 @@ class Light(Asset):
         self.inner_cone_angle = inner_cone_angle
         self.outer_cone_angle = outer_cone_angle
 
+    def _structural_content(self) -> Tuple:
+        """Add the parameters of the light to the structural content of the node."""
+        return super()._structural_content() + (
+            self.intensity,
+            tuple(self.color),
+            self.range,
+            self.light_type,
+            float(self.inner_cone_angle),
+            float(self.outer_cone_angle),
+        )
+
     def copy(self, with_children: bool = True, **kwargs: Any) -> "Light":
         """
         Make a copy of the Asset.
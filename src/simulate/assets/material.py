@@ -17,13 +17,25 @@
 import copy
 import itertools
 from dataclasses import dataclass
-from typing import ClassVar, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
 import numpy as np
-import PIL.Image
-import pyvista
 
-from .utils import camelcase_to_snakecase
+from .utils import LazyLoader, camelcase_to_snakecase
+
+
+if TYPE_CHECKING:
+    import PIL.Image
+    import pyvista
+
+
+TEXTURE_FIELDS = [
+    "base_color_texture",
+    "metallic_roughness_texture",
+    "normal_texture",
+    "occlusion_texture",
+    "emissive_texture",
+]
 
 
 class classproperty(object):
@@ -36,6 +48,24 @@ class classproperty(object):
         return self.fget(owner_cls)
 
 
+class _TextureField(object):
+    # Data descriptor storing a texture of a Material in the instance dict,
+    # and loading it on first access if it was given as a `LazyLoader`
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, owner_self, owner_cls):
+        if owner_self is None:
+            return None  # Default value of the dataclass field
+        value = owner_self.__dict__.get(self.name)
+        if isinstance(value, LazyLoader):
+            value = owner_self.__dict__[self.name] = value.load()
+        return value
+
+    def __set__(self, owner_self, value):
+        owner_self.__dict__[self.name] = value
+
+
 # This is a very basic PBR Material class, mostly here to be able to load a gltf - strongly base on GLTF definitions
 # TODO: Revamp and improve the Material class
 
@@ -51,6 +81,7 @@ class Material:
         base_color_texture (`pyvista.Texture`, *optional*, defaults to `None`):
             A base color texture.
             Can be created from a PIL image, by first converting to a np array and then to a pyvista texture.
+            All the textures can also be given as a `LazyLoader` to load them on first access.
         metallic_factor (`float`, *optional*, defaults to `0.0`):
             The material's metallic factor.
         roughness_factor (`float`, *optional*, defaults to `1.0`):
@@ -86,13 +117,13 @@ class Material:
     __NEW_ID: ClassVar[int] = itertools.count()  # Singleton to count instances of the classes for automatic naming
 
     base_color: Optional[List[float]] = None
-    base_color_texture: Optional[pyvista.Texture] = None
+    base_color_texture: Optional["pyvista.Texture"] = None
     metallic_factor: Optional[float] = None
     roughness_factor: Optional[float] = None
-    metallic_roughness_texture: Optional[PIL.Image.Image] = None
-    normal_texture: Optional[PIL.Image.Image] = None
-    occlusion_texture: Optional[PIL.Image.Image] = None
-    emissive_texture: Optional[PIL.Image.Image] = None
+    metallic_roughness_texture: Optional["PIL.Image.Image"] = None
+    normal_texture: Optional["PIL.Image.Image"] = None
+    occlusion_texture: Optional["PIL.Image.Image"] = None
+    emissive_texture: Optional["PIL.Image.Image"] = None
     emissive_factor: Optional[List[float]] = None
     alpha_mode: Optional[str] = None
     alpha_cutoff: Optional[float] = None
@@ -142,6 +173,23 @@ class Material:
     def __hash__(self) -> int:
         return id(self)
 
+    @property
+    def are_textures_loaded(self) -> bool:
+        """Whether all the textures of the material are loaded (see `LazyLoader`)."""
+        return not any(isinstance(self.__dict__.get(name), LazyLoader) for name in TEXTURE_FIELDS)
+
+    def prefetch(self) -> "Material":
+        """
+        Load the lazily loaded textures of the material.
+
+        Returns:
+            self (`Material`):
+                The material.
+        """
+        for name in TEXTURE_FIELDS:
+            getattr(self, name)
+        return self
+
     def copy(self) -> "Material":
         """
         Make a copy of the material.
@@ -219,3 +267,8 @@ class Material:
     @classproperty
     def TRANSPARENT(cls) -> "Material":
         return cls(base_color=[0.0, 0.0, 0.0, 0.0], alpha_mode="BLEND")
+
+
+# The textures are re-exposed as data descriptors once the dataclass is built (which keeps their `None` defaults)
+for _texture_field in TEXTURE_FIELDS:
+    setattr(Material, _texture_field, _TextureField(_texture_field))
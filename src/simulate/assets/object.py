@@ -16,7 +16,8 @@
 """ A simulate Scene Object."""
 import dataclasses
 import itertools
-from typing import Any, List, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 import numpy as np
 import pyvista as pv
@@ -28,6 +29,9 @@ from .collider import Collider
 from .material import Material
 from .procgen.prims import generate_prims_maze
 from .rigid_body import RigidBodyComponent
+from .transform_store import TransformStore
+from .transforms import quaternions_from_euler_degrees
+from .utils import LazyLoader, camelcase_to_snakecase
 
 
 if is_vhacd_available():
@@ -38,6 +42,10 @@ if is_fastwfc_available():
 
 logger = logging.get_logger(__name__)
 
+PRIMITIVE_MESH_CACHE_SIZE = 256  # Maximum number of primitive meshes kept in the cache (0 disables the cache)
+_PRIMITIVE_MESHES: "OrderedDict[Tuple, pv.DataSet]" = OrderedDict()
+_PRIMITIVE_MESH_KEYS: Dict[int, Tuple] = {}
+
 
 def translate(
     surf,
@@ -80,12 +88,129 @@ def translate(
         surf.points += np.array(center)
 
 
+def _prepare_mesh(
+    mesh: Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet],
+    set_mesh_direction: Optional[List[float]] = None,
+    original_mesh_direction: Optional[List[float]] = None,
+    recompute_normals: bool = True,
+):
+    """Orient a mesh and recompute its normals in place (see `Object3D`)."""
+    if set_mesh_direction is not None:
+        if original_mesh_direction is None:
+            original_mesh_direction = [1.0, 0.0, 0.0]
+        translate(mesh, (0, 0, 0), new_direction=set_mesh_direction, original_direction=original_mesh_direction)
+
+    # Avoid having averaging normals at shared points
+    # (pyvista behavior:https://docs.pyvista.org/api/core/_autosummary/pyvista.PolyData.compute_normals.html)
+    if mesh is not None and recompute_normals:
+        if isinstance(mesh, pv.MultiBlock):
+            for i in range(mesh.n_blocks):
+                mesh[i].compute_normals(inplace=True, cell_normals=False, split_vertices=True)
+        else:
+            mesh.compute_normals(inplace=True, cell_normals=False, split_vertices=True)
+
+
+def _as_key(value: Any) -> Hashable:
+    """Convert a geometric parameter (scalar, list or array) in a hashable key."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    return tuple(float(v) for v in np.ravel(value))
+
+
+def get_primitive_mesh(
+    key: Tuple,
+    build_mesh: Callable[[], pv.DataSet],
+    set_mesh_direction: Optional[List[float]] = None,
+    original_mesh_direction: Optional[List[float]] = None,
+    recompute_normals: bool = True,
+) -> pv.DataSet:
+    """
+    Get a primitive mesh from the cache of primitive meshes, building it on a cache miss.
+
+    The returned mesh is shared between all the objects created with the same geometric parameters and
+    must not be modified in place: `Object3D.mesh` gives each object its own copy on first access
+    (copy-on-write) while the exporters and engines read the shared mesh through `Object3D.shared_mesh`.
+
+    Args:
+        key (`Tuple`):
+            The geometric parameters of the primitive (with the name of the primitive).
+        build_mesh (`Callable[[], pyvista.DataSet]`):
+            Function building the mesh on a cache miss.
+        set_mesh_direction (`List[float]`, *optional*, defaults to `None`):
+            The direction of the mesh.
+        original_mesh_direction (`List[float]`, *optional*, defaults to `None`):
+            The original direction of the mesh.
+        recompute_normals (`bool`, *optional*, defaults to `True`):
+            Whether to recompute normals per vertex for the mesh.
+
+    Returns:
+        mesh (`pyvista.DataSet`):
+            The shared primitive mesh.
+    """
+    if set_mesh_direction is not None:
+        if original_mesh_direction is None:
+            original_mesh_direction = [1.0, 0.0, 0.0]
+        if not np.any(np.cross(original_mesh_direction, set_mesh_direction)):
+            set_mesh_direction = None  # Same orientation as `translate` would leave the mesh unchanged
+    key = tuple(_as_key(value) for value in key) + (_as_key(set_mesh_direction), recompute_normals)
+    mesh = _PRIMITIVE_MESHES.get(key)
+    if mesh is not None:
+        _PRIMITIVE_MESHES.move_to_end(key)
+        return mesh
+
+    mesh = build_mesh()
+    _prepare_mesh(mesh, set_mesh_direction, original_mesh_direction, recompute_normals)
+    if PRIMITIVE_MESH_CACHE_SIZE <= 0:
+        return mesh
+
+    _PRIMITIVE_MESHES[key] = mesh
+    _PRIMITIVE_MESH_KEYS[id(mesh)] = key
+    while len(_PRIMITIVE_MESHES) > PRIMITIVE_MESH_CACHE_SIZE:
+        _, evicted_mesh = _PRIMITIVE_MESHES.popitem(last=False)
+        del _PRIMITIVE_MESH_KEYS[id(evicted_mesh)]
+    return mesh
+
+
+def is_primitive_mesh(mesh: Any) -> bool:
+    """Whether a mesh is a shared mesh of the cache of primitive meshes."""
+    key = _PRIMITIVE_MESH_KEYS.get(id(mesh))
+    return key is not None and _PRIMITIVE_MESHES.get(key) is mesh
+
+
+def clear_primitive_mesh_cache():
+    """Empty the cache of primitive meshes. Objects already created keep their shared meshes."""
+    _PRIMITIVE_MESHES.clear()
+    _PRIMITIVE_MESH_KEYS.clear()
+
+
+_NODE_STATE_NOT_CLONED = frozenset(
+    ["_transform_store", "_transform_index", "_structural_hash", "_actor_cache", "_n_copies"]
+)
+
+
+def _clone_node_state(node: Asset, name: str) -> Asset:
+    """
+    Create a detached node of the same class as `node` from a shallow copy of its state (without its position in
+    the tree and its transform store), lists and arrays being copied. Used to create many copies of a freshly
+    created node without running the constructors again.
+    """
+    clone = object.__new__(type(node))
+    clone_state = clone.__dict__
+    for attribute, value in node.__dict__.items():
+        if attribute.startswith("_NodeMixin__") or attribute in _NODE_STATE_NOT_CLONED or isinstance(value, Asset):
+            continue
+        clone_state[attribute] = value.copy() if isinstance(value, (list, np.ndarray)) else value
+    clone.name = name
+    return clone
+
+
 class Object3D(Asset):
     """Create a 3D Object.
 
     Args:
-        mesh (`pyvista.[UnstructuredGrid, MultiBlock, PolyData, DataSet]`, *optional*, defaults to None):
-            The mesh of the object.
+        mesh (`pyvista.[UnstructuredGrid, MultiBlock, PolyData, DataSet]` or `LazyLoader`, *optional*,
+            defaults to None):
+            The mesh of the object. A `LazyLoader` is only loaded (and oriented) on first access of the mesh.
         material (`Material` or `List[Material]`, *optional*, defaults to None):
             The material of the object.
         name (`str`, *optional*, defaults to `None`):
@@ -113,10 +238,13 @@ class Object3D(Asset):
     """
 
     __NEW_ID = itertools.count()  # Singleton to count instances of the classes for automatic naming
+    _mesh = None
+    _mesh_is_shared = False
+    _mesh_loader = None
 
     def __init__(
         self,
-        mesh: Optional[Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet]] = None,
+        mesh: Optional[Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet, LazyLoader]] = None,
         material: Optional[Union[Material, List[Material]]] = None,
         name: Optional[str] = None,
         position: Optional[List[float]] = None,
@@ -141,26 +269,71 @@ class Object3D(Asset):
 
         self.mesh = mesh if mesh is not None else pv.PolyData()
 
-        if set_mesh_direction is not None:
-            if original_mesh_direction is None:
-                original_mesh_direction = [1.0, 0.0, 0.0]
-            translate(mesh, (0, 0, 0), new_direction=set_mesh_direction, original_direction=original_mesh_direction)
-
-        # Avoid having averaging normals at shared points
-        # (pyvista behavior:https://docs.pyvista.org/api/core/_autosummary/pyvista.PolyData.compute_normals.html)
-        if self.mesh is not None and recompute_normals:
-            if isinstance(self.mesh, pv.MultiBlock):
-                for i in range(self.mesh.n_blocks):
-                    self.mesh[i].compute_normals(inplace=True, cell_normals=False, split_vertices=True)
-            else:
-                self.mesh.compute_normals(inplace=True, cell_normals=False, split_vertices=True)
+        if self._mesh_loader is not None:
+            # Lazily loaded mesh: oriented when it is loaded
+            mesh_loader = self._mesh_loader
+
+            def load_mesh():
+                loaded_mesh = mesh_loader.load()
+                _prepare_mesh(loaded_mesh, set_mesh_direction, original_mesh_direction, recompute_normals)
+                return loaded_mesh
+
+            self._mesh_loader = LazyLoader(load_mesh)
+        # Meshes from the primitive mesh cache are already oriented and shared with other objects
+        elif is_primitive_mesh(self._mesh):
+            self._mesh_is_shared = True
+        else:
+            _prepare_mesh(self._mesh, set_mesh_direction, original_mesh_direction, recompute_normals)
 
         self.material = material if material is not None else Material()
 
-        if isinstance(self.material, (list, tuple)) or isinstance(self.mesh, pv.MultiBlock):
-            if not isinstance(self.mesh, pv.MultiBlock) or len(self.material) != self.mesh.n_blocks:
+        if self._mesh_loader is None and (
+            isinstance(self.material, (list, tuple)) or isinstance(self._mesh, pv.MultiBlock)
+        ):
+            if not isinstance(self._mesh, pv.MultiBlock) or len(self.material) != self._mesh.n_blocks:
                 raise ValueError("Number of materials must match number of blocks in mesh")
 
+    @property
+    def mesh(self) -> Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet]:
+        """
+        The mesh of the object.
+
+        Primitive meshes shared with other objects (see `get_primitive_mesh`) are copied on first access
+        so the returned mesh can be modified in place without affecting the other objects.
+        """
+        if self._mesh_is_shared:
+            self._mesh = self._mesh.copy()
+            self._mesh_is_shared = False
+        return self.shared_mesh
+
+    @mesh.setter
+    def mesh(self, mesh: Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet, LazyLoader]):
+        if isinstance(mesh, LazyLoader):
+            self._mesh, self._mesh_loader = None, mesh
+        else:
+            self._mesh, self._mesh_loader = mesh, None
+        self._mesh_is_shared = False
+
+    @property
+    def shared_mesh(self) -> Union[pv.UnstructuredGrid, pv.MultiBlock, pv.PolyData, pv.DataSet]:
+        """The mesh of the object without copying a shared primitive mesh. Should not be modified in place."""
+        if self._mesh_loader is not None:
+            self._mesh, self._mesh_loader = self._mesh_loader.load(), None
+        return self._mesh
+
+    @property
+    def is_mesh_loaded(self) -> bool:
+        """Whether the mesh of the object is loaded (`False` for a lazily loaded mesh not accessed yet)."""
+        return self._mesh_loader is None
+
+    def _prefetch(self):
+        """Load the lazily loaded mesh and textures of the object."""
+        _ = self.shared_mesh
+        materials = self.material if isinstance(self.material, (list, tuple)) else [self.material]
+        for material in materials:
+            if material is not None:
+                material.prefetch()
+
     def build_collider(
         self,
         max_convex_hulls=16,
@@ -199,7 +372,7 @@ class Object3D(Asset):
         find_best_plane : bool, optional
             Find best plane, by default False
         """
-        if self.mesh is None:
+        if self.shared_mesh is None:
             raise ValueError("Cannot build collider from empty mesh")
 
         kwargs = {
@@ -216,11 +389,11 @@ class Object3D(Asset):
         }
 
         collider_hulls = []
-        if isinstance(self.mesh, pv.MultiBlock):
-            for i in range(self.mesh.n_blocks):
-                collider_hulls.extend(compute_vhacd(self.mesh[i].points, self.mesh[i].faces, **kwargs))
+        if isinstance(self._mesh, pv.MultiBlock):
+            for i in range(self._mesh.n_blocks):
+                collider_hulls.extend(compute_vhacd(self._mesh[i].points, self._mesh[i].faces, **kwargs))
         else:
-            collider_hulls.extend(compute_vhacd(self.mesh.points, self.mesh.faces, **kwargs))
+            collider_hulls.extend(compute_vhacd(self._mesh.points, self._mesh.faces, **kwargs))
 
         if len(collider_hulls) == 1:
             mesh = pv.PolyData(collider_hulls[0][0], faces=collider_hulls[0][1])
@@ -255,12 +428,12 @@ class Object3D(Asset):
         share_material = kwargs.get("share_material", False)
         share_mesh = kwargs.get("share_mesh", False)
 
-        mesh_copy = None
-        if self.mesh is not None:
-            if share_mesh:
-                mesh_copy = self.mesh
+        mesh_copy = self._mesh_loader  # A lazily loaded mesh is loaded separately by the copy
+        if self._mesh is not None:
+            if share_mesh or self._mesh_is_shared:
+                mesh_copy = self._mesh
             else:
-                mesh_copy = self.mesh.copy()
+                mesh_copy = self._mesh.copy()
 
         material_copy = None
         if self.material is not None:
@@ -278,6 +451,7 @@ class Object3D(Asset):
         self._n_copies += 1
         instance_copy = type(self)(name=copy_name)
         instance_copy.mesh = mesh_copy
+        instance_copy._mesh_is_shared = self._mesh_is_shared  # Shared primitive meshes stay copy-on-write
         instance_copy.material = material_copy
         instance_copy.position = self.position
         instance_copy.rotation = self.rotation
@@ -294,6 +468,124 @@ class Object3D(Asset):
 
         return instance_copy
 
+    @classmethod
+    def batch(
+        cls,
+        positions: Union[List[List[float]], np.ndarray],
+        rotations: Optional[Union[List[List[float]], np.ndarray]] = None,
+        scalings: Optional[Union[float, List[List[float]], np.ndarray]] = None,
+        material: Optional[Union[Material, List[Material]]] = None,
+        name_prefix: Optional[str] = None,
+        parent: Optional["Asset"] = None,
+        **kwargs: Any,
+    ) -> List["Object3D"]:
+        """
+        Create a batch of objects of this class sharing the same geometry, e.g. the walls or obstacles of a map.
+
+        The object (mesh, collider, physics component) is built once from the keyword arguments and the batch is
+        created from it: the nodes share the (copy-on-write) mesh, their colliders are copies of the first one
+        and the transforms are computed for the whole batch at once.
+
+        Args:
+            positions (`np.ndarray` or `List[List[float]]`):
+                The (N, 3) positions of the objects.
+            rotations (`np.ndarray` or `List[List[float]]`, *optional*, defaults to `None`):
+                The (N, 3) rotations in Euler angles (in degrees) or (N, 4) quaternions of the objects.
+            scalings (`float` or `np.ndarray` or `List[List[float]]`, *optional*, defaults to `None`):
+                The scaling of all the objects or their (N,) or (N, 3) scalings.
+            material (`Material` or `List[Material]`, *optional*, defaults to `None`):
+                The material shared by all the objects. If `None`, each object gets its own default material.
+            name_prefix (`str`, *optional*, defaults to `None`):
+                The objects are named `{name_prefix}_{index}`. If `None`, they are named like other objects.
+            parent (`Asset`, *optional*, defaults to `None`):
+                The parent of the objects.
+            **kwargs:
+                The other arguments of the class (e.g. `bounds` and `with_collider` for a `Box`).
+
+        Returns:
+            objects (`List[Object3D]`):
+                The created objects.
+
+        Example:
+        ```python
+        walls = sm.Box.batch(positions=wall_positions, scalings=wall_scalings, name_prefix="wall", parent=scene)
+        ```
+        """
+        positions = np.array(positions, dtype=float)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("positions should be an array of shape (N, 3)")
+        n_objects = len(positions)
+
+        if rotations is None:
+            rotations = np.tile([0.0, 0.0, 0.0, 1.0], (n_objects, 1))
+        else:
+            rotations = np.array(rotations, dtype=float)
+            if rotations.shape == (n_objects, 3):
+                rotations = quaternions_from_euler_degrees(rotations)
+            elif rotations.shape != (n_objects, 4):
+                raise ValueError("rotations should be an array of shape (N, 3) (Euler angles) or (N, 4) (Quaternions)")
+            # Normalized row by row to give the same quaternions as the rotation setter
+            rotations = np.array([rotation / np.linalg.norm(rotation) for rotation in rotations])
+
+        scalings = np.array(1.0 if scalings is None else scalings, dtype=float)
+        if scalings.ndim < 2:
+            scalings = scalings.reshape(-1, 1)
+        scalings = np.broadcast_to(scalings, (n_objects, 3)).copy()
+
+        if kwargs.get("is_actor"):
+            raise ValueError("Actors can not be created in batch")
+        prototype = cls(material=material, **kwargs)
+
+        if name_prefix is not None:
+            names = [f"{name_prefix}_{i}" for i in range(n_objects)]
+        else:
+            new_id = getattr(cls, f"_{cls.__name__}__NEW_ID")
+            names = [camelcase_to_snakecase(cls.__name__ + f"_{next(new_id):02d}") for _ in range(n_objects)]
+
+        # The objects are cloned from the state of the prototype instead of running the constructors again
+        prototype._mesh_is_shared = True  # All the objects share the mesh of the prototype (copy-on-write)
+        child_suffixes = [child.name[len(prototype.name) :] for child in prototype.tree_children]
+        transform_store = TransformStore.get_active_store()
+        if transform_store is not None:
+            # The transforms of the prototype are moved back in its nodes to be cloned
+            for node in (prototype,) + prototype.tree_descendants:
+                transform_store.remove(node)
+        objects = []
+        for i in range(n_objects):
+            instance = _clone_node_state(prototype, names[i])
+            if material is None:
+                instance.material = Material()
+            if prototype.physics_component is not None:
+                instance.physics_component = dataclasses.replace(prototype.physics_component)
+            if transform_store is not None:
+                transform_store.add(instance)
+            instance._position = positions[i]
+            instance._rotation = rotations[i]
+            instance._scaling = scalings[i]
+            instance._transformation_matrix = None
+            if child_suffixes:
+                instance.tree_children = [
+                    _clone_node_state(child, names[i] + suffix)
+                    for child, suffix in zip(prototype.tree_children, child_suffixes)
+                ]
+                if transform_store is not None:
+                    for child in instance.tree_children:
+                        transform_store.add(child)
+            objects.append(instance)
+
+        if parent is not None:
+            parent.tree_children = tuple(parent.tree_children) + tuple(objects)
+        return objects
+
+    def _structural_content(self) -> Tuple:
+        """Add the identity of the mesh and material objects to the structural content of the node."""
+        if isinstance(self.material, (list, tuple)):
+            material_id = tuple(id(material) for material in self.material)
+        else:
+            material_id = id(self.material)
+        mesh_id = id(self._mesh_loader) if self._mesh_loader is not None else id(self._mesh)
+        return super()._structural_content() + (mesh_id, material_id)
+
     def _post_name_change(self, value: Any):
         """NodeMixing method call after changing the name of a node."""
         for node in self.tree_children:
@@ -302,10 +594,12 @@ class Object3D(Asset):
 
     def _repr_info_str(self) -> str:
         """Used to add additional information to the __repr__ method."""
-        if isinstance(self.mesh, pv.MultiBlock):
-            mesh_str = f"Mesh(Multiblock, n_blocks={self.mesh.n_blocks}"
+        if self._mesh_loader is not None:
+            mesh_str = "Mesh(not loaded)"
+        elif isinstance(self._mesh, pv.MultiBlock):
+            mesh_str = f"Mesh(Multiblock, n_blocks={self._mesh.n_blocks}"
         else:
-            mesh_str = f"Mesh(points={self.mesh.n_points}, cells={self.mesh.n_cells})"
+            mesh_str = f"Mesh(points={self._mesh.n_points}, cells={self._mesh.n_cells})"
         material_str = ""
         if hasattr(self, "material") and self.material is not None:
             base_color_str = ", ".join(f"{val:.1f}" for val in self.material.base_color)
@@ -313,7 +607,7 @@ class Object3D(Asset):
         return f"{mesh_str}{material_str}"
 
     def plot(self, **kwargs):
-        self.mesh.plot(**kwargs)
+        self.shared_mesh.plot(**kwargs)
 
 
 class Plane(Object3D):
@@ -373,12 +667,17 @@ class Plane(Object3D):
         **kwargs: Any,
     ):
         original_mesh_direction = [0, -1, 0]
-        mesh = pv.Plane(
-            direction=original_mesh_direction,
-            i_size=i_size,
-            j_size=j_size,
-            i_resolution=i_resolution,
-            j_resolution=j_resolution,
+        mesh = get_primitive_mesh(
+            ("plane", i_size, j_size, i_resolution, j_resolution),
+            lambda: pv.Plane(
+                direction=original_mesh_direction,
+                i_size=i_size,
+                j_size=j_size,
+                i_resolution=i_resolution,
+                j_resolution=j_resolution,
+            ),
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=original_mesh_direction,
         )
 
         super().__init__(
@@ -474,20 +773,40 @@ class Sphere(Object3D):
         if sphere_type not in ["uv", "ico"]:
             raise ValueError("Sphere type should be one of 'uv' or 'ico'.")
 
-        from vtkmodules.vtkFiltersSources import vtkSphereSource
-
-        sphere = vtkSphereSource()
-        sphere.SetRadius(radius)
-        sphere.SetThetaResolution(theta_resolution)
-        sphere.SetPhiResolution(phi_resolution)
-        sphere.SetStartTheta(start_theta)
-        sphere.SetEndTheta(end_theta)
-        sphere.SetStartPhi(start_phi)
-        sphere.SetEndPhi(end_phi)
-        sphere.SetLatLongTessellation(bool(sphere_type == "uv"))
-        sphere.Update()
-        mesh = pv.wrap(sphere.GetOutput())
-        mesh.rotate_y(-90, inplace=True)
+        def build_mesh():
+            from vtkmodules.vtkFiltersSources import vtkSphereSource
+
+            sphere = vtkSphereSource()
+            sphere.SetRadius(radius)
+            sphere.SetThetaResolution(theta_resolution)
+            sphere.SetPhiResolution(phi_resolution)
+            sphere.SetStartTheta(start_theta)
+            sphere.SetEndTheta(end_theta)
+            sphere.SetStartPhi(start_phi)
+            sphere.SetEndPhi(end_phi)
+            sphere.SetLatLongTessellation(bool(sphere_type == "uv"))
+            sphere.Update()
+            sphere_mesh = pv.wrap(sphere.GetOutput())
+            sphere_mesh.rotate_y(-90, inplace=True)
+            return sphere_mesh
+
+        mesh = get_primitive_mesh(
+            (
+                "sphere",
+                radius,
+                theta_resolution,
+                phi_resolution,
+                start_theta,
+                end_theta,
+                start_phi,
+                end_phi,
+                sphere_type,
+            ),
+            build_mesh,
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=[0, 1, 0],
+            recompute_normals=False,
+        )
 
         super().__init__(
             name=name,
@@ -573,17 +892,24 @@ class Capsule(Object3D):
         if sphere_type not in ["uv", "ico"]:
             raise ValueError("Sphere type should be one of 'uv' or 'ico'.")
 
-        from vtkmodules.vtkFiltersSources import vtkCapsuleSource
-
-        capsule = vtkCapsuleSource()  # TODO pyvista capsules are arranged on the side
-        capsule.SetRadius(radius)
-        capsule.SetCylinderLength(max(0.0, height - radius * 2))
-        capsule.SetThetaResolution(theta_resolution)
-        capsule.SetPhiResolution(phi_resolution)
-        capsule.SetLatLongTessellation(bool(sphere_type == "uv"))
-        capsule.Update()
-
-        mesh = pv.wrap(capsule.GetOutput())
+        def build_mesh():
+            from vtkmodules.vtkFiltersSources import vtkCapsuleSource
+
+            capsule = vtkCapsuleSource()  # TODO pyvista capsules are arranged on the side
+            capsule.SetRadius(radius)
+            capsule.SetCylinderLength(max(0.0, height - radius * 2))
+            capsule.SetThetaResolution(theta_resolution)
+            capsule.SetPhiResolution(phi_resolution)
+            capsule.SetLatLongTessellation(bool(sphere_type == "uv"))
+            capsule.Update()
+            return pv.wrap(capsule.GetOutput())
+
+        mesh = get_primitive_mesh(
+            ("capsule", height, radius, theta_resolution, phi_resolution, sphere_type),
+            build_mesh,
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=[0, 1, 0],
+        )
 
         super().__init__(
             mesh=mesh,
@@ -658,8 +984,13 @@ class Cylinder(Object3D):
         **kwargs: Any,
     ):
         original_mesh_direction = [0, 1, 0]
-        mesh = pv.Cylinder(
-            direction=original_mesh_direction, radius=radius, height=height, resolution=resolution, capping=capping
+        mesh = get_primitive_mesh(
+            ("cylinder", height, radius, resolution, capping),
+            lambda: pv.Cylinder(
+                direction=original_mesh_direction, radius=radius, height=height, resolution=resolution, capping=capping
+            ),
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=original_mesh_direction,
         )
 
         super().__init__(
@@ -748,7 +1079,12 @@ class Box(Object3D):
                 bounds[2] / 2,
             )  # Make it a tuple
 
-        mesh = pv.Box(bounds=bounds, level=level, quads=quads)
+        mesh = get_primitive_mesh(
+            ("box", bounds, level, quads),
+            lambda: pv.Box(bounds=bounds, level=level, quads=quads),
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=[0, 1, 0],
+        )
 
         super().__init__(
             mesh=mesh,
@@ -823,7 +1159,12 @@ class Cone(Object3D):
         **kwargs: Any,
     ):
         original_mesh_direction = [0, 1, 0]
-        mesh = pv.Cone(direction=original_mesh_direction, height=height, radius=radius, resolution=resolution)
+        mesh = get_primitive_mesh(
+            ("cone", height, radius, resolution),
+            lambda: pv.Cone(direction=original_mesh_direction, height=height, radius=radius, resolution=resolution),
+            set_mesh_direction=set_mesh_direction,
+            original_mesh_direction=original_mesh_direction,
+        )
         super().__init__(
             mesh=mesh,
             name=name,
@@ -17,13 +17,13 @@
 import itertools
 from cmath import inf
 from dataclasses import InitVar, dataclass
-from typing import Any, ClassVar, List, Optional, Tuple, Union
+from typing import Any, ClassVar, List, Optional, Union
 
 import numpy as np
 from dataclasses_json import dataclass_json
 
 from ..utils import logging
-from .asset import Asset, get_transform_from_trs, get_trs_from_transform_matrix, rotation_from_euler_degrees
+from .asset import Asset
 from .gltf_extension import GltfExtensionMixin
 
 
@@ -173,178 +173,14 @@ class StateSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_state_senso
         return spaces.Box(low=-inf, high=inf, shape=[get_state_sensor_n_properties(self)], dtype=np.float32)
 
     ##############################
-    # Properties copied from Asset()
-    # We need to redefine them here otherwise the dataclass lose them since
+    # Transform properties shared with Asset()
+    # We need to re-expose them here otherwise the dataclass lose them since
     # they are also in the __init__ signature
-    #
-    # Need to be updated if Asset() is updated
     ##############################
-    @property
-    def position(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the position of the sensor in the scene.
-
-        Returns:
-            position (`List[float]` or `np.ndarray`):
-                The position of the sensor in the scene.
-        """
-        return self._position
-
-    @property
-    def rotation(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the rotation of the sensor in the scene.
-
-        Returns:
-            rotation (`List[float]` or `np.ndarray`):
-                The rotation of the sensor in the scene.
-        """
-        return self._rotation
-
-    @property
-    def scaling(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the scaling of the sensor in the scene.
-
-        Returns:
-            scaling (`List[float]` or `np.ndarray`):
-                The scaling of the sensor in the scene.
-        """
-        return self._scaling
-
-    @property
-    def transformation_matrix(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the transformation matrix of the sensor in the scene.
-
-        Returns:
-            transformation_matrix (`List[float]` or `np.ndarray`):
-                The transformation matrix of the sensor in the scene.
-        """
-        if self._transformation_matrix is None:
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-        return self._transformation_matrix
-
-    # setters for position/rotation/scale
-
-    @position.setter
-    def position(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the position of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The position of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
-        if not np.array_equal(self._position, new_position):
-            self._position = new_position
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @rotation.setter
-    def rotation(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the rotation of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The rotation of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
-        if not np.array_equal(self._rotation, new_rotation):
-            self._rotation = new_rotation
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @scaling.setter
-    def scaling(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the scaling of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The scaling of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
-        if not np.array_equal(self._scaling, new_scaling):
-            self._scaling = new_scaling
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @transformation_matrix.setter
-    def transformation_matrix(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the transformation matrix of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The transformation matrix of the sensor in the scene.
-        """
-        # Default to setting up from TRS if None
-        if (value is None or isinstance(value, property)) and (
-            self._position is not None and self._rotation is not None and self._scaling is not None
-        ):
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-            return
-
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_transformation_matrix = np.array(value)
-        if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
-            self._transformation_matrix = new_transformation_matrix
-
-            translation, rotation, scale = get_trs_from_transform_matrix(self._transformation_matrix)
-            self._position = translation
-            self._rotation = rotation
-            self._scaling = scale
-
-            self._post_asset_modification()
+    position = Asset.position
+    rotation = Asset.rotation
+    scaling = Asset.scaling
+    transformation_matrix = Asset.transformation_matrix
 
 
 @dataclass_json
@@ -429,175 +265,11 @@ class RaycastSensor(Asset, GltfExtensionMixin, gltf_extension_name="HF_raycast_s
         return spaces.Box(low=-inf, high=inf, shape=[self.n_horizontal_rays * self.n_vertical_rays], dtype=np.float32)
 
     ##############################
-    # Properties copied from Asset()
-    # We need to redefine them here otherwise the dataclass lose them since
+    # Transform properties shared with Asset()
+    # We need to re-expose them here otherwise the dataclass lose them since
     # they are also in the __init__ signature
-    #
-    # Need to be updated if Asset() is updated
     ##############################
-    @property
-    def position(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the position of the sensor in the scene.
-
-        Returns:
-            position (`List[float]` or `np.ndarray`):
-                The position of the sensor in the scene.
-        """
-        return self._position
-
-    @property
-    def rotation(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the rotation of the sensor in the scene.
-
-        Returns:
-            rotation (`List[float]` or `np.ndarray`):
-                The rotation of the sensor in the scene.
-        """
-        return self._rotation
-
-    @property
-    def scaling(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the scaling of the sensor in the scene.
-
-        Returns:
-            scaling (`List[float]` or `np.ndarray`):
-                The scaling of the sensor in the scene.
-        """
-        return self._scaling
-
-    @property
-    def transformation_matrix(self) -> Union[List[float], np.ndarray]:
-        """
-        Get the transformation matrix of the sensor in the scene.
-
-        Returns:
-            transformation_matrix (`List[float]` or `np.ndarray`):
-                The transformation matrix of the sensor in the scene.
-        """
-        if self._transformation_matrix is None:
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-        return self._transformation_matrix
-
-    # setters for position/rotation/scale
-
-    @position.setter
-    def position(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the position of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The position of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) != 3:
-                raise ValueError("position should be of size 3 (X, Y, Z)")
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            else:
-                raise TypeError("Position must be a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_position = np.array(value)
-        if not np.array_equal(self._position, new_position):
-            self._position = new_position
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @rotation.setter
-    def rotation(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the rotation of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The rotation of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [0.0, 0.0, 0.0, 1.0]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = rotation_from_euler_degrees(*value)
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 4:
-                value = [float(v) for v in value]
-            else:
-                raise ValueError("Rotation should be of size 3 (Euler angles) or 4 (Quaternions")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_rotation = np.array(value) / np.linalg.norm(value)
-        if not np.array_equal(self._rotation, new_rotation):
-            self._rotation = new_rotation
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @scaling.setter
-    def scaling(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the scaling of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The scaling of the sensor in the scene.
-        """
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [1.0, 1.0, 1.0]
-            elif isinstance(value, (int, float)):
-                value = [value, value, value]
-            elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == 3:
-                value = [float(v) for v in value]
-            elif not isinstance(value, np.ndarray):
-                raise TypeError("Scale must be a float or a list of 3 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_scaling = np.array(value)
-        if not np.array_equal(self._scaling, new_scaling):
-            self._scaling = new_scaling
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-
-            self._post_asset_modification()
-
-    @transformation_matrix.setter
-    def transformation_matrix(self, value: Optional[Union[float, List[float], property, Tuple, np.ndarray]] = None):
-        """
-        Set the transformation matrix of the sensor in the scene.
-
-        Args:
-            value (`float` or `List[float]` or `np.ndarray` or `Tuple` or `property`, *optional*, defaults to `None`):
-                The transformation matrix of the sensor in the scene.
-        """
-        # Default to setting up from TRS if None
-        if (value is None or isinstance(value, property)) and (
-            self._position is not None and self._rotation is not None and self._scaling is not None
-        ):
-            self._transformation_matrix = get_transform_from_trs(self._position, self._rotation, self._scaling)
-            return
-
-        if self.dimensionality == 3:
-            if value is None or isinstance(value, property):
-                value = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-            elif not isinstance(value, (list, tuple, np.ndarray)):
-                raise TypeError("Transformation matrix must be a list of 4 lists of 4 numbers")
-        elif self.dimensionality == 2:
-            raise NotImplementedError()
-
-        new_transformation_matrix = np.array(value)
-        if not np.array_equal(self._transformation_matrix, new_transformation_matrix):
-            self._transformation_matrix = new_transformation_matrix
-
-            translation, rotation, scale = get_trs_from_transform_matrix(self._transformation_matrix)
-            self._position = translation
-            self._rotation = rotation
-            self._scaling = scale
-
-            self._post_asset_modification()
+    position = Asset.position
+    rotation = Asset.rotation
+    scaling = Asset.scaling
+    transformation_matrix = Asset.transformation_matrix
@@ -7,12 +7,12 @@
 # THE SOFTWARE.
 
 import warnings
-from typing import Any, List, Optional, Sequence, Type, Union
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Type, Union
 
 import numpy as np
 
 from ...utils import logging
-from .space import Space
+from .space import Space, batch_shape_to_tuple, split_batch_shape
 
 
 logger = logging.get_logger(__name__)
@@ -112,9 +112,24 @@ class Box(Space):
         # Boolean arrays which indicate the interval type for each coordinate
         self.bounded_below = -np.inf < self.low
         self.bounded_above = np.inf > self.high
+        self._compute_sampling_masks()
 
         super(Box, self).__init__(self.shape, self.dtype, seed)
 
+    def _compute_sampling_masks(self):
+        """Precompute the masks classifying the coordinates according to interval type, and their bounds."""
+        self._unbounded = ~self.bounded_below & ~self.bounded_above
+        self._upp_bounded = ~self.bounded_below & self.bounded_above
+        self._low_bounded = self.bounded_below & ~self.bounded_above
+        self._bounded = self.bounded_below & self.bounded_above
+        self._n_unbounded = int(np.count_nonzero(self._unbounded))
+
+        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
+        self._low_bounded_low = self.low[self._low_bounded]
+        self._upp_bounded_high = self.high[self._upp_bounded]
+        self._bounded_low = self.low[self._bounded]
+        self._bounded_high = high[self._bounded]
+
     def is_bounded(self, manner: str = "both") -> bool:
         """
         Check if the box is bounded.
@@ -138,9 +153,9 @@ class Box(Space):
         else:
             raise ValueError("manner is not in {'below', 'above', 'both'}")
 
-    def sample(self) -> np.ndarray:
+    def sample(self, n: Optional[int] = None) -> np.ndarray:
         """
-        Generates a single random sample inside the Box.
+        Generates a single random sample inside the Box (or `n` samples with `sample_batch`).
 
         In creating a sample of the box, each coordinate is sampled according to
         the form of the interval:
@@ -150,35 +165,71 @@ class Box(Space):
         * (-oo, b] : shifted negative exponential distribution
         * (-oo, oo) : normal distribution
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, generate a batch of `n` samples of shape `(n, *shape)`.
+
         Returns:
             sample (`np.ndarray`):
                 Random sample inside the box.
         """
-        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
-        sample = np.empty(self.shape)
+        return self.sample_batch(() if n is None else n)
 
-        # Masking arrays which classify the coordinates according to interval
-        # type
-        unbounded = ~self.bounded_below & ~self.bounded_above
-        upp_bounded = ~self.bounded_below & self.bounded_above
-        low_bounded = self.bounded_below & ~self.bounded_above
-        bounded = self.bounded_below & self.bounded_above
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> np.ndarray:
+        """
+        Generates a batch of random samples inside the Box, sampled like in `sample`.
 
-        # Vectorized sampling by interval type
-        sample[unbounded] = self.np_random.normal(size=unbounded[unbounded].shape)
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`np.ndarray`):
+                Random samples inside the box, of shape `(*batch_shape, *shape)`.
+        """
+        batch_shape = batch_shape_to_tuple(batch_shape)
+        sample = np.empty(batch_shape + self.shape)
+
+        # Vectorized sampling by interval type, with the masks on the last dimensions
+        sample[..., self._unbounded] = self.np_random.normal(size=batch_shape + (self._n_unbounded,))
 
-        sample[low_bounded] = self.np_random.exponential(size=low_bounded[low_bounded].shape) + self.low[low_bounded]
+        sample[..., self._low_bounded] = (
+            self.np_random.exponential(size=batch_shape + self._low_bounded_low.shape) + self._low_bounded_low
+        )
 
-        sample[upp_bounded] = -self.np_random.exponential(size=upp_bounded[upp_bounded].shape) + self.high[upp_bounded]
+        sample[..., self._upp_bounded] = (
+            -self.np_random.exponential(size=batch_shape + self._upp_bounded_high.shape) + self._upp_bounded_high
+        )
 
-        sample[bounded] = self.np_random.uniform(
-            low=self.low[bounded], high=high[bounded], size=bounded[bounded].shape
+        sample[..., self._bounded] = self.np_random.uniform(
+            low=self._bounded_low, high=self._bounded_high, size=batch_shape + self._bounded_low.shape
         )
         if self.dtype.kind == "i":
             sample = np.floor(sample)
 
         return sample.astype(self.dtype)
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each sample of a batch is inside the box.
+
+        Args:
+            x (`np.ndarray`):
+                Batch of samples to check, of shape `(*batch_shape, *shape)`.
+
+        Returns:
+            inside (`np.ndarray`):
+                Boolean array of shape `batch_shape`, whether each sample is inside the box.
+        """
+        if not isinstance(x, np.ndarray):
+            x = np.asarray(x, dtype=self.dtype)
+
+        batch_shape, matches = split_batch_shape(x, self.shape)
+        if not matches or not np.can_cast(x.dtype, self.dtype):
+            return np.zeros(batch_shape, dtype=bool)
+        sample_axes = tuple(range(len(batch_shape), x.ndim))
+        return np.all((x >= self.low) & (x <= self.high), axis=sample_axes)
+
     def contains(self, x: Any) -> bool:
         """
         Check if a sample is inside the box.
@@ -230,6 +281,11 @@ class Box(Space):
         """
         return [np.asarray(sample) for sample in sample_n]
 
+    def __setstate__(self, state: Union[Iterable, Mapping]):
+        super().__setstate__(state)
+        if "_bounded" not in self.__dict__:
+            self._compute_sampling_masks()  # Pickled before the masks were precomputed
+
     def __repr__(self) -> str:
         return f"Box({self.low}, {self.high}, {self.shape}, {self.dtype})"
 
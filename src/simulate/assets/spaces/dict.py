@@ -7,6 +7,7 @@
 # THE SOFTWARE.
 import typing
 from collections import OrderedDict
+from functools import reduce
 from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
@@ -125,16 +126,36 @@ class Dict(Space):
 
         return seeds
 
-    def sample(self) -> OrderedDict:
+    def sample(self, n: Optional[int] = None) -> OrderedDict:
         """
         Sample a random element for each space in the dict.
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch`.
+
         Returns:
             samples (`OrderedDict`):
                 The sampled elements.
         """
+        if n is not None:
+            return self.sample_batch(n)
         return OrderedDict([(k, space.sample()) for k, space in self.spaces.items()])
 
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> OrderedDict:
+        """
+        Sample a batch of random elements for each space in the dict.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`OrderedDict`):
+                The batch of sampled elements of each space.
+        """
+        return OrderedDict([(k, space.sample_batch(batch_shape)) for k, space in self.spaces.items()])
+
     def contains(self, x: Any) -> bool:
         """
         Check if the given element is contained in one of the spaces.
@@ -156,6 +177,24 @@ class Dict(Space):
                 return False
         return True
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each element of a batch (a dict of batches of the elements of each space) is contained in the spaces.
+
+        Args:
+            x (`dict`):
+                The batch of elements to check.
+
+        Returns:
+            contained (`np.ndarray`):
+                Boolean array of shape `batch_shape`, whether each element is contained in the spaces.
+        """
+        if not isinstance(x, dict) or set(x) != set(self.spaces):
+            raise ValueError(f"The batch should be a dict of batches with the keys {list(self.spaces)}")
+        return reduce(
+            np.logical_and, (space.contains_batch(x[k]) for k, space in self.spaces.items()), np.ones((), dtype=bool)
+        )
+
     def __getitem__(self, key: Union[int, str]) -> Space:
         return self.spaces[key]
 
@@ -6,11 +6,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence, Union
 
 import numpy as np
 
-from .space import Space
+from .space import Space, batch_shape_to_tuple
 
 
 class Discrete(Space):
@@ -35,16 +35,36 @@ class Discrete(Space):
         self.n = n
         super(Discrete, self).__init__((), np.int64, seed)
 
-    def sample(self) -> int:
+    def sample(self, n: Optional[int] = None) -> Union[int, np.ndarray]:
         """
         Sample a random element of this space.
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch`.
+
         Returns:
             sample (`int`):
                 A random element of this space.
         """
+        if n is not None:
+            return self.sample_batch(n)
         return self.np_random.randint(self.n)
 
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> np.ndarray:
+        """
+        Sample a batch of random elements of this space.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`np.ndarray`):
+                Random elements of this space, of shape `batch_shape`.
+        """
+        return self.np_random.randint(self.n, size=batch_shape_to_tuple(batch_shape), dtype=self.dtype)
+
     def contains(self, x: Any) -> bool:
         """
         Check if `x` is a valid element of this space.
@@ -67,6 +87,23 @@ class Discrete(Space):
             return False
         return 0 <= as_int < self.n
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each element of a batch is a valid element of this space.
+
+        Args:
+            x (`np.ndarray`):
+                The batch of elements to check.
+
+        Returns:
+            valid (`np.ndarray`):
+                Boolean array of the shape of `x`, whether each element is a valid element of this space.
+        """
+        x = np.asarray(x)
+        if x.dtype.char not in np.typecodes["AllInteger"]:
+            return np.zeros(x.shape, dtype=bool)
+        return (0 <= x) & (x < self.n)
+
     def __repr__(self) -> str:
         return "Discrete(%d)" % self.n
 
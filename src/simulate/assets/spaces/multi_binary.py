@@ -6,11 +6,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 import numpy as np
 
-from .space import Space
+from .space import Space, batch_shape_to_tuple, split_batch_shape
 
 
 class MultiBinary(Space):
@@ -41,16 +41,37 @@ class MultiBinary(Space):
             input_n = (n,)
         super(MultiBinary, self).__init__(input_n, np.int8, seed)
 
-    def sample(self) -> Union[np.ndarray, List[np.ndarray]]:
+    def sample(self, n: Optional[int] = None) -> Union[np.ndarray, List[np.ndarray]]:
         """
         Sample a random element of this space.
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch`.
+
         Returns:
             sample (`np.ndarray` or `List[np.ndarray]`):
                 A random element of this space.
         """
+        if n is not None:
+            return self.sample_batch(n)
         return self.np_random.randint(low=0, high=2, size=self.n, dtype=self.dtype)
 
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> np.ndarray:
+        """
+        Sample a batch of random elements of this space.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`np.ndarray`):
+                Random elements of this space, of shape `(*batch_shape, *shape)`.
+        """
+        batch_shape = batch_shape_to_tuple(batch_shape)
+        return self.np_random.randint(low=0, high=2, size=batch_shape + self.shape, dtype=self.dtype)
+
     def contains(self, x: Any) -> bool:
         """
         Check if `x` is a valid element of this space.
@@ -69,6 +90,24 @@ class MultiBinary(Space):
             return False
         return ((x == 0) | (x == 1)).all()
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each element of a batch is a valid element of this space.
+
+        Args:
+            x (`np.ndarray`):
+                The batch of elements to check, of shape `(*batch_shape, *shape)`.
+
+        Returns:
+            valid (`np.ndarray`):
+                Boolean array of shape `batch_shape`, whether each element is a valid element of this space.
+        """
+        x = np.asarray(x)
+        batch_shape, matches = split_batch_shape(x, self.shape)
+        if not matches:
+            return np.zeros(batch_shape, dtype=bool)
+        return np.all((x == 0) | (x == 1), axis=tuple(range(len(batch_shape), x.ndim)))
+
     def to_jsonable(self, sample_n: List[Any]):
         """
         Convert a sample from this space to a JSONable type.
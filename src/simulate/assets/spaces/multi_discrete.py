@@ -6,13 +6,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any, List, Optional, Tuple, Type, Union
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 
 from ...utils import logging
 from .discrete import Discrete
-from .space import Space
+from .space import Space, batch_shape_to_tuple, split_batch_shape
 
 
 logger = logging.get_logger(__name__)
@@ -53,15 +53,34 @@ class MultiDiscrete(Space):
 
         super(MultiDiscrete, self).__init__(self.nvec.shape, dtype, seed)
 
-    def sample(self) -> Tuple[Any, ...]:
+    def sample(self, n: Optional[int] = None) -> Tuple[Any, ...]:
         """
         Sample a random element of this space.
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch`.
+
         Returns:
             sample (`Tuple[Any, ...]`):
                 A random element of this space.
         """
-        return (self.np_random.random_sample(self.nvec.shape) * self.nvec).astype(self.dtype)
+        return self.sample_batch(() if n is None else n)
+
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> np.ndarray:
+        """
+        Sample a batch of random elements of this space.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`np.ndarray`):
+                Random elements of this space, of shape `(*batch_shape, *nvec.shape)`.
+        """
+        batch_shape = batch_shape_to_tuple(batch_shape)
+        return (self.np_random.random_sample(batch_shape + self.nvec.shape) * self.nvec).astype(self.dtype)
 
     def contains(self, x: Any) -> bool:
         """
@@ -81,6 +100,24 @@ class MultiDiscrete(Space):
         # is within correct bounds for space dtype (even though x does not have to be unsigned)
         return x.shape == self.shape and (0 <= x).all() and (x < self.nvec).all()
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each value of a batch is a valid value in this space.
+
+        Args:
+            x (`np.ndarray`):
+                Batch of values to check, of shape `(*batch_shape, *nvec.shape)`.
+
+        Returns:
+            valid (`np.ndarray`):
+                Boolean array of shape `batch_shape`, whether each value is a valid value in this space.
+        """
+        x = np.asarray(x)
+        batch_shape, matches = split_batch_shape(x, self.shape)
+        if not matches:
+            return np.zeros(batch_shape, dtype=bool)
+        return np.all((0 <= x) & (x < self.nvec), axis=tuple(range(len(batch_shape), x.ndim)))
+
     def to_jsonable(self, sample_n: np.ndarray) -> List[Any]:
         """
         Convert a sample from this space to a JSONable type.
@@ -12,6 +12,27 @@ import numpy as np
 from . import seeding
 
 
+def batch_shape_to_tuple(batch_shape: Union[int, Sequence[int]]) -> Tuple[int, ...]:
+    """Convert the shape of a batch of samples given as an integer or a sequence to a tuple."""
+    if isinstance(batch_shape, (int, np.integer)):
+        return (int(batch_shape),)
+    return tuple(int(dim) for dim in batch_shape)
+
+
+def split_batch_shape(x: np.ndarray, shape: Tuple[int, ...]) -> Tuple[Tuple[int, ...], bool]:
+    """
+    Split the shape of a batch of samples in the batch dimensions and the dimensions of a sample.
+
+    Returns:
+        batch_shape (`Tuple[int, ...]`):
+            The leading dimensions of `x`, before the dimensions of a sample.
+        matches (`bool`):
+            Whether the last dimensions of `x` are the shape of the samples.
+    """
+    n_batch_dims = max(x.ndim - len(shape), 0)
+    return x.shape[:n_batch_dims], x.shape[n_batch_dims:] == tuple(shape)
+
+
 class Space(object):
     """
     Defines the observation and action spaces, so you can write generic
@@ -69,10 +90,46 @@ class Space(object):
         """
         return self._shape
 
-    def sample(self) -> Any:
+    def sample(self, n: Optional[int] = None) -> Any:
         """
         Randomly sample an element of this space.
         Can be uniform or non-uniform sampling based on boundedness of space.
+
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch(n)` instead of a single element.
+        """
+        raise NotImplementedError
+
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> Any:
+        """
+        Randomly sample a batch of elements of this space, in a single call to the random number generator
+        for each (sub)space.
+
+        The batch dimensions come first: a batch of a `Box` of shape `(3,)` with `batch_shape=(8,)` is an array of
+        shape `(8, 3)`, a batch of a `Dict` is a dict of batches.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`Any`):
+                The batch of elements.
+        """
+        raise NotImplementedError
+
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if each element of a batch (as returned by `sample_batch`) is a valid sample from this space.
+
+        Args:
+            x (`Any`):
+                The batch of elements to check.
+
+        Returns:
+            contains (`np.ndarray`):
+                The boolean array of shape `batch_shape` telling whether each element is in the space.
         """
         raise NotImplementedError
 
@@ -6,7 +6,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import typing
-from typing import Any, List, Optional, Union
+from functools import reduce
+from typing import Any, List, Optional, Sequence, Union
 
 import numpy as np
 
@@ -77,16 +78,36 @@ class Tuple(Space):
 
         return seeds
 
-    def sample(self) -> typing.Tuple[Any, ...]:
+    def sample(self, n: Optional[int] = None) -> typing.Tuple[Any, ...]:
         """
         Sample a random element of this space.
 
+        Args:
+            n (`int`, *optional*, defaults to `None`):
+                If given, sample a batch of `n` elements with `sample_batch`.
+
         Returns:
             sample (`Tuple[Any, ...]`):
                 Sampled elements from the spaces.
         """
+        if n is not None:
+            return self.sample_batch(n)
         return tuple([space.sample() for space in self.spaces])
 
+    def sample_batch(self, batch_shape: Union[int, Sequence[int]]) -> typing.Tuple[Any, ...]:
+        """
+        Sample a batch of random elements of this space.
+
+        Args:
+            batch_shape (`int` or `Sequence[int]`):
+                The shape of the batch.
+
+        Returns:
+            samples (`Tuple[Any, ...]`):
+                Batches of sampled elements from each of the spaces.
+        """
+        return tuple([space.sample_batch(batch_shape) for space in self.spaces])
+
     def contains(self, x: Any) -> bool:
         """
         Check if the space contains the element `x`.
@@ -107,6 +128,26 @@ class Tuple(Space):
             and all(space.contains(part) for (space, part) in zip(self.spaces, x))
         )
 
+    def contains_batch(self, x: Any) -> np.ndarray:
+        """
+        Check if the space contains each element of a batch (a tuple of batches of the elements of each space).
+
+        Args:
+            x (`Tuple[Any, ...]`):
+                Batch of elements to check.
+
+        Returns:
+            contains (`np.ndarray`):
+                Boolean array of shape `batch_shape`, whether the space contains each element of the batch.
+        """
+        if not isinstance(x, (tuple, list)) or len(x) != len(self.spaces):
+            raise ValueError(f"The batch should be a tuple of {len(self.spaces)} batches")
+        return reduce(
+            np.logical_and,
+            (space.contains_batch(part) for (space, part) in zip(self.spaces, x)),
+            np.ones((), dtype=bool),
+        )
+
     def __repr__(self) -> str:
         return "Tuple(" + ", ".join([str(s) for s in self.spaces]) + ")"
 
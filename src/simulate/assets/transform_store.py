@@ -0,0 +1,335 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+""" A struct-of-arrays store for the position/rotation/scaling (TRS) of many assets."""
+import weakref
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+import numpy as np
+
+from .transforms import compose_transforms, compose_world_matrices
+
+
+if TYPE_CHECKING:
+    from .asset import Asset
+
+
+_ACTIVE_STORES: List["TransformStore"] = []
+
+
+class TransformStore:
+    """
+    Contiguous storage for the transforms of many assets.
+
+    Positions, rotations, scalings and transformation matrices are held in `(N, 3)`, `(N, 4)`, `(N, 3)` and
+    `(N, 4, 4)` arrays and each bound asset only keeps a row index in the store.
+    The `position`, `rotation`, `scaling` and `transformation_matrix` properties of the assets keep working
+    and read/write the rows of the store.
+
+    The `positions`, `rotations` and `scalings` arrays can be written directly (e.g. bulk updates of many rows).
+    The transformation matrices are composed lazily from them: a row is composed again whenever its position,
+    rotation or scaling differ from the ones its matrix was composed from.
+
+    Note that the `position`, `rotation` and `scaling` of a bound asset are views of its row: they change when the
+    transform of the asset is set again (copy them to keep the previous values).
+
+    Assets created (or copied) inside a `with TransformStore() as store:` block are bound to the store
+    automatically, existing assets can be bound with `store.add(asset)` or `store.add_tree(root)`.
+
+    Args:
+        capacity (`int`, *optional*, defaults to `64`):
+            Initial number of rows allocated. The store grows automatically when full.
+
+    Example:
+    ```python
+    with sm.TransformStore() as store:
+        boxes = [sm.Box(position=[i, 0, 0]) for i in range(1000)]
+    world_matrices = store.world_matrices()
+    ```
+    """
+
+    def __init__(self, capacity: int = 64):
+        capacity = max(int(capacity), 1)
+        self.positions = np.zeros((capacity, 3))
+        self.rotations = np.zeros((capacity, 4))
+        self.rotations[:, 3] = 1.0
+        self.scalings = np.ones((capacity, 3))
+        self._matrices = np.tile(np.eye(4), (capacity, 1, 1))
+        # The positions, rotations and scalings each matrix was composed from (NaN for matrices to compose)
+        self._matrix_sources = np.full((capacity, 10), np.nan)
+
+        self._size = 0
+        self._free_rows: List[int] = []
+        self._owners: Dict[int, weakref.ref] = {}
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def __repr__(self) -> str:
+        return f"TransformStore(n_assets={len(self)}, capacity={self.capacity})"
+
+    def __enter__(self) -> "TransformStore":
+        _ACTIVE_STORES.append(self)
+        return self
+
+    def __exit__(self, *args):
+        _ACTIVE_STORES.remove(self)
+
+    @staticmethod
+    def get_active_store() -> Optional["TransformStore"]:
+        """
+        Get the store currently used to bind newly created assets (innermost `with` block), if any.
+
+        Returns:
+            store (`TransformStore`):
+                The active store or `None` if no store is active.
+        """
+        return _ACTIVE_STORES[-1] if _ACTIVE_STORES else None
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows currently allocated."""
+        return self.positions.shape[0]
+
+    @property
+    def matrices(self) -> np.ndarray:
+        """
+        Get the local transformation matrices of all the rows of the store, recomputing stale rows in one pass.
+
+        Returns:
+            matrices (`np.ndarray`):
+                The `(capacity, 4, 4)` array of transformation matrices.
+        """
+        sources = self._row_sources(slice(0, self._size))
+        stale = np.flatnonzero(np.any(sources != self._matrix_sources[: self._size], axis=-1))
+        if len(stale):
+            self._matrices[stale] = compose_transforms(
+                self.positions[stale], self.rotations[stale], self.scalings[stale]
+            )
+            self._matrix_sources[stale] = sources[stale]
+        return self._matrices
+
+    def _row_sources(self, index: Union[int, slice]) -> np.ndarray:
+        """The positions, rotations and scalings of some rows, concatenated as the sources of their matrices."""
+        return np.concatenate([self.positions[index], self.rotations[index], self.scalings[index]], axis=-1)
+
+    def _get_matrix(self, index: int) -> Optional[np.ndarray]:
+        """Get the matrix of a row, `None` if it has to be composed again from the transform of the row."""
+        if not np.array_equal(self._row_sources(index), self._matrix_sources[index]):
+            return None
+        return self._matrices[index]
+
+    def _set_matrix(self, index: int, matrix: Optional[np.ndarray]):
+        """Set the matrix of a row, composed from the current transform of the row (`None` to compose it again)."""
+        if matrix is None:
+            self._matrix_sources[index] = np.nan
+        else:
+            self._matrices[index] = matrix
+            self._matrix_sources[index] = self._row_sources(index)
+
+    def _grow(self, min_capacity: int):
+        """Reallocate the arrays to hold at least `min_capacity` rows."""
+        capacity = self.capacity
+        while capacity < min_capacity:
+            capacity *= 2
+        n_new = capacity - self.capacity
+
+        new_rotations = np.zeros((n_new, 4))
+        new_rotations[:, 3] = 1.0
+        self.positions = np.concatenate([self.positions, np.zeros((n_new, 3))])
+        self.rotations = np.concatenate([self.rotations, new_rotations])
+        self.scalings = np.concatenate([self.scalings, np.ones((n_new, 3))])
+        self._matrices = np.concatenate([self._matrices, np.tile(np.eye(4), (n_new, 1, 1))])
+        self._matrix_sources = np.concatenate([self._matrix_sources, np.full((n_new, 10), np.nan)])
+
+    def _release_row(self, index: int):
+        """Called when an asset bound to the store is garbage collected."""
+        self._owners.pop(index, None)
+        self._free_rows.append(index)
+
+    def allocate(self, asset: "Asset") -> int:
+        """
+        Allocate a row of the store for an asset. The row is initialized to the identity transform.
+
+        Prefer `add` which also copies the current transform of the asset in the store.
+
+        Args:
+            asset (`Asset`):
+                The asset owning the row. The row is released when the asset is garbage collected.
+
+        Returns:
+            index (`int`):
+                The index of the allocated row.
+        """
+        if self._free_rows:
+            index = self._free_rows.pop()
+        else:
+            if self._size >= self.capacity:
+                self._grow(self._size + 1)
+            index = self._size
+            self._size += 1
+
+        self.positions[index] = 0.0
+        self.rotations[index] = (0.0, 0.0, 0.0, 1.0)
+        self.scalings[index] = 1.0
+        self._matrix_sources[index] = np.nan
+        self._owners[index] = weakref.ref(asset, lambda _, store=self, idx=index: store._release_row(idx))
+        return index
+
+    def add(self, asset: "Asset") -> int:
+        """
+        Bind an asset to the store, moving its current transform in the store.
+
+        Args:
+            asset (`Asset`):
+                The asset to bind.
+
+        Returns:
+            index (`int`):
+                The index of the row of the asset in the store.
+        """
+        if asset._transform_store is self:
+            return asset._transform_index
+        position, rotation, scaling = asset._position, asset._rotation, asset._scaling
+        if asset._transform_store is not None:
+            asset._transform_store.remove(asset)
+
+        index = self.allocate(asset)
+        if position is not None:
+            self.positions[index] = position
+        if rotation is not None:
+            self.rotations[index] = rotation
+        if scaling is not None:
+            self.scalings[index] = scaling
+        asset._transform_store = self
+        asset._transform_index = index
+        return index
+
+    def add_tree(self, root: "Asset") -> "TransformStore":
+        """
+        Bind an asset and all its descendants to the store.
+
+        Args:
+            root (`Asset`):
+                The root of the tree to bind.
+
+        Returns:
+            self (`TransformStore`):
+                The store.
+        """
+        self.add(root)
+        for node in root.tree_descendants:
+            self.add(node)
+        return self
+
+    def remove(self, asset: "Asset"):
+        """
+        Unbind an asset from the store. The asset keeps its transform in its own arrays.
+
+        Args:
+            asset (`Asset`):
+                The asset to unbind.
+        """
+        if asset._transform_store is not self:
+            raise ValueError(f"Asset {asset.name} is not bound to this store.")
+        index = asset._transform_index
+        position = self.positions[index].copy()
+        rotation = self.rotations[index].copy()
+        scaling = self.scalings[index].copy()
+
+        asset._transform_store = None
+        asset._transform_index = None
+        self._release_row(index)
+
+        asset._position = position
+        asset._rotation = rotation
+        asset._scaling = scaling
+        asset._transformation_matrix = None
+
+    @property
+    def assets(self) -> List["Asset"]:
+        """List of the (still alive) assets bound to the store, ordered by row index."""
+        assets = [self._owners[index]() for index in sorted(self._owners)]
+        return [asset for asset in assets if asset is not None]
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Sorted indices of the rows currently used by assets."""
+        return np.array(sorted(self._owners), dtype=np.int64)
+
+    def parent_indices(self) -> np.ndarray:
+        """
+        Get the row index of the parent of each row (-1 for roots and for parents not bound to the store).
+
+        Returns:
+            parent_indices (`np.ndarray`):
+                The `(capacity,)` array of parent indices.
+        """
+        parents = np.full(self.capacity, -1, dtype=np.int64)
+        for index, ref in self._owners.items():
+            asset = ref()
+            if asset is None:
+                continue
+            parent = asset.tree_parent
+            if parent is not None and parent._transform_store is self:
+                parents[index] = parent._transform_index
+        return parents
+
+    def world_matrices(self, parent_indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the world transformation matrices of all the rows in a vectorised way (one batched
+        matrix product per depth level of the tree).
+
+        Args:
+            parent_indices (`np.ndarray`, *optional*, defaults to `None`):
+                The parent row index of each row (-1 for roots). Computed from the bound assets if not provided.
+
+        Returns:
+            world_matrices (`np.ndarray`):
+                The `(capacity, 4, 4)` array of world transformation matrices.
+        """
+        if parent_indices is None:
+            parent_indices = self.parent_indices()
+        parent_indices = np.asarray(parent_indices, dtype=np.int64)
+        return compose_world_matrices(self.matrices[: len(parent_indices)], parent_indices)
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        Get a copy of the positions, rotations and scalings of the store.
+
+        Returns:
+            snapshot (`Dict[str, np.ndarray]`):
+                A dict with copies of the `positions`, `rotations` and `scalings` arrays.
+        """
+        return {
+            "positions": self.positions[: self._size].copy(),
+            "rotations": self.rotations[: self._size].copy(),
+            "scalings": self.scalings[: self._size].copy(),
+        }
+
+    def restore(self, snapshot: Dict[str, np.ndarray]):
+        """
+        Restore the transforms of the store from a snapshot taken with `snapshot`.
+
+        Args:
+            snapshot (`Dict[str, np.ndarray]`):
+                The snapshot to restore.
+        """
+        n_rows = len(snapshot["positions"])
+        if n_rows > self._size:
+            raise ValueError(f"The snapshot has {n_rows} rows but the store only has {self._size} rows.")
+        self.positions[:n_rows] = snapshot["positions"]
+        self.rotations[:n_rows] = snapshot["rotations"]
+        self.scalings[:n_rows] = snapshot["scalings"]
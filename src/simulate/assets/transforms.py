@@ -0,0 +1,279 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+""" Vectorized math on batches of transforms: TRS <-> matrices, quaternions and Euler angles."""
+from typing import Tuple, Union
+
+import numpy as np
+
+
+# All the functions take arrays with any number of leading (batch) dimensions, e.g. (N, 3) translations,
+# (N, 4) quaternions (x, y, z, w) and (N, 4, 4) matrices, and broadcast them with numpy.
+# The scalar helpers of `simulate.assets.utils` are the same functions without batch dimensions.
+
+# Quaternion product q * r: component k is sum_j(sign[k, j] * q[q_index[k, j]] * r[r_index[k, j]])
+_PRODUCT_Q_INDICES = np.array([[0, 3, 2, 1], [1, 2, 3, 0], [2, 1, 0, 3], [3, 0, 1, 2]])
+_PRODUCT_R_INDICES = np.array([[3, 0, 1, 2], [3, 0, 1, 2], [3, 0, 1, 2], [3, 0, 1, 2]])
+_PRODUCT_SIGNS = np.array(
+    [[1.0, 1.0, -1.0, 1.0], [1.0, 1.0, 1.0, -1.0], [1.0, -1.0, 1.0, 1.0], [1.0, -1.0, -1.0, -1.0]]
+)
+
+# Euler angles to quaternion: the components (x, y, z, w) are cos/sin products (0: cos, 1: sin of the half angle)
+_EULER_X_INDICES = np.array([[1, 0, 0, 0], [0, 1, 1, 1]])
+_EULER_Y_INDICES = np.array([[0, 1, 0, 0], [1, 0, 1, 1]])
+_EULER_Z_INDICES = np.array([[0, 0, 1, 0], [1, 1, 0, 1]])
+_EULER_SIGNS = np.array([-1.0, 1.0, -1.0, 1.0])
+
+# Rotation matrix to quaternion: for each branch (x, y, z, w), the signs of the diagonal terms in t and the
+# indices of the numerators of (x, y, z, w) in [symmetric terms (3), antisymmetric terms (3), t]
+_DIAGONAL_SIGNS = np.array([[1.0, -1.0, -1.0], [-1.0, 1.0, -1.0], [-1.0, -1.0, 1.0], [1.0, 1.0, 1.0]])
+_BRANCH_INDICES = np.array([[6, 0, 1, 3], [0, 6, 2, 4], [1, 2, 6, 5], [3, 4, 5, 6]])
+
+
+def compose_transforms(translations: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    Create a batch of homogeneous transform matrices (..., 4, 4) from batches of translations (..., 3),
+    rotation quaternions (..., 4) and scales (..., 3).
+
+    Args:
+        translations (`np.ndarray`):
+            The translation vectors.
+        rotations (`np.ndarray`):
+            The rotation quaternions.
+        scales (`np.ndarray`):
+            The scale vectors.
+
+    Returns:
+        transforms (`np.ndarray`):
+            The homogeneous transform matrices.
+    """
+    translations = np.asarray(translations, dtype=float)
+    rotations = np.asarray(rotations, dtype=float)
+    scales = np.asarray(scales, dtype=float)
+    batch_shape = np.broadcast_shapes(translations.shape[:-1], rotations.shape[:-1], scales.shape[:-1])
+
+    qx, qy, qz, qw = rotations[..., 0], rotations[..., 1], rotations[..., 2], rotations[..., 3]
+    transforms = np.zeros(batch_shape + (4, 4))
+    transforms[..., 0, 0] = 1 - 2 * (qy * qy + qz * qz)
+    transforms[..., 0, 1] = 2 * (qx * qy - qw * qz)
+    transforms[..., 0, 2] = 2 * (qx * qz + qw * qy)
+    transforms[..., 1, 0] = 2 * (qx * qy + qw * qz)
+    transforms[..., 1, 1] = 1 - 2 * (qx * qx + qz * qz)
+    transforms[..., 1, 2] = 2 * (qy * qz - qw * qx)
+    transforms[..., 2, 0] = 2 * (qx * qz - qw * qy)
+    transforms[..., 2, 1] = 2 * (qy * qz + qw * qx)
+    transforms[..., 2, 2] = 1 - 2 * (qx * qx + qy * qy)
+    transforms[..., :3, :3] *= scales[..., None, :]
+    transforms[..., :3, 3] = translations
+    transforms[..., 3, 3] = 1.0
+    return transforms
+
+
+def decompose_transforms(transforms: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the translations (..., 3), rotation quaternions (..., 4) and scales (..., 3) of a batch of homogeneous
+    transform matrices (..., 4, 4) without shear.
+
+    Args:
+        transforms (`np.ndarray`):
+            The homogeneous transform matrices.
+
+    Returns:
+        translations (`np.ndarray`):
+            The translation vectors.
+        rotations (`np.ndarray`):
+            The rotation quaternions.
+        scales (`np.ndarray`):
+            The scale vectors.
+    """
+    transforms = np.asarray(transforms, dtype=float)
+    batch_shape = transforms.shape[:-2]
+    matrices = transforms.reshape((-1, 4, 4))
+
+    # See https://math.stackexchange.com/questions/237369/given-this-transformation-matrix-how-do-i-decompose-it-into-translation-rotati
+    translations = matrices[:, :3, 3].copy()
+    scales = np.linalg.norm(matrices[:, :3, :3], axis=1)
+    rotation_matrices = matrices[:, :3, :3] / scales[:, None, :]
+
+    # See https://www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion/
+    # Like in the reference, each matrix uses the w branch if the trace is positive, else the branch of
+    # its largest diagonal term, with the same strict comparisons (the last axis wins ties).
+    # All the branches are written as (numerators of x, y, z, w) / (2 * sqrt(t)).
+    m = rotation_matrices.reshape((-1, 9))  # m[:, 3 * i + j] is the term (i, j) of the matrix
+    diagonal = m[:, [0, 4, 8]]
+    m00, m11, m22 = diagonal[:, 0], diagonal[:, 1], diagonal[:, 2]
+    branches = np.where(
+        np.sum(diagonal, axis=-1) > 0,
+        3,
+        np.where((m00 > m11) & (m00 > m22), 0, np.where(m11 > m22, 1, 2)),
+    )
+    t = 1.0 + np.sum(diagonal * _DIAGONAL_SIGNS[branches], axis=-1)
+
+    # Symmetric terms (01 + 10, 02 + 20, 12 + 21), antisymmetric terms (21 - 12, 02 - 20, 10 - 01) and t
+    terms = np.concatenate([m[:, [1, 2, 5]] + m[:, [3, 6, 7]], m[:, [7, 2, 3]] - m[:, [5, 6, 1]], t[:, None]], axis=-1)
+    numerators = np.take_along_axis(terms, _BRANCH_INDICES[branches], axis=-1)
+    rotations = numerators / (2.0 * np.sqrt(t))[:, None]
+
+    return (
+        translations.reshape(batch_shape + (3,)),
+        rotations.reshape(batch_shape + (4,)),
+        scales.reshape(batch_shape + (3,)),
+    )
+
+
+def compose_world_matrices(local_matrices: np.ndarray, parent_indices: np.ndarray) -> np.ndarray:
+    """
+    Compute the world transformation matrices of a batch of nodes from their local matrices,
+    with one batched matrix product per depth level of the tree.
+
+    Args:
+        local_matrices (`np.ndarray`):
+            The (N, 4, 4) local transformation matrices.
+        parent_indices (`np.ndarray`):
+            The (N,) index of the parent of each node (-1 for roots).
+
+    Returns:
+        world_matrices (`np.ndarray`):
+            The (N, 4, 4) world transformation matrices.
+    """
+    parent_indices = np.asarray(parent_indices, dtype=np.int64)
+
+    # Depth of each node, computed by jumping along the parent pointers
+    depth = np.zeros(len(parent_indices), dtype=np.int64)
+    ancestors = parent_indices.copy()
+    while np.any(ancestors >= 0):
+        has_ancestor = ancestors >= 0
+        depth[has_ancestor] += 1
+        ancestors[has_ancestor] = parent_indices[ancestors[has_ancestor]]
+
+    world = np.array(local_matrices, dtype=float)
+    for level in range(1, int(depth.max(initial=0)) + 1):
+        rows = np.flatnonzero(depth == level)
+        world[rows] = world[parent_indices[rows]] @ world[rows]
+    return world
+
+
+def multiply_quaternions(q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """
+    Compute the products `q * r` of two batches of quaternions (..., 4), i.e. the rotations `r` followed by `q`.
+
+    Args:
+        q (`np.ndarray`):
+            The first quaternions.
+        r (`np.ndarray`):
+            The second quaternions.
+
+    Returns:
+        products (`np.ndarray`):
+            The products of the quaternions.
+    """
+    # Each component of the product is a signed sum of 4 products of components of q and r
+    terms = np.asarray(q, dtype=float)[..., _PRODUCT_Q_INDICES] * np.asarray(r, dtype=float)[..., _PRODUCT_R_INDICES]
+    return np.sum(terms * _PRODUCT_SIGNS, axis=-1)
+
+
+def slerp_quaternions(q0: np.ndarray, q1: np.ndarray, t: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Spherical linear interpolation between two batches of unit quaternions (..., 4), along the shortest path.
+
+    Args:
+        q0 (`np.ndarray`):
+            The quaternions at `t=0`.
+        q1 (`np.ndarray`):
+            The quaternions at `t=1`.
+        t (`float` or `np.ndarray`):
+            The interpolation parameters, broadcast with the batch dimensions of the quaternions.
+
+    Returns:
+        quaternions (`np.ndarray`):
+            The interpolated unit quaternions.
+    """
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    t = np.asarray(t, dtype=float)[..., None]
+
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0.0, -q1, q1)  # q and -q are the same rotation: take the shortest path
+    dot = np.clip(np.abs(dot), 0.0, 1.0)
+
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    # Almost identical quaternions are interpolated linearly to avoid dividing by sin(theta) ~ 0
+    is_close = sin_theta < 1e-6
+    safe_sin_theta = np.where(is_close, 1.0, sin_theta)
+    w0 = np.where(is_close, 1.0 - t, np.sin((1.0 - t) * theta) / safe_sin_theta)
+    w1 = np.where(is_close, t, np.sin(t * theta) / safe_sin_theta)
+
+    quaternions = w0 * q0 + w1 * q1
+    return quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+
+def quaternions_from_euler_radians(angles: np.ndarray) -> np.ndarray:
+    """
+    Convert a batch of Euler angles (..., 3) in radians (rotations around x, y and z) in quaternions (..., 4).
+
+    Args:
+        angles (`np.ndarray`):
+            The Euler angles in radians.
+
+    Returns:
+        quaternions (`np.ndarray`):
+            The rotation quaternions.
+    """
+    half_angles = np.asarray(angles, dtype=float)[..., None] / 2
+    # (..., 3, 2) table of the cosines and sines of the half angles around x, y and z
+    cos_sin = np.concatenate([np.cos(half_angles), np.sin(half_angles)], axis=-1)
+    # Each component is the sum of two signed products of a cosine or sine around each axis
+    first = cos_sin[..., 0, _EULER_X_INDICES[0]] * cos_sin[..., 1, _EULER_Y_INDICES[0]]
+    first = first * cos_sin[..., 2, _EULER_Z_INDICES[0]]
+    second = cos_sin[..., 0, _EULER_X_INDICES[1]] * cos_sin[..., 1, _EULER_Y_INDICES[1]]
+    second = second * cos_sin[..., 2, _EULER_Z_INDICES[1]]
+    return first + _EULER_SIGNS * second
+
+
+def quaternions_from_euler_degrees(angles: np.ndarray) -> np.ndarray:
+    """
+    Convert a batch of Euler angles (..., 3) in degrees (rotations around x, y and z) in quaternions (..., 4).
+
+    Args:
+        angles (`np.ndarray`):
+            The Euler angles in degrees.
+
+    Returns:
+        quaternions (`np.ndarray`):
+            The rotation quaternions.
+    """
+    return quaternions_from_euler_radians(np.radians(angles))
+
+
+def euler_radians_from_quaternions(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Convert a batch of quaternions (..., 4) in Euler angles (..., 3) in radians (roll, pitch, yaw).
+
+    Args:
+        quaternions (`np.ndarray`):
+            The quaternions to convert.
+
+    Returns:
+        angles (`np.ndarray`):
+            The Euler angles in radians (counterclockwise).
+    """
+    quaternions = np.asarray(quaternions, dtype=float)
+    x, y, z, w = quaternions[..., 0], quaternions[..., 1], quaternions[..., 2], quaternions[..., 3]
+
+    roll_x = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    pitch_y = np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    yaw_z = np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return np.stack([roll_x, pitch_y, yaw_z], axis=-1)
@@ -16,10 +16,18 @@
 """Utilities."""
 import itertools
 import re
-from typing import List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
+from .transforms import (
+    compose_transforms,
+    decompose_transforms,
+    euler_radians_from_quaternions,
+    multiply_quaternions,
+    quaternions_from_euler_radians,
+)
+
 
 _uppercase_uppercase_re = re.compile(r"([A-Z]+)([A-Z][a-z])")
 _lowercase_uppercase_re = re.compile(r"([a-z\d])([A-Z])")
@@ -28,6 +36,27 @@ _single_underscore_re = re.compile(r"(?<!_)_(?!_)")
 _multiple_underscores_re = re.compile(r"(_{2,})")
 
 
+class LazyLoader:
+    """
+    Placeholder for a value which is only loaded on first access,
+    e.g. the meshes and textures of the assets loaded with `Asset.create_from(..., lazy=True)`.
+
+    Args:
+        load (`Callable[[], Any]`):
+            The function loading the value.
+    """
+
+    def __init__(self, load: Callable[[], Any]):
+        self.load = load
+
+    def __repr__(self) -> str:
+        return "LazyLoader(not loaded)"
+
+    def __deepcopy__(self, memo: dict) -> "LazyLoader":
+        # Each call of `load` returns a new value, the copies can share the loader (and the data it reads from)
+        return self
+
+
 def camelcase_to_snakecase(name: str) -> str:
     """
     Convert camel-case string to snake-case.
@@ -104,36 +133,7 @@ def get_transform_from_trs(
     if not scale.shape == (3,):
         raise ValueError("The scale vector should be of size 3")
 
-    translation_matrix = np.eye(4)
-    translation_matrix[:3, 3] = translation
-    translation_matrix[3, 3] = 1
-
-    # Rotation matrix
-    qx, qy, qz, qw = rotation[0], rotation[1], rotation[2], rotation[3]
-    r00 = 1 - 2 * (qy * qy + qz * qz)
-    r01 = 2 * (qx * qy - qw * qz)
-    r02 = 2 * (qx * qz + qw * qy)
-
-    r10 = 2 * (qx * qy + qw * qz)
-    r11 = 1 - 2 * (qx * qx + qz * qz)
-    r12 = 2 * (qy * qz - qw * qx)
-
-    r20 = 2 * (qx * qz - qw * qy)
-    r21 = 2 * (qy * qz + qw * qx)
-    r22 = 1 - 2 * (qx * qx + qy * qy)
-    # Gather it all
-    rotation_matrix = np.zeros((4, 4))
-    rotation_matrix[3, 3] = 1
-    rotation_matrix[:3, :3] = np.array([[r00, r01, r02], [r10, r11, r12], [r20, r21, r22]])
-
-    scale_matrix = np.zeros((4, 4))
-    scale_matrix[0, 0] = scale[0]
-    scale_matrix[1, 1] = scale[1]
-    scale_matrix[2, 2] = scale[2]
-    scale_matrix[3, 3] = 1
-
-    transformation_matrix = translation_matrix @ rotation_matrix @ scale_matrix
-    return transformation_matrix
+    return compose_transforms(translation, rotation, scale)
 
 
 def get_trs_from_transform_matrix(transform_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -155,58 +155,7 @@ def get_trs_from_transform_matrix(transform_matrix: np.ndarray) -> Tuple[np.ndar
     if not transform_matrix.shape == (4, 4):
         raise ValueError("The transform matrix should be of size 4x4")
 
-    # See https://math.stackexchange.com/questions/237369/given-this-transformation-matrix-how-do-i-decompose-it-into-translation-rotati
-
-    translation = transform_matrix[:3, 3]
-    scale = np.array(
-        [
-            np.linalg.norm(transform_matrix[:3, 0]),
-            np.linalg.norm(transform_matrix[:3, 1]),
-            np.linalg.norm(transform_matrix[:3, 2]),
-        ]
-    )
-
-    rotation = np.zeros((3, 3))
-    rotation[:, 0] = transform_matrix[:3, 0] / scale[0]
-    rotation[:, 1] = transform_matrix[:3, 1] / scale[1]
-    rotation[:, 2] = transform_matrix[:3, 2] / scale[2]
-
-    m00, m01, m02 = rotation[0].tolist()
-    m10, m11, m12 = rotation[1].tolist()
-    m20, m21, m22 = rotation[2].tolist()
-
-    # See https://www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion/
-
-    tr = m00 + m11 + m22
-
-    if tr > 0:
-        s = np.sqrt(tr + 1.0) * 2  # s=4*qw
-        qw = 0.25 * s
-        qx = (m21 - m12) / s
-        qy = (m02 - m20) / s
-        qz = (m10 - m01) / s
-    elif (m00 > m11) and (m00 > m22):
-        s = np.sqrt(1.0 + m00 - m11 - m22) * 2  # s=4*qx
-        qw = (m21 - m12) / s
-        qx = 0.25 * s
-        qy = (m01 + m10) / s
-        qz = (m02 + m20) / s
-    elif m11 > m22:
-        s = np.sqrt(1.0 + m11 - m00 - m22) * 2  # s=4*qy
-        qw = (m02 - m20) / s
-        qx = (m01 + m10) / s
-        qy = 0.25 * s
-        qz = (m12 + m21) / s
-    else:
-        s = np.sqrt(1.0 + m22 - m00 - m11) * 2  # s=4*qz
-        qw = (m10 - m01) / s
-        qx = (m02 + m20) / s
-        qy = (m12 + m21) / s
-        qz = 0.25 * s
-
-    rotation = np.array([qx, qy, qz, qw])
-
-    return translation, rotation, scale
+    return decompose_transforms(transform_matrix)
 
 
 def get_product_of_quaternions(q: Union[np.ndarray, List[float]], r: Union[np.ndarray, List[float]]) -> np.ndarray:
@@ -223,16 +172,7 @@ def get_product_of_quaternions(q: Union[np.ndarray, List[float]], r: Union[np.nd
         product (`np.ndarray`):
             The product of the two quaternions.
     """
-    qx, qy, qz, qw = q[0], q[1], q[2], q[3]
-    rx, ry, rz, rw = r[0], r[1], r[2], r[3]
-    return np.array(
-        [
-            rw * qx + rx * qw - ry * qz + rz * qy,
-            rw * qy + rx * qz + ry * qw - rz * qx,
-            rw * qz - rx * qy + ry * qx + rz * qw,
-            rw * qw - rx * qx - ry * qy - rz * qz,
-        ]
-    )
+    return multiply_quaternions(q, r)
 
 
 def rotation_from_euler_radians(x: float, y: float, z: float) -> List[float]:
@@ -251,11 +191,7 @@ def rotation_from_euler_radians(x: float, y: float, z: float) -> List[float]:
         rotation (`list`):
             The rotation quaternion.
     """
-    qx = np.sin(x / 2) * np.cos(y / 2) * np.cos(z / 2) - np.cos(x / 2) * np.sin(y / 2) * np.sin(z / 2)
-    qy = np.cos(x / 2) * np.sin(y / 2) * np.cos(z / 2) + np.sin(x / 2) * np.cos(y / 2) * np.sin(z / 2)
-    qz = np.cos(x / 2) * np.cos(y / 2) * np.sin(z / 2) - np.sin(x / 2) * np.sin(y / 2) * np.cos(z / 2)
-    qw = np.cos(x / 2) * np.cos(y / 2) * np.cos(z / 2) + np.sin(x / 2) * np.sin(y / 2) * np.sin(z / 2)
-    return [qx, qy, qz, qw]
+    return quaternions_from_euler_radians([x, y, z]).tolist()
 
 
 def rotation_from_euler_degrees(x: float, y: float, z: float) -> List[float]:
@@ -289,19 +225,4 @@ def euler_from_quaternion(quaternion: Union[np.ndarray, List[float]]) -> List[fl
         euler (`list`):
             The euler angles in radians (counterclockwise).
     """
-    x, y, z, w = quaternion
-
-    t0 = +2.0 * (w * x + y * z)
-    t1 = +1.0 - 2.0 * (x * x + y * y)
-    roll_x = np.arctan2(t0, t1)
-
-    t2 = +2.0 * (w * y - z * x)
-    t2 = +1.0 if t2 > +1.0 else t2
-    t2 = -1.0 if t2 < -1.0 else t2
-    pitch_y = np.arcsin(t2)
-
-    t3 = +2.0 * (w * z + x * y)
-    t4 = +1.0 - 2.0 * (y * y + z * z)
-    yaw_z = np.arctan2(t3, t4)
-
-    return [roll_x, pitch_y, yaw_z]  # in radians
+    return euler_radians_from_quaternions(quaternion).tolist()  # in radians
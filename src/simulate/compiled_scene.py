@@ -0,0 +1,283 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+""" A frozen and flat representation of a Scene."""
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Mapping, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from .assets import Asset, Camera, RaycastSensor, StateSensor, spaces
+from .assets.transforms import compose_transforms, compose_world_matrices
+
+
+if TYPE_CHECKING:
+    from .assets.transform_store import TransformStore
+    from .scene import Scene
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class CompiledScene:
+    """
+    A frozen and flat representation of a Scene, computed once with `scene.compile()`.
+
+    The nodes are stored in depth-first order, the scene itself being the node `0`. The facts that engines,
+    exporters and RL wrappers need about the tree (parents, types, transforms, components, actors and their
+    spaces) are stored in flat read-only arrays and mappings indexed by node index.
+
+    The compiled scene is not updated when the scene is modified: `scene.compile()` returns a new compiled scene
+    after any modification of the tree (`is_up_to_date` tells if it is still valid). The transforms written directly
+    in the arrays of a `TransformStore` are read again by each `scene.compile()`, which then only composes the
+    matrices again.
+
+    Args:
+        nodes (`Tuple[Asset]`):
+            The nodes of the scene in depth-first order.
+        names (`Tuple[str]`):
+            The names of the nodes.
+        name_to_index (`Mapping[str, int]`):
+            The index of each node by name.
+        parent_indices (`np.ndarray`):
+            The (N,) index of the parent of each node (-1 for the scene).
+        node_types (`np.ndarray`):
+            The (N,) class names of the nodes.
+        local_matrices (`np.ndarray`):
+            The (N, 4, 4) local transformation matrices of the nodes.
+        world_matrices (`np.ndarray`):
+            The (N, 4, 4) world transformation matrices of the nodes.
+        component_indices (`Mapping[str, np.ndarray]`):
+            The indices of the nodes having each component (`actuator`, `physics_component`).
+        actor_indices (`np.ndarray`):
+            The indices of the actors, sorted by name.
+        action_spaces (`Mapping[str, Space]`):
+            The action space of each actor by name.
+        observation_spaces (`Mapping[str, Space]`):
+            The observation space of each actor by name.
+        action_tags (`Mapping[str, List[str]]`):
+            The action tags of each actor by name.
+        sensor_tags (`Mapping[str, List[str]]`):
+            The sensor tags of each actor by name.
+        structural_hash (`str`):
+            The structural hash of the scene when it was compiled.
+    """
+
+    nodes: Tuple[Asset, ...]
+    names: Tuple[str, ...]
+    name_to_index: Mapping[str, int]
+    parent_indices: np.ndarray
+    node_types: np.ndarray
+    local_matrices: np.ndarray
+    world_matrices: np.ndarray
+    component_indices: Mapping[str, np.ndarray]
+    actor_indices: np.ndarray
+    action_spaces: Mapping[str, Optional[spaces.Space]]
+    observation_spaces: Mapping[str, Optional[spaces.Space]]
+    action_tags: Mapping[str, Optional[List[str]]]
+    sensor_tags: Mapping[str, Optional[List[str]]]
+    structural_hash: str
+    # The (store, node indices, store rows) of the nodes bound to a TransformStore and the transforms read in their rows
+    _store_rows: Tuple[Tuple["TransformStore", np.ndarray, np.ndarray], ...] = field(default=(), repr=False)
+    _store_sources: Tuple[np.ndarray, ...] = field(default=(), repr=False)
+
+    @classmethod
+    def from_scene(cls, scene: "Scene") -> "CompiledScene":
+        """
+        Compile a scene (prefer `scene.compile()` which only compiles the scene again after a modification).
+
+        Args:
+            scene (`Scene`):
+                The scene to compile.
+
+        Returns:
+            compiled_scene (`CompiledScene`):
+                The compiled scene.
+        """
+        nodes = (scene,) + scene.tree_descendants
+        names = tuple(node.name for node in nodes)
+        name_to_index = {name: index for index, name in enumerate(names)}
+        if len(name_to_index) != len(names):
+            raise ValueError("Node names must be unique in the scene to compile it")
+
+        node_ids = {id(node): index for index, node in enumerate(nodes)}
+        parent_indices = np.array(
+            [node_ids[id(node.tree_parent)] if index > 0 else -1 for index, node in enumerate(nodes)], dtype=np.int64
+        )
+        local_matrices = compose_transforms(
+            np.array([node._position for node in nodes], dtype=float),
+            np.array([node._rotation for node in nodes], dtype=float),
+            np.array([node._scaling for node in nodes], dtype=float),
+        )
+
+        store_rows = {}
+        for index, node in enumerate(nodes):
+            if node._transform_store is not None:
+                store, indices, rows = store_rows.setdefault(
+                    id(node._transform_store), (node._transform_store, [], [])
+                )
+                indices.append(index)
+                rows.append(node._transform_index)
+        store_rows = tuple(
+            (store, np.array(indices, dtype=np.int64), np.array(rows, dtype=np.int64))
+            for store, indices, rows in store_rows.values()
+        )
+
+        component_indices = {}
+        for index, node in enumerate(nodes):
+            for component_name in dict(node.named_components):
+                component_indices.setdefault(component_name, []).append(index)
+
+        actors = sorted((node for node in nodes if node.is_actor), key=lambda actor: actor.name)
+
+        return cls(
+            nodes=nodes,
+            names=names,
+            name_to_index=MappingProxyType(name_to_index),
+            parent_indices=_read_only(parent_indices),
+            node_types=_read_only(np.array([type(node).__name__ for node in nodes])),
+            local_matrices=_read_only(local_matrices),
+            world_matrices=_read_only(compose_world_matrices(local_matrices, parent_indices)),
+            component_indices=MappingProxyType(
+                {name: _read_only(np.array(indices, dtype=np.int64)) for name, indices in component_indices.items()}
+            ),
+            actor_indices=_read_only(np.array([name_to_index[actor.name] for actor in actors], dtype=np.int64)),
+            action_spaces=MappingProxyType({actor.name: actor.action_space for actor in actors}),
+            observation_spaces=MappingProxyType({actor.name: actor.observation_space for actor in actors}),
+            action_tags=MappingProxyType({actor.name: actor.action_tags for actor in actors}),
+            sensor_tags=MappingProxyType({actor.name: actor.sensor_tags for actor in actors}),
+            structural_hash=scene.structural_hash,
+            _store_rows=store_rows,
+            _store_sources=tuple(store._row_sources(rows) for store, _, rows in store_rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __repr__(self) -> str:
+        return f"CompiledScene(n_nodes={len(self)}, n_actors={len(self.actor_indices)})"
+
+    def is_up_to_date(self, scene: "Scene") -> bool:
+        """
+        Check if the compiled scene still represents a scene, i.e. no node of the scene was modified
+        (attribute set, node added or removed, transform written in a `TransformStore`) since it was compiled.
+
+        Like for the structural hash, the other in-place modifications (e.g. of the attributes of an actuator)
+        are not tracked.
+
+        Args:
+            scene (`Scene`):
+                The scene to check.
+
+        Returns:
+            is_up_to_date (`bool`):
+                Whether the compiled scene is still valid for the scene.
+        """
+        return self._has_structure_of(scene) and self.with_store_transforms() is self
+
+    def _has_structure_of(self, scene: "Scene") -> bool:
+        """Check if no node of the scene was modified, apart from the transforms written in a `TransformStore`."""
+        # Any modification in the tree resets the cached structural hash of the scene, which is then a new string
+        return len(self.nodes) > 0 and self.nodes[0] is scene and scene._structural_hash is self.structural_hash
+
+    def with_store_transforms(self) -> "CompiledScene":
+        """
+        Get the compiled scene with the current transforms of the nodes bound to a `TransformStore`.
+
+        Returns:
+            compiled_scene (`CompiledScene`):
+                The compiled scene itself if these transforms didn't change, else a copy with new matrices.
+        """
+        sources = tuple(store._row_sources(rows) for store, _, rows in self._store_rows)
+        if all(np.array_equal(new, old) for new, old in zip(sources, self._store_sources)):
+            return self
+
+        local_matrices = self.local_matrices.copy()
+        for (_, indices, _), source in zip(self._store_rows, sources):
+            local_matrices[indices] = compose_transforms(source[:, :3], source[:, 3:7], source[:, 7:])
+        return replace(
+            self,
+            local_matrices=_read_only(local_matrices),
+            world_matrices=_read_only(compose_world_matrices(local_matrices, self.parent_indices)),
+            _store_sources=sources,
+        )
+
+    def get_index(self, name: str) -> int:
+        """
+        Get the index of a node from its name.
+
+        Args:
+            name (`str`):
+                The name of the node.
+
+        Returns:
+            index (`int`):
+                The index of the node.
+        """
+        return self.name_to_index[name]
+
+    def get_node(self, name: str) -> Asset:
+        """
+        Get a node from its name.
+
+        Args:
+            name (`str`):
+                The name of the node.
+
+        Returns:
+            node (`Asset`):
+                The node.
+        """
+        return self.nodes[self.name_to_index[name]]
+
+    def get_indices(self, node_types: Union[Type, Tuple[Type, ...]]) -> np.ndarray:
+        """
+        Get the indices of the nodes which are instances of some classes.
+
+        Args:
+            node_types (`type` or `Tuple[type]`):
+                The classes of the nodes to select.
+
+        Returns:
+            indices (`np.ndarray`):
+                The indices of the selected nodes, in depth-first order.
+        """
+        return np.array(
+            [index for index, node in enumerate(self.nodes) if isinstance(node, node_types)], dtype=np.int64
+        )
+
+    @property
+    def actors(self) -> Tuple[Asset, ...]:
+        """The actors of the scene, sorted by name."""
+        return tuple(self.nodes[index] for index in self.actor_indices)
+
+    @property
+    def sensors(self) -> Tuple[Asset, ...]:
+        """The sensors of the scene, in depth-first order."""
+        return tuple(self.nodes[index] for index in self.get_indices((Camera, StateSensor, RaycastSensor)))
+
+    @property
+    def action_space(self) -> Optional[spaces.Space]:
+        """The action space of the single actor of the scene, `None` if the scene doesn't have exactly one actor."""
+        return next(iter(self.action_spaces.values())) if len(self.action_spaces) == 1 else None
+
+    @property
+    def observation_space(self) -> Optional[spaces.Space]:
+        """The observation space of the single actor of the scene, `None` if the scene doesn't have exactly one actor."""
+        return next(iter(self.observation_spaces.values())) if len(self.observation_spaces) == 1 else None
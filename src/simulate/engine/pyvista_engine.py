@@ -205,14 +205,14 @@ class PyVistaEngine(Engine):
 
         if isinstance(node, Object3D):
             # We need to handle MultiBlock meshes
-            if isinstance(node.mesh, pyvista.MultiBlock):
-                located_mesh = [m.transform(model_transform_matrix, inplace=False) for m in node.mesh]
+            if isinstance(node.shared_mesh, pyvista.MultiBlock):
+                located_mesh = [m.transform(model_transform_matrix, inplace=False) for m in node.shared_mesh]
                 if isinstance(node.material, (list, tuple)):
                     materials = node.material
                 else:
                     materials = [node.material] * len(located_mesh)
             else:
-                located_mesh = [node.mesh.transform(model_transform_matrix, inplace=False)]
+                located_mesh = [node.shared_mesh.transform(model_transform_matrix, inplace=False)]
                 materials = [node.material]
 
             actors = []
@@ -344,17 +344,10 @@ class PyVistaEngine(Engine):
         self.plotter.clear()
         self._plotter_actors = {}
 
-        for node in self._scene:
-            if not isinstance(node, (Object3D, Camera, Light)):
-                continue
-
-            transforms = list(n.transformation_matrix for n in node.tree_path)
-            if len(transforms) > 1:
-                model_transform_matrix = np.linalg.multi_dot(transforms)  # Compute transform from the tree parents
-            else:
-                model_transform_matrix = transforms[0]
-
-            self._add_asset_to_scene(node, model_transform_matrix)
+        # The world transforms of all the nodes are computed at once when compiling the scene
+        compiled_scene = self._scene.compile()
+        for index in compiled_scene.get_indices((Object3D, Camera, Light)):
+            self._add_asset_to_scene(compiled_scene.nodes[index], compiled_scene.world_matrices[index])
 
         if not self.plotter.renderer.lights and hasattr(self.plotter, "enable_lightkit"):
             self.plotter.enable_lightkit()  # Still add some lights
@@ -91,7 +91,8 @@ class ParallelRLEnv(VecEnv):
             self.scene += map_root
             self.map_roots.append(map_root)
 
-        self.actors = {actor.name: actor for actor in self.scene.actors}
+        compiled_scene = self.scene.compile()
+        self.actors = {actor.name: actor for actor in compiled_scene.actors}
         self.n_actors = len(self.actors)
         if self.n_actors == 0:
             raise ValueError(
@@ -103,9 +104,9 @@ class ParallelRLEnv(VecEnv):
 
         self.actor = next(iter(self.actors.values()))
 
-        self.action_space = self.scene.actors[0].action_space
-        self.observation_space = self.scene.actors[0].observation_space
-        self.action_tags = self.scene.actors[0].action_tags
+        self.action_space = compiled_scene.action_spaces[self.actor.name]
+        self.observation_space = compiled_scene.observation_spaces[self.actor.name]
+        self.action_tags = compiled_scene.action_tags[self.actor.name]
 
         super().__init__(n_show, self.observation_space, self.action_space)
 
@@ -309,13 +310,13 @@ class ParallelRLEnv(VecEnv):
         """
         if len(self.action_tags) > 1:
             raise NotImplementedError("Handling of multi-map actions not yet translated from OrderedDicts")
-        if self.n_actors_per_map > 1:
-            sub_actions = []
-            for _ in range(self.n_show):
-                sub_actions.append([self.action_space.sample() for _ in range(self.n_actors_per_map)])
-                action = np.stack(sub_actions)
+        # sample the actions of all maps and actors in a single batch with our spaces
+        if hasattr(self.action_space, "sample_batch"):
+            action = self.action_space.sample_batch((self.n_show, self.n_actors_per_map))
         else:
-            action = np.stack([self.action_space.sample() for _ in range(self.n_show)])
+            action = np.stack(
+                [[self.action_space.sample() for _ in range(self.n_actors_per_map)] for _ in range(self.n_show)]
+            )
 
         return action.reshape((self.n_show, self.n_actors_per_map, -1)).tolist()
 
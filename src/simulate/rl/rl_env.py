@@ -49,7 +49,8 @@ class RLEnv:
 
         # map roots needed for engine, which is designed for parallel computation
         self.map_roots = [self.scene]
-        self.actors = {actor.name: actor for actor in self.scene.actors}
+        compiled_scene = self.scene.compile()
+        self.actors = {actor.name: actor for actor in compiled_scene.actors}
         self.n_actors = len(self.actors)
         if self.n_actors == 0:
             raise ValueError(
@@ -60,9 +61,9 @@ class RLEnv:
 
         # copy action, observation space, and action tags
         # currently only works for agents with the same actions space, which is not general
-        self.action_space = self.scene.actors[0].action_space
-        self.observation_space = self.scene.actors[0].observation_space
-        self.action_tags = self.scene.actors[0].action_tags
+        self.action_space = compiled_scene.action_spaces[self.actor.name]
+        self.observation_space = compiled_scene.observation_spaces[self.actor.name]
+        self.action_tags = compiled_scene.action_tags[self.actor.name]
 
         # converge internal simulation settings
         self.scene.config.time_step = time_step
@@ -264,16 +265,18 @@ class RLEnv:
         Returns:
             action (`list[list[list[float]]]`): Lists of the actions, dimensions are n-maps, n-actors, action-dim.
         """
+        # action is an OrderedDict of action tag and ndarrays if multi-tag
+        if len(self.action_tags) != 1:
+            return self.action_space.sample()
 
-        # sample actions per actor
-        actions = [self.action_space.sample() for _ in range(self.n_actors)]
+        # sample actions per actor, in a single batch with our spaces (gym spaces only sample one action at a time)
+        if hasattr(self.action_space, "sample_batch"):
+            actions = self.action_space.sample_batch(self.n_actors)
+        else:
+            actions = np.stack([self.action_space.sample() for _ in range(self.n_actors)])
 
         # outer most list element is 1 for base rl_env because maps = 1, inner element is action dimension
-        if len(self.action_tags) == 1:
-            return np.stack(actions).reshape((1, self.n_actors, -1)).tolist()
-        else:
-            # action is an OrderedDict of action tag and ndarrays if multi-tag
-            return actions[0]
+        return actions.reshape((1, self.n_actors, -1)).tolist()
 
     # required abstract methods
 
@@ -17,10 +17,10 @@
 import itertools
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from .assets import Asset, Camera, Collider, Light, Object3D, RaycastSensor, RewardFunction, StateSensor, spaces
-from .assets.anytree import RenderTree, TreeError
+from .assets import Asset, Camera, Light, RaycastSensor, RewardFunction, StateSensor, spaces
+from .assets.anytree import RenderTree
+from .compiled_scene import CompiledScene
 from .config import Config
-from .engine import BlenderEngine, GodotEngine, NotebookEngine, PyVistaEngine, UnityEngine, in_notebook
 
 
 class Scene(Asset):
@@ -59,6 +59,9 @@ class Scene(Asset):
     """
 
     __NEW_ID = itertools.count()  # Singleton to count instances of the classes for automatic naming
+    _UNTRACKED_ATTRIBUTES = Asset._UNTRACKED_ATTRIBUTES | {"_compiled_scene", "_checked_structural_hash"}
+    _compiled_scene: Optional[CompiledScene] = None
+    _checked_structural_hash: Optional[str] = None  # Structural hash of the scene when it was last checked
 
     def __init__(
         self,
@@ -86,23 +89,38 @@ class Scene(Asset):
 
         self._is_shown = False
 
+        # The engines are imported on use: each of them has its own heavy dependencies (pyvista, huggingface_hub)
         self.engine = None
         if engine is not None:
             engine = engine.lower()
         if engine == "unity":
+            from .engine.unity_engine import UnityEngine
+
             self.engine = UnityEngine(self, **kwargs)
         elif engine == "godot":
+            from .engine.godot_engine import GodotEngine
+
             self.engine = GodotEngine(self)
         elif engine == "blender":
+            from .engine.blender_engine import BlenderEngine
+
             self.engine = BlenderEngine(self)
         elif engine == "pyvista":
+            from .engine.pyvista_engine import PyVistaEngine
+
             self.engine = PyVistaEngine(self, **kwargs)
         elif engine == "notebook":
+            from .engine.notebook_engine import NotebookEngine
+
             self.engine = NotebookEngine(self, **kwargs)
         elif engine is None:
+            from .engine.notebook_engine import NotebookEngine, in_notebook
+
             if in_notebook():
                 self.engine = NotebookEngine(self, **kwargs)
             else:
+                from .engine.pyvista_engine import PyVistaEngine
+
                 self.engine = PyVistaEngine(self, **kwargs)
         elif engine is not None:
             raise ValueError(
@@ -153,6 +171,8 @@ class Scene(Asset):
         revision: Optional[str] = None,
         is_local: Optional[bool] = None,
         hf_hub_kwargs: Optional[dict] = None,
+        lazy: bool = False,
+        use_cache: bool = False,
         **scene_kwargs: Any,
     ) -> "Scene":
         """
@@ -173,6 +193,11 @@ class Scene(Asset):
                 `https://huggingface.co/`.
             hf_hub_kwargs (`dict`, *optional*, defaults to `None`):
                 The additional keyword arguments to pass to the Hugging Face hub.
+            lazy (`bool`, *optional*, defaults to `False`):
+                Whether to load the meshes and textures on first access. Use `prefetch()` to load them all at once.
+            use_cache (`bool`, *optional*, defaults to `False`):
+                Whether to use the local asset cache (see `AssetCache`) to skip the hub queries and the parsing
+                of the file on the following loads.
 
         Examples:
         - Scene.create_from('simulate-tests/Box/glTF-Embedded/Box.gltf'): a file on the hub
@@ -184,68 +209,111 @@ class Scene(Asset):
             revision=revision,
             is_local=is_local,
             hf_hub_kwargs=hf_hub_kwargs,
+            lazy=lazy,
+            use_cache=use_cache,
         )
         return Scene.create_from_asset(root_node, **scene_kwargs)
 
     def _scene_check(self):
-        """Check that the scene is valid."""
-        # We have a couple of restrictions on parent/children nodes
+        """
+        Check that the scene is valid.
+
+        The checks on the children of colliders and reward functions are done when the nodes are attached.
+        The remaining checks (unique names, actuators in one and only one actor) are done in a single pass
+        on the tree, and only again after the scene is modified.
+        """
+        structural_hash = self.structural_hash
+        if self._checked_structural_hash is structural_hash:
+            return
+
         seen = {self.name}  # O(1) lookups
-        for node in self.tree_descendants:
+        # Depth-first walk keeping the number of actors in the path of each node (self included)
+        stack = [(child, int(self.is_actor)) for child in reversed(self.tree_children)]
+        while stack:
+            node, n_parent_actors = stack.pop()
             # all names have to be unique in the tree.
-            if node.name not in seen:
-                seen.add(node.name)
-            else:
+            if node.name in seen:
                 raise ValueError("Node name '{}' is not unique".format(node.name))
+            seen.add(node.name)
 
-            # a reward function can only have reward functions as children.
-            if isinstance(node, RewardFunction):
-                if any(not isinstance(child, RewardFunction) for child in node.tree_children):
-                    raise TreeError(
-                        f"Reward functions can only have reward function as children but "
-                        f"node {node.name} has a child which is not a reward function."
-                    )
-            # a collider cannot have children.
-            if isinstance(node, Collider) and node.tree_children:
-                raise TreeError(f"Colliders can not have children but " f"node {node.name} has a child")
-
+            n_parent_actors += 1 if node.is_actor else 0
             # Sanity check that all actuators are part of one and only one actor
-            if node.actuator is not None:
-                number_of_parent_actors = 0
-                for parent_node in node.tree_path:
-                    number_of_parent_actors += 1 if parent_node.is_actor else 0
-                if number_of_parent_actors == 0:
+            if node.actuator is not None and n_parent_actors != 1:
+                path_names = tuple(n.name for n in node.tree_path)
+                if n_parent_actors == 0:
                     raise ValueError(
                         f"Node {node.name} has an actuator but is not part of an actor. "
                         "Actuators should be part of an actor. "
-                        f"Check that at least one parent node of "
-                        f"{node.name} {tuple(n.name for n in node.tree_path)} is an actor."
-                    )
-                elif number_of_parent_actors > 1:
-                    raise ValueError(
-                        f"Node {node.name} has an actuator but is part of more than one actor. "
-                        "Actuators should be part of one and only one actor. "
-                        f"Check that only one parent node of "
-                        f"{node.name} {tuple(n.name for n in node.tree_path)} is an actor."
+                        f"Check that at least one parent node of {node.name} {path_names} is an actor."
                     )
+                raise ValueError(
+                    f"Node {node.name} has an actuator but is part of more than one actor. "
+                    "Actuators should be part of one and only one actor. "
+                    f"Check that only one parent node of {node.name} {path_names} is an actor."
+                )
+            stack.extend((child, n_parent_actors) for child in reversed(node.tree_children))
+
+        self._checked_structural_hash = structural_hash
 
-    def save(self, file_path: str) -> List[str]:
+    def compile(self) -> CompiledScene:
+        """
+        Check the scene and compile it in a frozen and flat representation (see `CompiledScene`).
+
+        The compiled scene is kept and returned again as long as the scene is not modified,
+        so engines and wrappers can call this method instead of walking the tree again.
+        The transforms written directly in the arrays of a `TransformStore` are read again on each call.
+
+        Returns:
+            compiled_scene (`CompiledScene`):
+                The compiled scene.
+        """
+        if self._compiled_scene is None or not self._compiled_scene._has_structure_of(self):
+            self._scene_check()
+            self._compiled_scene = CompiledScene.from_scene(self)
+        else:
+            # Only the matrices are composed again after writes in the arrays of a TransformStore
+            self._compiled_scene = self._compiled_scene.with_store_transforms()
+        return self._compiled_scene
+
+    def save(
+        self,
+        file_path: str,
+        gpu_instancing: bool = False,
+        embed_resources: bool = True,
+        max_buffer_size: Optional[int] = None,
+        quantize: bool = False,
+    ) -> List[str]:
         """
         Save in a GLTF file + additional (binary) resource files if it should be the case.
         Return the list of all the path to the saved files (glTF file + resource files)
 
         Args:
-            file_path (`str`): The path to the file to save the scene to.
+            file_path (`str`): The path to the file to save the scene to, with a `.gltf` or `.glb` extension.
+            gpu_instancing (`bool`, *optional*, defaults to `False`):
+                Whether to export sibling instances of a same mesh with the `EXT_mesh_gpu_instancing` extension.
+            embed_resources (`bool`, *optional*, defaults to `True`):
+                For `.gltf` files, whether to embed the buffers and images in the JSON as base64 data
+                or to save them next to the glTF file in `.bin` and image files.
+            max_buffer_size (`int`, *optional*, defaults to `None`):
+                For `.gltf` files with external resources, the maximum size in bytes of each `.bin` file.
+            quantize (`bool`, *optional*, defaults to `False`):
+                Whether to store the meshes with quantized vertex attributes (`KHR_mesh_quantization` extension).
 
         Returns:
             `List[str]`: The list of all the path to the saved files (glTF file + resource files)
         """
         self._scene_check()
-        return super().save(file_path)
+        return super().save(
+            file_path,
+            gpu_instancing=gpu_instancing,
+            embed_resources=embed_resources,
+            max_buffer_size=max_buffer_size,
+            quantize=quantize,
+        )
 
     def show(self, **engine_kwargs: Any) -> None:
         """Send the scene to the engine for rendering or later simulation."""
-        self._scene_check()
+        self.compile()
         self._is_shown = True
         return self.engine.show(**engine_kwargs)
 
@@ -346,6 +414,8 @@ class Scene(Asset):
     @property
     def objects(self) -> Tuple["Asset"]:
         """Tuple with all Object3D in the Scene"""
+        from .assets.object import Object3D
+
         return self.tree_filtered_descendants(lambda node: isinstance(node, Object3D))
 
     @property
@@ -13,7 +13,9 @@
 # limitations under the License.
 """ Import utilities."""
 
+import importlib
 import importlib.util
+from typing import Callable, Dict, Iterable, List, Tuple
 
 
 _vhacd_available = importlib.util.find_spec("simulate._vhacd") is not None
@@ -26,3 +28,48 @@ def is_vhacd_available():
 
 def is_fastwfc_available():
     return _fastwfc_available
+
+
+def attach_lazy_attributes(
+    package_name: str, import_structure: Dict[str, Iterable[str]], submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` (PEP 562) of a package whose public attributes and submodules
+    are only imported on first access.
+
+    Args:
+        package_name (`str`):
+            The name of the package (`__name__`).
+        import_structure (`Dict[str, Iterable[str]]`):
+            The public attributes of the package by name of the submodule defining them.
+        submodules (`Iterable[str]`, *optional*, defaults to `()`):
+            The names of other submodules which can be accessed as attributes of the package.
+
+    Returns:
+        getattr_fn (`Callable[[str], object]`):
+            The `__getattr__` function of the package.
+        dir_fn (`Callable[[], List[str]]`):
+            The `__dir__` function of the package.
+        all_names (`List[str]`):
+            The `__all__` list of the package.
+    """
+    attribute_to_module = {name: module for module, names in import_structure.items() for name in names}
+    submodules = set(submodules) | set(import_structure)
+    all_names = sorted(set(attribute_to_module) | submodules)
+
+    def getattr_fn(name: str) -> object:
+        if name in attribute_to_module:
+            module = importlib.import_module(f".{attribute_to_module[name]}", package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package_name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # Cached in the package so that `__getattr__` is only called on first access
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def dir_fn() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package_name))) | set(all_names))
+
+    return getattr_fn, dir_fn, all_names
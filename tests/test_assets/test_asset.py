@@ -220,6 +220,42 @@ class AssetTest(unittest.TestCase):
         )
         np.testing.assert_allclose(asset.transformation_matrix, transformation_mat)
 
+    def test_lazy_transformation_matrix(self):
+        asset = sm.Asset(position=TRANSLATION, rotation=ROTATION, scaling=SCALE)
+        self.assertIsNone(asset._transformation_matrix)
+        np.testing.assert_allclose(asset.transformation_matrix, TRANSFORMATION_MAT, rtol=1e-03)
+
+        asset.translate_x(1.0)
+        self.assertIsNone(asset._transformation_matrix)
+        np.testing.assert_allclose(asset.transformation_matrix[:3, 3], [11.0, 20.0, 30.0])
+
+        for node in [sm.Collider(position=TRANSLATION), sm.StateSensor(position=TRANSLATION), sm.RewardFunction()]:
+            node.position = TRANSLATION
+            np.testing.assert_allclose(node.transformation_matrix[:3, 3], TRANSLATION)
+
+    def test_shared_default_transform(self):
+        asset_1, asset_2 = sm.Asset(), sm.StateSensor()
+        self.assertIs(asset_1._position, asset_2._position)
+        self.assertIs(asset_1._transformation_matrix, asset_2._transformation_matrix)
+
+        # The getters hand out a writable copy owned by the asset
+        asset_1.position[0] = 1.0
+        asset_1.rotation[3] = 1.0
+        np.testing.assert_array_equal(asset_1.position, [1.0, 0.0, 0.0])
+        np.testing.assert_array_equal(asset_2.position, [0.0, 0.0, 0.0])
+        self.assertIsNot(asset_1.transformation_matrix, asset_2.transformation_matrix)
+        self.assertIs(asset_2._scaling, sm.Asset()._scaling)
+        self.assertNotIn("_trs_scaling", vars(asset_1))
+
+        asset_2.position = [0.0, 2.0, 0.0]
+        np.testing.assert_array_equal(asset_2.transformation_matrix[:3, 3], [0.0, 2.0, 0.0])
+        np.testing.assert_array_equal(sm.Asset().transformation_matrix, np.eye(4))
+
+        box = sm.Box()
+        box.position[1] += 1.0
+        np.testing.assert_array_equal(box.position, [0.0, 1.0, 0.0])
+        np.testing.assert_array_equal(sm.Box().position, [0.0, 0.0, 0.0])
+
     def test_get_asset(self):
         asset = sm.Asset()
         bobby_asset = sm.Asset(name="bobby")
@@ -245,6 +281,111 @@ class AssetTest(unittest.TestCase):
         self.assertEqual(asset._n_copies, 1)
         self.assertEqual(asset_copy._n_copies, 0)
 
+    def test_instantiate(self):
+        scene = sm.Scene()
+        box = sm.Box(name="box", material=sm.Material.RED)
+        positions = np.arange(12.0).reshape(4, 3)
+        instances = scene.instantiate(box, positions=positions, scalings=[1.0, 2.0, 3.0, 4.0])
+
+        self.assertEqual(len(scene.tree_children), 4)
+        for i, instance in enumerate(instances):
+            self.assertIs(instance.tree_parent, scene)
+            self.assertIs(instance.shared_mesh, box.shared_mesh)
+            self.assertIs(instance.material, box.material)
+            np.testing.assert_array_equal(instance.position, positions[i])
+            np.testing.assert_array_equal(instance.scaling, [i + 1.0] * 3)
+            # The collider of the box is copied but shares its mesh
+            self.assertEqual(len(instance.tree_children), 1)
+            self.assertIsInstance(instance.tree_children[0], sm.Collider)
+        self.assertIsNone(box.tree_parent)
+        # The shared primitive mesh is not copied for the template nor for the instances until it is modified
+        self.assertIs(box.shared_mesh, sm.Box().shared_mesh)
+        instances[0].mesh.points[:] *= 2.0
+        self.assertIs(instances[1].shared_mesh, box.shared_mesh)
+        np.testing.assert_array_equal(box.shared_mesh.points, sm.Box().mesh.points)
+
+        transforms = np.stack([instance.transformation_matrix for instance in instances])
+        instances = scene.instantiate(box, transforms=transforms)
+        np.testing.assert_allclose(instances[1].position, positions[1])
+
+        with self.assertRaises(ValueError):
+            scene.instantiate(box, positions=positions, scalings=[1.0, 2.0])
+        with self.assertRaises(TypeError):
+            scene.instantiate(sm.Asset(), positions=positions)
+
+    def test_structural_hash(self):
+        scene = sm.Scene()
+        box = sm.Box(name="box")
+        instance_a, instance_b = scene.instantiate(box, positions=[[0.0, 0.0, 0.0], [5.0, 0.0, 0.0]])
+        # Names and position of the subtree roots are not part of the hash
+        self.assertEqual(instance_a.structural_hash, instance_b.structural_hash)
+        self.assertNotEqual(instance_a.structural_hash, box.structural_hash)  # Different mesh objects
+
+        scene_hash = scene.structural_hash
+        instance_b.position = [1.0, 1.0, 1.0]
+        self.assertIsNone(scene._structural_hash)
+        self.assertNotEqual(scene.structural_hash, scene_hash)
+        self.assertEqual(instance_a.structural_hash, instance_b.structural_hash)
+
+        # Modifying a node of the subtree or adding a node invalidates the hash
+        instance_b.tree_children[0].bounding_box = [1.0, 2.0, 3.0]
+        self.assertNotEqual(instance_a.structural_hash, instance_b.structural_hash)
+        instance_b.tree_children[0].bounding_box = instance_a.tree_children[0].bounding_box
+        self.assertEqual(instance_a.structural_hash, instance_b.structural_hash)
+        instance_b += sm.Asset()
+        self.assertNotEqual(instance_a.structural_hash, instance_b.structural_hash)
+
+        # Reading the (lazily composed) transformation matrix is not a modification
+        scene_hash = scene.structural_hash
+        instance_a.transformation_matrix
+        self.assertIs(scene.structural_hash, scene_hash)
+
+        # In-place modifications are only seen when the hashes are recomputed
+        self.assertIs(scene._refresh_structural_hash(), scene_hash)
+        instance_a.tree_children[0].bounding_box[0] = 7.0
+        self.assertIs(scene.structural_hash, scene_hash)
+        self.assertNotEqual(scene._refresh_structural_hash(), scene_hash)
+
+    def test_cached_actor_spaces(self):
+        actor = sm.Capsule(name="actor", is_actor=True, children=[sm.StateSensor(name="sensor", sensor_tag="state")])
+        actor.actuator = sm.Actuator(n=1, mapping=[sm.ActionMapping("change_position")], actuator_tag="move")
+        action_space = actor.action_space
+        observation_space = actor.observation_space
+        self.assertIs(actor.action_space, action_space)
+        self.assertIs(actor.observation_space, observation_space)
+        self.assertIs(actor.action_tags, actor.action_tags)
+        self.assertEqual(actor.sensor_tags, ["state"])
+
+        # Moving the actor or its sensors keeps the cache
+        actor.position = [1.0, 0.0, 0.0]
+        actor.sensor.rotation = [0.0, 90.0, 0.0]
+        self.assertIs(actor.observation_space, observation_space)
+
+        # Changing the actuators or the sensors invalidates it
+        actor.actuator = sm.Actuator(n=2, mapping=[sm.ActionMapping("change_position")] * 2, actuator_tag="turn")
+        self.assertIsNot(actor.action_space, action_space)
+        self.assertEqual(actor.action_tags, ["turn"])
+        actor.sensor.sensor_tag = "other_state"
+        self.assertEqual(actor.sensor_tags, ["other_state"])
+        actor += sm.Camera(name="camera", sensor_tag="camera", width=16, height=16)
+        self.assertEqual(actor.sensor_tags, ["other_state", "camera"])
+        self.assertIn("camera", actor.observation_space.spaces)
+        actor.camera.tree_parent = None
+        self.assertEqual(actor.sensor_tags, ["other_state"])
+        actor.is_actor = False
+        self.assertIsNone(actor.action_space)
+
+        # Deeper nodes and nested actors invalidate the caches of all the actors above them
+        inner_actor = sm.Asset(name="inner_actor", is_actor=True, children=[sm.StateSensor(name="inner_sensor")])
+        inner_actor.inner_sensor.sensor_tag = "inner_state"
+        outer_actor = sm.Asset(name="outer_actor", is_actor=True, children=[sm.Asset(name="group") + inner_actor])
+        self.assertEqual(outer_actor.sensor_tags, ["inner_state"])
+        self.assertEqual(inner_actor.sensor_tags, ["inner_state"])
+        self.assertIsNotNone(outer_actor.group._actor_cache)
+        inner_actor.inner_sensor.sensor_tag = "other_inner_state"
+        self.assertEqual(outer_actor.sensor_tags, ["other_inner_state"])
+        self.assertEqual(inner_actor.sensor_tags, ["other_inner_state"])
+
     def test_enforce_unique_names(self):
         scene = sm.Scene()
         asset = sm.Asset() + [sm.Asset(name="bobby"), sm.Asset(name="alice")]
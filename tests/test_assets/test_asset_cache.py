@@ -0,0 +1,118 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pyvista as pv
+
+import simulate as sm
+
+
+class LocalHub:
+    """Stand-in for `hf_hub_download` serving the files of a local directory as a dataset repository."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.calls = []
+
+    def __call__(self, repo_id, filename, subfolder=None, revision=None, repo_type=None, **kwargs):
+        self.calls.append((repo_type, filename))
+        file_path = os.path.join(self.root, repo_id, subfolder or "", filename)
+        if repo_type == "space":
+            raise FileNotFoundError(f"{repo_id} is not a space")
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(file_path)
+        return file_path
+
+
+class AssetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.hub = LocalHub(os.path.join(self.tmp_dir.name, "hub"))
+        self.cache = sm.AssetCache(os.path.join(self.tmp_dir.name, "cache"))
+        patchers = [
+            mock.patch("simulate.assets.asset.hf_hub_download", self.hub),
+            mock.patch("simulate.assets.gltf_import.hf_hub_download", self.hub),
+            mock.patch("simulate.assets.asset_cache.SIMULATE_ASSET_CACHE", self.cache.cache_dir),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        scene = sm.Scene()
+        texture = pv.numpy_to_texture(np.random.randint(0, 255, size=(8, 8, 3), dtype=np.uint8))
+        scene += sm.Box(name="box", position=[1, 2, 3], material=sm.Material(base_color_texture=texture))
+        scene += sm.Sphere(name="sphere", is_actor=True, children=[sm.StateSensor(name="sensor")])
+        self.scene = scene
+        scene.save(os.path.join(self.hub.root, "org", "repo", "assets", "scene.gltf"), embed_resources=False)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_resolved_path_index(self):
+        self.assertIsNone(self.cache.get_resolved_path("org/repo", "scene.gltf", "assets"))
+        file_path = os.path.join(self.hub.root, "org", "repo", "assets", "scene.gltf")
+        self.cache.set_resolved_path("org/repo", "scene.gltf", file_path, "dataset", subfolder="assets")
+        self.assertEqual(self.cache.get_resolved_path("org/repo", "scene.gltf", "assets"), (file_path, "dataset"))
+        self.assertIsNone(self.cache.get_resolved_path("org/repo", "scene.gltf", "assets", revision="v1"))
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get_resolved_path("org/repo", "scene.gltf", "assets"))
+
+    def test_load_from_cache(self):
+        scene = sm.Scene.create_from("org/repo/assets/scene.gltf", use_cache=True)
+        first_calls = list(self.hub.calls)
+        self.assertIn(("dataset", "scene.gltf"), first_calls)
+
+        # The second load resolves the paths from the index and restores the tree from the snapshot
+        with mock.patch("simulate.assets.gltf_import.GLTF.load") as gltf_load:
+            cached_scene = sm.Scene.create_from("org/repo/assets/scene.gltf", use_cache=True)
+            gltf_load.assert_not_called()
+        self.assertEqual(self.hub.calls, first_calls)
+
+        self.assertEqual(cached_scene.as_glb_bytes(), scene.as_glb_bytes())
+        np.testing.assert_array_equal(cached_scene.box.position, [1, 2, 3])
+        np.testing.assert_array_equal(cached_scene.box.mesh.points, self.scene.box.mesh.points)
+        np.testing.assert_array_equal(
+            cached_scene.box.material.base_color_texture.to_array(),
+            self.scene.box.material.base_color_texture.to_array(),
+        )
+        self.assertEqual(
+            [child.name for child in cached_scene.sphere.tree_children],
+            [child.name for child in scene.sphere.tree_children],
+        )
+        self.assertIs(cached_scene.sphere.tree_children[0].tree_parent, cached_scene.sphere)
+
+        # A modified resource invalidates the snapshot
+        buffer_path = os.path.join(self.hub.root, "org", "repo", "assets", "scene.bin")
+        with open(buffer_path, "ab") as f:
+            f.write(b"\0" * 4)
+        with mock.patch("simulate.assets.gltf_import.GLTF.load", wraps=sm.assets.gltflib.GLTF.load) as gltf_load:
+            sm.Scene.create_from("org/repo/assets/scene.gltf", use_cache=True)
+            gltf_load.assert_called_once()
+
+    def test_no_cache_by_default(self):
+        sm.Scene.create_from("org/repo/assets/scene.gltf")
+        sm.Scene.create_from("org/repo/assets/scene.gltf")
+        self.assertEqual(self.hub.calls.count(("dataset", "scene.gltf")), 2)
+        self.assertFalse(os.path.exists(self.cache.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,15 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
+import functools
+import json
 import os
 import tempfile
+import threading
 
 # Lint as: python3
 import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import numpy as np
+import pyvista as pv
+from dataclasses_json import DataClassJsonMixin
 
 import simulate as sm
+from simulate.assets import gltf_export
+from simulate.assets.gltf_export import GltfExportCache, tree_as_gltf
+from simulate.assets.gltf_import import GLTFReader, load_gltf_as_tree, read_pyvista_meshes
+from simulate.assets.gltflib.models.gltf_model import GLTFModel
+from simulate.assets.gltflib.utils import replace_unique_id_and_remove_none
 
 
 FIXTURE_BOX_FILE = os.path.join(os.path.dirname(__file__), "fixtures", "Box.gltf")
@@ -145,3 +159,373 @@ class GltfTest(unittest.TestCase):
             np.testing.assert_array_equal(
                 scene.tree_children[0].transformation_matrix, scene2.tree_children[0].transformation_matrix
             )
+
+    def test_save_reload_instances(self):
+        scene = sm.Scene()
+        box = sm.Box(name="box", with_collider=False)
+        positions = np.arange(30.0).reshape(10, 3)
+        scene.instantiate(box, positions=positions)
+
+        gltf = tree_as_gltf(scene)
+        self.assertEqual(len(gltf.model.meshes), 1)
+        self.assertEqual(len(gltf.model.nodes), 11)
+
+        scene.instantiate(sm.Box(name="box_with_collider"), positions=positions)
+        gltf = tree_as_gltf(scene)
+        self.assertEqual(len(gltf.model.extensions.HF_colliders.objects), 1)
+        scene.tree_children = scene.tree_children[:10]
+
+        gltf = tree_as_gltf(scene, gpu_instancing=True)
+        self.assertEqual(len(gltf.model.meshes), 1)
+        self.assertEqual(len(gltf.model.nodes), 2)
+        self.assertIn("EXT_mesh_gpu_instancing", gltf.model.extensionsUsed)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test.gltf")
+            scene.save(file_path, gpu_instancing=True)
+
+            scene2 = sm.Scene.create_from(file_path)
+            instances = scene2.tree_children[0].tree_children
+            self.assertEqual(len(instances), 10)
+            self.assertEqual([instance.name for instance in instances], [f"box_instance{i}" for i in range(10)])
+            self.assertIs(instances[0].mesh, instances[-1].mesh)
+            np.testing.assert_allclose(np.stack([instance.position for instance in instances]), positions)
+
+            # All the instancing attributes are optional (here only TRANSLATION)
+            instancing = gltf.model.nodes[1].extensions.EXT_mesh_gpu_instancing
+            instancing.attributes = {"TRANSLATION": instancing.attributes["TRANSLATION"]}
+            file_path = os.path.join(tmpdir, "translation_only.glb")
+            gltf.export(file_path)
+            instances = load_gltf_as_tree(file_path)[0].tree_children[0].tree_children
+            self.assertEqual(len(instances), 10)
+            np.testing.assert_allclose(np.stack([instance.position for instance in instances]), positions)
+            for instance in instances:
+                np.testing.assert_array_equal(instance.rotation, [0.0, 0.0, 0.0, 1.0])
+                np.testing.assert_array_equal(instance.scaling, [1.0, 1.0, 1.0])
+
+    def test_export_cache(self):
+        scene = sm.Scene()
+        box = sm.Box(name="box", with_collider=False)
+        scene += box
+        scene += sm.Sphere(name="sphere", with_collider=False)
+
+        gltf = tree_as_gltf(scene)
+        export_cache = scene._export_cache
+        self.assertEqual(len(export_cache), 2)
+        self.assertIsNotNone(export_cache.get(box.shared_mesh))
+        self.assertEqual(tree_as_gltf(scene).model.to_json(), gltf.model.to_json())
+
+        # Modified meshes are encoded again
+        box.mesh.points[0] = [-1.0, -1.0, -1.0]
+        self.assertIsNone(export_cache.get(box.mesh))
+        gltf = tree_as_gltf(scene)
+        self.assertEqual(gltf.model.accessors[0].min, [-1.0, -1.0, -1.0])
+
+        # Also when they are modified through numpy views, which don't bump the VTK modification time
+        np.asarray(box.mesh.points)[0] = [100.0, 100.0, 100.0]
+        self.assertIsNone(export_cache.get(box.mesh))
+        gltf = tree_as_gltf(scene)
+        self.assertEqual(gltf.model.accessors[0].max, [100.0, 100.0, 100.0])
+        np.asarray(box.mesh.point_data["Normals"])[0] = [0.0, 0.0, 1.0]
+        self.assertIsNone(export_cache.get(box.mesh))
+
+        texture, texture_cache = pv.Texture(np.zeros((4, 4, 3), dtype=np.uint8)), GltfExportCache()
+        texture_cache.set(texture, "encoded")
+        self.assertEqual(texture_cache.get(texture), "encoded")
+        np.asarray(texture.GetInput().point_data["Image"])[0] = 255
+        self.assertIsNone(texture_cache.get(texture))
+
+        # Meshes removed from the tree are dropped
+        scene.remove(scene.sphere)
+        tree_as_gltf(scene)
+        self.assertEqual(len(export_cache), 1)
+
+    def test_export_after_in_place_edit(self):
+        scene = sm.Scene()
+        boxes = sm.Box.batch(
+            [[0, 0, 0], [2, 0, 0], [4, 0, 0]],
+            with_collider=True,
+            physics_component=sm.RigidBodyComponent(mass=1.0),
+            material=sm.Material.RED,
+            parent=scene,
+        )
+        add_node_resources = mock.Mock(wraps=gltf_export.add_node_resources_to_model)
+        with mock.patch("simulate.assets.gltf_export.add_node_resources_to_model", add_node_resources):
+            gltf = tree_as_gltf(scene)
+        self.assertEqual(len(gltf.model.extensions.HF_rigid_bodies.objects), 1)
+        self.assertEqual(len(gltf.model.extensions.HF_colliders.objects), 1)
+        self.assertEqual(add_node_resources.call_count, 3)  # The scene, a box and a collider (same hashes)
+
+        # In-place edits are not seen by the cached structural hashes, the export recomputes them
+        boxes[1].physics_component.mass = 10.0
+        boxes[2].tree_children[0].bounding_box[0] = 7.0
+        add_node_resources.reset_mock()
+        with mock.patch("simulate.assets.gltf_export.add_node_resources_to_model", add_node_resources):
+            gltf = tree_as_gltf(scene)
+        self.assertEqual(add_node_resources.call_count, 6)  # The scene, the three boxes and two colliders
+        rigid_bodies = gltf.model.extensions.HF_rigid_bodies.objects
+        colliders = gltf.model.extensions.HF_colliders.objects
+        self.assertEqual(sorted(rigid_body.mass for rigid_body in rigid_bodies), [1.0, 10.0])
+        self.assertEqual(sorted(list(collider.bounding_box) for collider in colliders), [[1, 1, 1], [7, 1, 1]])
+
+    def test_write_glb(self):
+        scene = sm.Scene()
+        scene += sm.Box(name="box", with_collider=False)
+        scene += sm.Sphere(name="sphere", with_collider=False)
+        glb_bytes = scene.as_glb_bytes()
+        self.assertEqual(glb_bytes[:4], b"glTF")
+
+        # Streamed to a file, a file-like object or a pre-allocated buffer
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_path = os.path.join(tmpdirname, "scene.glb")
+            with open(file_path, "wb") as f:
+                self.assertEqual(scene.write_glb(f), len(glb_bytes))
+            with open(file_path, "rb") as f:
+                self.assertEqual(f.read(), glb_bytes)
+
+        gltf = tree_as_gltf(scene)
+        buffer = bytearray(gltf.glb_bytelength())
+        self.assertEqual(gltf.write_glb(memoryview(buffer)), len(glb_bytes))
+        self.assertEqual(bytes(buffer), glb_bytes)
+        with self.assertRaises(ValueError):
+            gltf.write_glb(bytearray(16))
+
+        # The glTF object is not modified by the export
+        self.assertEqual(gltf.model.buffers[0].uri, "scene.bin")
+        self.assertEqual(len(gltf.glb_resources), 0)
+
+    def test_save_glb_and_external_resources(self):
+        scene = sm.Scene()
+        texture = sm.Material(base_color_texture=pv.Texture(np.zeros((4, 4, 3), dtype=np.uint8)))
+        scene += sm.Box(name="box", position=[1.0, 0.0, 0.0], material=texture, with_collider=False)
+        scene += sm.Sphere(name="sphere", with_collider=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            glb_path = os.path.join(tmpdir, "test.glb")
+            self.assertEqual(scene.save(glb_path), [glb_path])
+            with open(glb_path, "rb") as f:
+                self.assertEqual(f.read(), scene.as_glb_bytes())
+
+            file_path = os.path.join(tmpdir, "test.gltf")
+            saved_files = scene.save(file_path, embed_resources=False, max_buffer_size=1024)
+            saved_names = sorted(os.path.basename(saved_file) for saved_file in saved_files)
+            self.assertIn("test_image0.png", saved_names)
+            self.assertIn("test_0.bin", saved_names)
+            self.assertIn("test_1.bin", saved_names)
+
+            gltf = sm.assets.gltflib.GLTF.load(file_path)
+            self.assertEqual(gltf.model.images[0].uri, "test_image0.png")
+            self.assertTrue(all(buffer.byteLength <= 1024 for buffer in gltf.model.buffers[:-1]))
+
+            embedded_path = os.path.join(tmpdir, "embedded.gltf")
+            scene.save(embedded_path)
+            reference = sm.Scene.create_from(embedded_path)
+            for path in (glb_path, file_path):
+                scene2 = sm.Scene.create_from(path)
+                np.testing.assert_array_equal(scene2.box.mesh.points, reference.box.mesh.points)
+                np.testing.assert_array_equal(scene2.box.position, reference.box.position)
+                np.testing.assert_array_equal(scene2.sphere.mesh.points, reference.sphere.mesh.points)
+                self.assertIsNotNone(scene2.box.material.base_color_texture)
+
+    def test_parallel_encoding(self):
+        scene = sm.Scene()
+        texture = sm.Material(base_color_texture=pv.Texture(np.zeros((4, 4, 3), dtype=np.uint8)))
+        for i in range(8):
+            scene += sm.Sphere(name=f"sphere{i}", theta_resolution=8 + i, material=texture, with_collider=False)
+
+        serial_gltf = tree_as_gltf(scene, export_cache=GltfExportCache(), max_workers=1)
+        export_cache = GltfExportCache()
+        parallel_gltf = tree_as_gltf(scene, export_cache=export_cache, max_workers=4)
+        self.assertEqual(len(export_cache), 9)
+        self.assertEqual(parallel_gltf.model.to_json(), serial_gltf.model.to_json())
+        self.assertEqual(parallel_gltf.resources[0].data, serial_gltf.resources[0].data)
+
+        # The exports share a bounded pool, not used for a few resources
+        get_encoding_pool = mock.Mock(wraps=gltf_export._get_encoding_pool)
+        with mock.patch("simulate.assets.gltf_export._get_encoding_pool", get_encoding_pool):
+            tree_as_gltf(scene, export_cache=GltfExportCache(), max_workers=4)
+            tree_as_gltf(scene, export_cache=GltfExportCache(), max_workers=4)
+            tree_as_gltf(sm.Scene() + sm.Box(with_collider=False), export_cache=GltfExportCache())
+        self.assertEqual(get_encoding_pool.call_count, 2)
+        self.assertIs(gltf_export._get_encoding_pool(), gltf_export._get_encoding_pool())
+        self.assertLessEqual(gltf_export._get_encoding_pool()._max_workers, gltf_export.MAX_ENCODING_THREADS)
+
+    def test_quantized_export(self):
+        scene = sm.Scene()
+        scene += sm.Sphere(name="sphere", position=[1.0, 0.0, 0.0], radius=2.0, with_collider=False)
+        scene += sm.Plane(name="plane", with_collider=False)
+
+        self.assertLess(len(scene.as_glb_bytes(quantize=True)), len(scene.as_glb_bytes()))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "quantized.gltf")
+            scene.save(file_path, quantize=True)
+            gltf = sm.assets.gltflib.GLTF.load(file_path)
+            self.assertIn("KHR_mesh_quantization", gltf.model.extensionsRequired)
+
+            reference = sm.Scene.create_from(scene.save(os.path.join(tmpdir, "reference.gltf"))[0])
+            scene2 = sm.Scene.create_from(file_path)
+            self.assertEqual(
+                [node.name for node in scene2.tree_descendants], [node.name for node in reference.tree_descendants]
+            )
+            np.testing.assert_allclose(scene2.sphere.position, reference.sphere.position)
+            np.testing.assert_allclose(scene2.sphere.mesh.points, reference.sphere.mesh.points, atol=1e-3)
+            np.testing.assert_allclose(
+                scene2.sphere.mesh.active_normals, reference.sphere.mesh.active_normals, atol=1e-3
+            )
+            np.testing.assert_allclose(
+                scene2.plane.mesh.active_t_coords, reference.plane.mesh.active_t_coords, atol=1e-4
+            )
+
+    def test_numpy_mesh_decoding(self):
+        scene = sm.Scene()
+        scene += sm.Sphere(name="sphere", position=[1.0, 0.0, 0.0], with_collider=False)
+        scene += sm.Plane(name="plane", with_collider=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = scene.save(os.path.join(tmpdir, "scene.glb"))[0]
+            gltf_scene = sm.assets.gltflib.GLTF.load(file_path)
+            meshes = read_pyvista_meshes(gltf_scene)
+            vtk_reader = GLTFReader(file_path)
+            vtk_reader.reader.ApplyDeformationsToGeometryOff()
+            vtk_meshes = vtk_reader.read()
+
+            def assert_same_meshes(node_meshes, vtk_node_meshes):
+                for key, value in node_meshes.items():
+                    if key.startswith("Node_"):
+                        assert_same_meshes(value, vtk_node_meshes[key])
+                        continue
+                    mesh, vtk_mesh = value[0], vtk_node_meshes[key][0]
+                    np.testing.assert_array_equal(mesh.points, vtk_mesh.points)
+                    np.testing.assert_array_equal(mesh.faces, vtk_mesh.faces)
+                    np.testing.assert_array_equal(mesh.active_normals, vtk_mesh.active_normals)
+                    np.testing.assert_array_equal(mesh.active_t_coords, vtk_mesh.active_t_coords)
+
+            assert_same_meshes(meshes, vtk_meshes)
+
+            # Attributes we don't decode ourselves are left to the VTK reader
+            gltf_scene.model.meshes[0].primitives[0].attributes.COLOR_0 = 0
+            with self.assertRaises(NotImplementedError):
+                read_pyvista_meshes(gltf_scene)
+
+    def test_lazy_loading(self):
+        scene = sm.Scene()
+        texture = pv.numpy_to_texture(np.zeros((4, 4, 3), dtype=np.uint8))
+        scene += sm.Sphere(name="sphere", material=sm.Material(base_color_texture=texture), with_collider=False)
+        scene += sm.Box(name="box", position=[2.0, 0.0, 0.0])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = scene.save(os.path.join(tmpdir, "scene.glb"))[0]
+            reference = sm.Scene.create_from(file_path)
+            lazy_scene = sm.Scene.create_from(file_path, lazy=True)
+
+            self.assertEqual(
+                [node.name for node in lazy_scene.tree_descendants],
+                [node.name for node in reference.tree_descendants],
+            )
+            self.assertFalse(lazy_scene.sphere.is_mesh_loaded)
+            self.assertFalse(lazy_scene.sphere.material.are_textures_loaded)
+
+            # Loaded on first access
+            np.testing.assert_array_equal(lazy_scene.sphere.mesh.points, reference.sphere.mesh.points)
+            self.assertTrue(lazy_scene.sphere.is_mesh_loaded)
+            self.assertIsInstance(lazy_scene.sphere.material.base_color_texture, pv.Texture)
+            self.assertTrue(lazy_scene.sphere.material.are_textures_loaded)
+            lazy_scene.prefetch()
+            self.assertTrue(lazy_scene.box.is_mesh_loaded)
+            self.assertEqual(lazy_scene.as_glb_bytes(), reference.as_glb_bytes())
+
+            # Copies load their own mesh
+            lazy_scene = sm.Scene.create_from(file_path, lazy=True)
+            box_copy = lazy_scene.box.copy()
+            self.assertFalse(box_copy.is_mesh_loaded)
+            self.assertIsNot(box_copy.mesh, lazy_scene.box.mesh)
+            np.testing.assert_array_equal(box_copy.mesh.points, reference.box.mesh.points)
+
+    def test_concurrent_resource_loading(self):
+        scene = sm.Scene()
+        for i in range(2):
+            texture = pv.numpy_to_texture(np.full((4, 4, 3), i * 100, dtype=np.uint8))
+            scene += sm.Box(name=f"box_{i}", position=[i, 0, 0], material=sm.Material(base_color_texture=texture))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hub_dir = os.path.join(tmpdir, "org", "repo")
+            file_path = scene.save(os.path.join(hub_dir, "scene.gltf"), embed_resources=False)[0]
+            n_resources = len([name for name in os.listdir(hub_dir) if name != "scene.gltf"])
+            self.assertEqual(n_resources, 3)  # One buffer and two images
+
+            # Stand-in for the hub serving the local directory
+            downloads = []
+
+            def hub_download(repo_id, filename, subfolder=None, revision=None, repo_type=None, barrier=None):
+                if barrier is not None:
+                    barrier.wait()
+                downloads.append(filename)
+                return os.path.join(tmpdir, repo_id, subfolder or "", filename)
+
+            # All the downloads must run at the same time to pass the barrier
+            barrier = threading.Barrier(n_resources, timeout=10)
+            with mock.patch(
+                "simulate.assets.gltf_import.hf_hub_download", functools.partial(hub_download, barrier=barrier)
+            ):
+                nodes = load_gltf_as_tree(file_path, repo_id="org/repo", max_workers=n_resources)
+            with mock.patch("simulate.assets.gltf_import.hf_hub_download", hub_download):
+                serial_nodes = load_gltf_as_tree(file_path, repo_id="org/repo", max_workers=1)
+            self.assertEqual(len(downloads), 2 * n_resources)
+
+            reference = sm.Scene.create_from(file_path)
+            for loaded_nodes in (nodes, serial_nodes):
+                loaded = {node.name: node for root in loaded_nodes for node in (root,) + root.tree_descendants}
+                for i in range(2):
+                    np.testing.assert_array_equal(
+                        loaded[f"box_{i}"].material.base_color_texture.to_array(),
+                        reference.get_node(f"box_{i}").material.base_color_texture.to_array(),
+                    )
+
+    def test_json_codec(self):
+        scene = sm.Scene()
+        scene += sm.LightSun(name="sun", intensity=0.9)
+        actor = sm.Capsule(name="actor", is_actor=True)
+        actor += sm.Camera(name="camera", width=40, height=40)
+        actor += sm.RaycastSensor(n_horizontal_rays=12, n_vertical_rays=4)
+        actor.physics_component = sm.RigidBodyComponent(mass=2.0)
+        target = sm.Box(name="target", position=[1.0, 0.5, 1.0])
+        actor += sm.RewardFunction(entity_a=target, entity_b=actor)
+        scene += [actor, target]
+
+        model = tree_as_gltf(scene).model
+        model.nodes[0].extras = {"a": None, "b": [{"c": None}, [{"d": None}]], "e": ({"f": None},)}
+        reference = json.dumps(replace_unique_id_and_remove_none(dataclasses.asdict(model)))
+        self.assertEqual(model.to_json(), reference)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            reference_model = DataClassJsonMixin.from_json.__func__(GLTFModel, reference)
+        decoded_model = GLTFModel.from_json(reference)
+        self.assertEqual(decoded_model.accessors, reference_model.accessors)
+        self.assertEqual(decoded_model.nodes, reference_model.nodes)
+        self.assertEqual(decoded_model.to_json(), reference_model.to_json())
+
+    def test_export_does_not_modify_tree(self):
+        scene = sm.Scene()
+        target = sm.Box(name="target", position=[1.0, 0.5, 1.0])
+        actor = sm.Capsule(name="actor", is_actor=True)
+        actor += sm.StateSensor(target, actor, "position")
+        actor += sm.RewardFunction(entity_a=target, entity_b=actor)
+        box = sm.Box(name="box", with_collider=False)
+        box += sm.Collider(name="box_collider", material=sm.PhysicMaterial(dynamic_friction=0.5))
+        scene += [target, actor, box]
+
+        structural_hash = scene.structural_hash
+        glb_bytes = scene.as_glb_bytes()
+        self.assertEqual(scene._structural_hash, structural_hash)  # Nothing was set on the nodes
+        self.assertIs(actor.tree_children[-1].entity_a, target)
+        self.assertIsNone(box.box_collider.physic_material)
+
+        gltf = tree_as_gltf(scene)
+        self.assertEqual(gltf.model.extensions.HF_reward_functions.objects[0].entity_a, "target")
+        self.assertEqual(gltf.model.extensions.HF_colliders.objects[-1].physic_material, 0)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: scene.as_glb_bytes(), range(8)))
+        self.assertTrue(all(result == glb_bytes for result in results))
@@ -281,6 +281,79 @@ class ObjectsTest(unittest.TestCase):
         self.assertTrue(any(bool(isinstance(node, sm.Collider) and node.type == "box") for node in asset.tree_children))
         self.assertTrue(any(bool(isinstance(node, sm.Collider) and node.bounding_box == [1.0, 1.0, 1.0]) for node in asset.tree_children))
 
+    def test_primitive_mesh_cache(self):
+        box_1 = sm.Box(position=[1.0, 0.0, 0.0])
+        box_2 = sm.Box(position=[2.0, 0.0, 0.0], set_mesh_direction=[0.0, 1.0, 0.0])
+        box_3 = sm.Box(bounds=[1.0, 2.0, 1.0])
+        self.assertIs(box_1.shared_mesh, box_2.shared_mesh)
+        self.assertIsNot(box_1.shared_mesh, box_3.shared_mesh)
+        self.assertIs(box_1.copy().shared_mesh, box_1.shared_mesh)
+        self.assertIsNot(sm.Box(set_mesh_direction=[1.0, 0.0, 0.0]).shared_mesh, box_1.shared_mesh)
+
+        # Copy-on-write: accessing the mesh of an object gives it its own copy
+        box_1.mesh.points[:] += 1.0
+        self.assertIsNot(box_1.mesh, box_2.shared_mesh)
+        self.assertIs(box_1.mesh, box_1.shared_mesh)
+        np.testing.assert_allclose(box_2.mesh.points, box_1.mesh.points - 1.0)
+        np.testing.assert_allclose(sm.Box().mesh.points, box_2.mesh.points)
+
+        sm.clear_primitive_mesh_cache()
+        self.assertIsNot(sm.Box().shared_mesh, box_2.shared_mesh)
+
+    def test_batch(self):
+        positions = np.random.uniform(-10, 10, size=(4, 3))
+        rotations = np.random.uniform(0, 90, size=(4, 3))
+        scalings = np.random.uniform(0.5, 2, size=(4,))
+        material = sm.Material.RED
+        scene_loop = sm.Scene()
+        for i in range(4):
+            scene_loop += sm.Box(
+                name=f"wall_{i}",
+                position=positions[i],
+                rotation=rotations[i],
+                scaling=scalings[i],
+                bounds=[2, 1, 1],
+                material=material,
+                with_collider=True,
+                with_rigid_body=True,
+            )
+
+        scene = sm.Scene()
+        walls = sm.Box.batch(
+            positions,
+            rotations=rotations,
+            scalings=scalings,
+            bounds=[2, 1, 1],
+            material=material,
+            with_collider=True,
+            with_rigid_body=True,
+            name_prefix="wall",
+            parent=scene,
+        )
+        self.assertEqual(len(walls), 4)
+        self.assertEqual(scene.tree_children, tuple(walls))
+        self.assertEqual(scene.structural_hash, scene_loop.structural_hash)
+        for wall, wall_loop in zip(walls, scene_loop.tree_children):
+            self.assertEqual(wall.name, wall_loop.name)
+            self.assertEqual(wall.tree_children[0].name, wall_loop.tree_children[0].name)
+            np.testing.assert_allclose(wall.transformation_matrix, wall_loop.transformation_matrix)
+        self.assertIs(walls[0].material, walls[1].material)
+        self.assertIsNot(walls[0].physics_component, walls[1].physics_component)
+        self.assertIsNot(walls[0].tree_children[0].bounding_box, walls[1].tree_children[0].bounding_box)
+
+        # The objects share the mesh until it is modified
+        self.assertIs(walls[0].shared_mesh, walls[1].shared_mesh)
+        walls[0].mesh.points[:] += 1.0
+        np.testing.assert_allclose(walls[1].mesh.points, scene_loop.wall_1.mesh.points)
+
+        spheres = sm.Sphere.batch(np.zeros((2, 3)), rotations=[[0, 0, 0, 2], [0, 0, 0, 1]], scalings=[[1, 2, 3]] * 2)
+        self.assertIsNot(spheres[0].material, spheres[1].material)
+        self.assertNotEqual(spheres[0].name, spheres[1].name)
+        np.testing.assert_allclose(spheres[0].rotation, [0, 0, 0, 1])
+        np.testing.assert_allclose(spheres[1].scaling, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            sm.Box.batch(np.zeros((2, 2)))
+
     def test_cone(self):
         asset = sm.Cone()
         default_faces = np.array([ 6,  6,  5,  4,  3,  2,  1,  3,  0, 12, 14,  3,  7, 15, 16,  3,  8,
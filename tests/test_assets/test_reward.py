@@ -49,6 +49,8 @@ class RewardsTest(unittest.TestCase):
         with self.assertRaises(sm.assets.anytree.TreeError):
             reward += b
             scene.show()
+        with self.assertRaises(TypeError):  # Also a TypeError, as before the children were checked on attachment
+            reward += b
 
     def test_obj_position(self):
         obj = sm.RewardFunction()
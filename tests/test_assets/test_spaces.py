@@ -0,0 +1,92 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+import unittest
+
+import numpy as np
+
+from simulate.assets import spaces
+
+
+class SpacesTest(unittest.TestCase):
+    def test_sample_batch(self):
+        test_spaces = [
+            spaces.Box(low=-1.0, high=2.0, shape=(3, 4)),
+            spaces.Box(low=np.array([-np.inf, 0.0, -np.inf, 1.0]), high=np.array([np.inf, np.inf, 5.0, 3.0])),
+            spaces.Box(low=0, high=10, shape=(5,), dtype=np.int32),
+            spaces.Box(low=-1.0, high=1.0, shape=()),
+            spaces.Discrete(7),
+            spaces.MultiDiscrete([3, 4, 5]),
+            spaces.MultiBinary([2, 3]),
+        ]
+        for space in test_spaces:
+            samples = space.sample_batch((4, 5))
+            self.assertEqual(samples.shape, (4, 5) + space.shape)
+            self.assertEqual(samples.dtype, space.dtype)
+            self.assertTrue(np.all(space.contains_batch(samples)))
+            self.assertTrue(all(space.contains(sample) for sample in samples.reshape((20,) + space.shape)))
+            self.assertEqual(space.sample(6).shape, (6,) + space.shape)
+
+            # A batch of one sample is sampled like a single sample
+            space.seed(42)
+            sample = space.sample()
+            space.seed(42)
+            np.testing.assert_array_equal(space.sample_batch(()), sample)
+
+    def test_contains_batch(self):
+        box = spaces.Box(low=np.array([0.0, -1.0]), high=np.array([1.0, 1.0]))
+        batch = np.array([[0.5, 0.0], [1.5, 0.0], [0.5, -2.0]], dtype=np.float32)
+        np.testing.assert_array_equal(box.contains_batch(batch), [True, False, False])
+        np.testing.assert_array_equal(box.contains_batch(batch.astype(np.float64)), [False, False, False])
+        np.testing.assert_array_equal(box.contains_batch(np.zeros((3, 3), dtype=np.float32)), [False, False, False])
+
+        discrete = spaces.Discrete(3)
+        np.testing.assert_array_equal(discrete.contains_batch([[0, 2], [3, -1]]), [[True, True], [False, False]])
+        np.testing.assert_array_equal(discrete.contains_batch([0.0, 1.0]), [False, False])
+
+        multi_discrete = spaces.MultiDiscrete([2, 3])
+        np.testing.assert_array_equal(multi_discrete.contains_batch([[1, 2], [2, 0]]), [True, False])
+        multi_binary = spaces.MultiBinary(2)
+        np.testing.assert_array_equal(multi_binary.contains_batch([[1, 0], [2, 0]]), [True, False])
+
+        dict_space = spaces.Dict({"position": box, "action": discrete})
+        samples = dict_space.sample(5)
+        self.assertEqual(list(samples), ["action", "position"])
+        self.assertTrue(np.all(dict_space.contains_batch(samples)))
+        samples["action"][2] = 3
+        np.testing.assert_array_equal(dict_space.contains_batch(samples), [True, True, False, True, True])
+        with self.assertRaises(ValueError):
+            dict_space.contains_batch({"action": samples["action"]})
+
+        tuple_space = spaces.Tuple((discrete, multi_binary))
+        samples = tuple_space.sample_batch(4)
+        self.assertEqual(samples[1].shape, (4, 2))
+        np.testing.assert_array_equal(tuple_space.contains_batch(samples), [True] * 4)
+        with self.assertRaises(ValueError):
+            tuple_space.contains_batch(samples[:1])
+
+    def test_box_sampling_masks(self):
+        box = spaces.Box(low=np.array([-np.inf, 0.0]), high=np.array([np.inf, 1.0]), seed=0)
+        state = box.__dict__.copy()
+        for name in ["_unbounded", "_upp_bounded", "_low_bounded", "_bounded", "_n_unbounded"]:
+            del state[name]
+        legacy_box = spaces.Box.__new__(spaces.Box)
+        legacy_box.__setstate__(state)  # as when unpickling a box pickled before the masks were precomputed
+        np.testing.assert_array_equal(legacy_box._bounded, [False, True])
+        self.assertTrue(np.all(legacy_box.contains_batch(legacy_box.sample_batch(3))))
+
+        box.seed(0)
+        legacy_box.seed(0)
+        np.testing.assert_array_equal(legacy_box.sample(), box.sample())
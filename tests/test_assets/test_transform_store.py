@@ -0,0 +1,120 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+import gc
+import unittest
+
+import numpy as np
+
+import simulate as sm
+
+
+class TransformStoreTest(unittest.TestCase):
+    def test_assets_bound_in_context(self):
+        with sm.TransformStore(capacity=2) as store:
+            assets = [sm.Asset(position=[i, 0.0, 0.0]) for i in range(5)]
+            sensor = sm.StateSensor(position=[0.0, 1.0, 0.0])
+        outside = sm.Asset()
+
+        self.assertEqual(len(store), 6)
+        self.assertGreaterEqual(store.capacity, 6)
+        self.assertIsNone(outside._transform_store)
+        for i, asset in enumerate(assets):
+            self.assertIs(asset._transform_store, store)
+            np.testing.assert_array_equal(asset.position, [i, 0.0, 0.0])
+            np.testing.assert_array_equal(store.positions[asset._transform_index], [i, 0.0, 0.0])
+        np.testing.assert_array_equal(sensor.position, [0.0, 1.0, 0.0])
+
+    def test_property_api(self):
+        asset_ref = sm.Asset(position=[1.0, 2.0, 3.0], rotation=[0.0, 45.0, 0.0], scaling=[1.0, 2.0, 1.0])
+        with sm.TransformStore() as store:
+            asset = sm.Asset(position=[1.0, 2.0, 3.0], rotation=[0.0, 45.0, 0.0], scaling=[1.0, 2.0, 1.0])
+
+        np.testing.assert_allclose(asset.rotation, asset_ref.rotation)
+        np.testing.assert_allclose(asset.transformation_matrix, asset_ref.transformation_matrix)
+        np.testing.assert_allclose(store.matrices[asset._transform_index], asset_ref.transformation_matrix)
+
+        asset.translate_x(1.0).rotate_y(30.0).scale(2.0)
+        asset_ref.translate_x(1.0).rotate_y(30.0).scale(2.0)
+        np.testing.assert_allclose(asset.position, asset_ref.position)
+        np.testing.assert_allclose(asset.rotation, asset_ref.rotation)
+        np.testing.assert_allclose(asset.scaling, asset_ref.scaling)
+        np.testing.assert_allclose(asset.transformation_matrix, asset_ref.transformation_matrix)
+
+        asset.transformation_matrix = asset_ref.transformation_matrix
+        np.testing.assert_allclose(asset.position, asset_ref.position)
+        np.testing.assert_allclose(asset.scaling, asset_ref.scaling)
+
+    def test_add_and_remove(self):
+        root = sm.Asset(position=[1.0, 0.0, 0.0], children=[sm.Asset(position=[0.0, 1.0, 0.0])])
+        store = sm.TransformStore().add_tree(root)
+        self.assertEqual(len(store), 2)
+        np.testing.assert_array_equal(store.positions[root._transform_index], [1.0, 0.0, 0.0])
+
+        child = root.tree_children[0]
+        store.remove(child)
+        self.assertIsNone(child._transform_store)
+        np.testing.assert_array_equal(child.position, [0.0, 1.0, 0.0])
+        self.assertEqual(len(store), 1)
+
+    def test_rows_released_on_garbage_collection(self):
+        with sm.TransformStore() as store:
+            assets = [sm.Asset() for _ in range(3)]
+        del assets
+        gc.collect()
+        self.assertEqual(len(store), 0)
+
+    def test_world_matrices(self):
+        with sm.TransformStore() as store:
+            root = sm.Asset(position=[1.0, 0.0, 0.0], rotation=[0.0, 90.0, 0.0])
+            child = sm.Asset(position=[0.0, 0.0, 2.0], scaling=2.0, parent=root)
+            grandchild = sm.Asset(position=[0.0, 1.0, 0.0], parent=child)
+
+        world = store.world_matrices()
+        expected = root.transformation_matrix @ child.transformation_matrix @ grandchild.transformation_matrix
+        np.testing.assert_allclose(world[grandchild._transform_index], expected)
+        np.testing.assert_allclose(world[root._transform_index], root.transformation_matrix)
+
+    def test_snapshot_restore(self):
+        with sm.TransformStore() as store:
+            asset = sm.Asset(position=[1.0, 2.0, 3.0])
+        snapshot = store.snapshot()
+        asset.position = [0.0, 0.0, 0.0]
+        store.restore(snapshot)
+        np.testing.assert_array_equal(asset.position, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(asset.transformation_matrix[:3, 3], [1.0, 2.0, 3.0])
+
+    def test_write_arrays(self):
+        with sm.TransformStore() as store:
+            box = sm.Box()
+            child = sm.Asset(position=[0.0, 1.0, 0.0], parent=box)
+        np.testing.assert_array_equal(box.transformation_matrix[:3, 3], [0.0, 0.0, 0.0])
+        np.testing.assert_array_equal(store.world_matrices()[child._transform_index][:3, 3], [0.0, 1.0, 0.0])
+
+        # Direct (bulk) writes to the arrays of the store are seen by the matrices
+        index = box._transform_index
+        store.positions[index] = [5.0, 0.0, 0.0]
+        np.testing.assert_array_equal(box.position, [5.0, 0.0, 0.0])
+        np.testing.assert_array_equal(box.transformation_matrix[:3, 3], [5.0, 0.0, 0.0])
+        np.testing.assert_array_equal(store.world_matrices()[child._transform_index][:3, 3], [5.0, 1.0, 0.0])
+
+        store.scalings[[index, child._transform_index]] = 2.0
+        np.testing.assert_allclose(store.matrices[index][:3, :3], 2.0 * np.eye(3))
+        np.testing.assert_allclose(store.world_matrices()[child._transform_index][:3, 3], [5.0, 2.0, 0.0])
+
+        # In-place edits of the position of an asset write its row
+        box.position[1] += 1.0
+        np.testing.assert_array_equal(store.positions[index], [5.0, 1.0, 0.0])
+        np.testing.assert_array_equal(box.transformation_matrix[:3, 3], [5.0, 1.0, 0.0])
@@ -76,3 +76,53 @@ class UtilsTest(unittest.TestCase):
         euler = [0.0, 0.0, 90.0]
         rotation = sm.utils.rotation_from_euler_degrees(*euler)
         np.testing.assert_allclose(rotation, [0.0, 0.0, np.sin(np.pi / 4), np.cos(np.pi / 4)], rtol=1e-03)
+
+    def test_batched_transforms(self):
+        rng = np.random.default_rng(0)
+        translations = rng.normal(size=(8, 3))
+        angles = rng.uniform(-180, 180, size=(8, 3))
+        scales = rng.uniform(0.1, 3.0, size=(8, 3))
+
+        rotations = sm.quaternions_from_euler_degrees(angles)
+        for angle, rotation in zip(angles, rotations):
+            np.testing.assert_array_equal(rotation, sm.utils.rotation_from_euler_degrees(*angle))
+        np.testing.assert_allclose(np.linalg.norm(rotations, axis=-1), 1.0)
+        round_trip = sm.quaternions_from_euler_radians(sm.euler_radians_from_quaternions(rotations))
+        np.testing.assert_allclose(np.abs(np.sum(round_trip * rotations, axis=-1)), 1.0)  # q and -q are the same
+
+        matrices = sm.compose_transforms(translations, rotations, scales)
+        self.assertEqual(matrices.shape, (8, 4, 4))
+        np.testing.assert_array_equal(
+            matrices[3], sm.utils.get_transform_from_trs(translations[3], rotations[3], scales[3])
+        )
+        decomposed_translations, decomposed_rotations, decomposed_scales = sm.decompose_transforms(matrices)
+        np.testing.assert_allclose(decomposed_translations, translations)
+        np.testing.assert_allclose(decomposed_scales, scales)
+        np.testing.assert_allclose(np.abs(np.sum(decomposed_rotations * rotations, axis=-1)), 1.0)
+        np.testing.assert_allclose(
+            sm.decompose_transforms(matrices.reshape(2, 4, 4, 4))[1].reshape(8, 4), decomposed_rotations
+        )
+
+        # Half turn around (1, -1, 0): the diagonal terms tie and the last one wins, like in the unbatched function
+        tie_matrix = np.array(
+            [[0.0, -1.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0], [0.0, 0.0, -1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+        )
+        tie_rotation = sm.decompose_transforms(tie_matrix[None])[1][0]
+        np.testing.assert_allclose(tie_rotation, [-np.sqrt(0.5), np.sqrt(0.5), 0.0, 0.0])
+        np.testing.assert_allclose(tie_rotation, sm.utils.get_trs_from_transform_matrix(tie_matrix)[1])
+
+        products = sm.multiply_quaternions(rotations, rotations[::-1])
+        for q, r, product in zip(rotations, rotations[::-1], products):
+            np.testing.assert_array_equal(product, sm.utils.get_product_of_quaternions(q, r))
+        np.testing.assert_allclose(sm.multiply_quaternions(rotations, [0.0, 0.0, 0.0, 1.0]), rotations)
+
+    def test_slerp_quaternions(self):
+        identity = [0.0, 0.0, 0.0, 1.0]
+        quarter_turn = [0.0, 0.0, np.sin(np.pi / 4), np.cos(np.pi / 4)]
+        interpolated = sm.slerp_quaternions(identity, quarter_turn, [0.0, 0.5, 1.0])
+        np.testing.assert_allclose(interpolated[0], identity)
+        np.testing.assert_allclose(interpolated[1], [0.0, 0.0, np.sin(np.pi / 8), np.cos(np.pi / 8)])
+        np.testing.assert_allclose(interpolated[2], quarter_turn)
+        # Shortest path between q and -q, and linear interpolation of (almost) identical quaternions
+        np.testing.assert_allclose(sm.slerp_quaternions(identity, np.negative(identity), 0.5), identity)
+        np.testing.assert_allclose(sm.slerp_quaternions(quarter_turn, quarter_turn, 0.3), quarter_turn)
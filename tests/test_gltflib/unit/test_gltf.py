@@ -260,6 +260,34 @@ class TestGLTF(TestCase):
         self.assertIsInstance(resource, GLBResource)
         self.assertEqual(648, len(resource.data))
 
+    def test_load_with_mmap(self):
+        """With use_mmap, the GLB binary chunk and the file resources should be memory-mapped views over the files"""
+        # Arrange
+        data = b"sample binary data"
+        model = GLTFModel(asset=Asset(version="2.0"), buffers=[Buffer(uri="buffer.bin", byteLength=len(data))])
+        gltf = GLTF(model=model, resources=[FileResource(filename="buffer.bin", data=data)])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gltf.export(path.join(temp_dir, "sample.gltf"))
+            gltf.export(path.join(temp_dir, "sample.glb"))
+
+            # Act
+            gltf_mapped = GLTF.load(path.join(temp_dir, "sample.gltf"), load_file_resources=True, use_mmap=True)
+            glb_mapped = GLTF.load(path.join(temp_dir, "sample.glb"), use_mmap=True)
+
+            # Assert
+            resource = gltf_mapped.get_resource("buffer.bin")
+            self.assertIsInstance(resource.data, memoryview)
+            self.assertTrue(resource.data.readonly)
+            self.assertEqual(data, resource.data)
+            glb_resource = glb_mapped.get_glb_resource()
+            self.assertIsInstance(glb_resource.data, memoryview)
+            self.assertEqual(b"sample binary data\x00\x00", glb_resource.data)
+            # The mapped data can be exported again
+            glb_mapped.export(path.join(temp_dir, "sample2.glb"))
+            self.assertEqual(glb_resource.data, GLTF.load(path.join(temp_dir, "sample2.glb")).get_glb_resource().data)
+            del resource, glb_resource, gltf_mapped, glb_mapped  # Release the mappings before removing the files
+
     def test_clone_no_resources(self):
         """Basic test of the clone method for a GLTF model with no resources."""
         # Arrange
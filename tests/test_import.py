@@ -0,0 +1,80 @@
+# Copyright 2022 The HuggingFace Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lint as: python3
+import json
+import subprocess
+import sys
+import unittest
+
+import simulate as sm
+
+
+# Generous bound on the time spent importing `simulate` itself (around 10ms, and more than 0.5s when it imported
+# all its submodules), so that the test only fails when heavy dependencies are imported again
+MAX_IMPORT_TIME_MS = 200
+
+HEAVY_MODULES = [
+    "pyvista",
+    "vtkmodules",
+    "huggingface_hub",
+    "dataclasses_json",
+    "gym",
+    "simulate.engine",
+    "simulate.rl",
+]
+
+
+def run_in_new_interpreter(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_is_lazy(self):
+        code = "import json, sys, simulate; print(json.dumps(sorted(sys.modules)))"
+        modules = json.loads(run_in_new_interpreter(code).stdout)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+
+        code = "import json, sys; from simulate import Scene; print(json.dumps(sorted(sys.modules)))"
+        modules = json.loads(run_in_new_interpreter(code).stdout)
+        self.assertIn("simulate.scene", modules)
+        self.assertNotIn("pyvista", modules)
+        self.assertNotIn("simulate.engine", modules)
+
+    def test_import_time(self):
+        # `-X importtime` reports the cumulative import time of each module (in us) on stderr
+        import_times = {}
+        for line in run_in_new_interpreter("import simulate", "-X", "importtime").stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative_time, module = line.split("|")
+                if cumulative_time.strip().isdigit():
+                    import_times[module.strip()] = int(cumulative_time) / 1000
+        self.assertIn("simulate", import_times)
+        self.assertLess(import_times["simulate"], MAX_IMPORT_TIME_MS)
+
+    def test_lazy_attributes(self):
+        self.assertIs(sm.Box, sm.assets.object.Box)
+        self.assertIs(sm.Scene, sm.scene.Scene)
+        self.assertIs(sm.RLEnv, sm.rl.RLEnv)
+        self.assertIs(sm.utils, sm.assets.utils)
+        self.assertIs(sm.Material, sm.assets.Material)
+        self.assertIn("Box", dir(sm))
+        self.assertIn("anytree", dir(sm.assets))
+        for name in sm.__all__:
+            self.assertTrue(hasattr(sm, name), name)
+        with self.assertRaises(AttributeError):
+            sm.NotAnAttribute
+        with self.assertRaises(AttributeError):
+            sm.assets.NotAnAttribute
@@ -13,7 +13,11 @@
 # limitations under the License.
 
 # Lint as: python3
+import dataclasses
 import unittest
+from unittest import mock
+
+import numpy as np
 
 import simulate as sm
 
@@ -23,3 +27,112 @@ class SceneTest(unittest.TestCase):
         scene = sm.Scene(engine=None)
         self.assertIsInstance(scene, sm.Asset)
         self.assertIsInstance(scene.engine, sm.PyVistaEngine)
+
+    def test_compile(self):
+        scene = sm.Scene(engine=None, position=[0, 1, 0])
+        scene += sm.Box(name="box", position=[1, 0, 0], children=[sm.Sphere(name="ball", position=[0, 0, 2])])
+        scene += sm.Capsule(name="actor", is_actor=True, rotation=[30, 45, 0], scaling=[1, 2, 1])
+        scene.actor += sm.StateSensor(name="sensor", position=[0, 1, 0])
+        scene.actor.actuator = sm.Actuator(
+            n=2,
+            mapping=[
+                sm.ActionMapping("change_position", axis=[1, 0, 0]),
+                sm.ActionMapping("change_position", axis=[-1, 0, 0]),
+            ],
+            actuator_tag="move",
+        )
+
+        compiled = scene.compile()
+        self.assertIs(scene.compile(), compiled)  # Kept until the scene is modified
+        self.assertEqual(compiled.names[0], scene.name)
+        self.assertEqual(len(compiled), len(scene.tree_descendants) + 1)
+        for index, node in enumerate(compiled.nodes):
+            self.assertEqual(compiled.get_index(node.name), index)
+            self.assertEqual(compiled.node_types[index], type(node).__name__)
+            parent_index = compiled.parent_indices[index]
+            self.assertIs(compiled.nodes[parent_index] if parent_index >= 0 else None, node.tree_parent)
+            world_matrix = np.linalg.multi_dot([n.transformation_matrix for n in node.tree_path] + [np.eye(4)])
+            np.testing.assert_allclose(compiled.world_matrices[index], world_matrix)
+        np.testing.assert_allclose(compiled.world_matrices[compiled.get_index("ball")][:3, 3], [1, 1, 2])
+
+        self.assertEqual(compiled.actors, scene.actors)
+        self.assertEqual(compiled.action_space, scene.action_space)
+        self.assertEqual(compiled.action_tags["actor"], ["move"])
+        self.assertEqual(compiled.sensor_tags["actor"], scene.actor.sensor_tags)
+        self.assertEqual([compiled.nodes[i].name for i in compiled.component_indices["actuator"]], ["actor"])
+        self.assertEqual(compiled.sensors, scene.sensors)
+
+        # The compiled scene is frozen
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            compiled.names = ()
+        with self.assertRaises(ValueError):
+            compiled.world_matrices[0, 0, 0] = 2.0
+
+        # and compiled again after a modification
+        scene.box.position = [2, 0, 0]
+        self.assertFalse(compiled.is_up_to_date(scene))
+        recompiled = scene.compile()
+        self.assertIsNot(recompiled, compiled)
+        np.testing.assert_allclose(recompiled.world_matrices[recompiled.get_index("ball")][:3, 3], [2, 1, 2])
+        scene.position = [0, 0, 0]
+        np.testing.assert_allclose(scene.compile().world_matrices[recompiled.get_index("ball")][:3, 3], [2, 0, 2])
+        scene.box.ball.name = "sphere"
+        self.assertEqual(scene.compile().names[recompiled.get_index("ball")], "sphere")
+        scene += sm.Box(name="box")
+        with self.assertRaises(ValueError):
+            scene.compile()
+
+    def test_compile_transform_store(self):
+        scene = sm.Scene(engine=None)
+        with sm.TransformStore() as store:
+            scene += sm.Asset(name="a", position=[1, 0, 0], children=[sm.Asset(name="b", position=[0, 1, 0])])
+        compiled = scene.compile()
+
+        # Transforms written in the arrays of the store are read again, without compiling the scene again
+        store.positions[scene.a.b._transform_index] = [3, 4, 5]
+        self.assertFalse(compiled.is_up_to_date(scene))
+        with mock.patch.object(sm.Scene, "_scene_check") as scene_check:
+            recompiled = scene.compile()
+        scene_check.assert_not_called()
+        self.assertIsNot(recompiled, compiled)
+        self.assertIs(recompiled.nodes, compiled.nodes)
+        self.assertIs(scene.compile(), recompiled)
+        self.assertTrue(recompiled.is_up_to_date(scene))
+        np.testing.assert_allclose(recompiled.world_matrices[recompiled.get_index("b")][:3, 3], [4, 4, 5])
+        world_matrix = scene.a.transformation_matrix @ scene.a.b.transformation_matrix
+        np.testing.assert_allclose(recompiled.world_matrices[recompiled.get_index("b")], world_matrix)
+        np.testing.assert_allclose(compiled.world_matrices[compiled.get_index("b")][:3, 3], [1, 1, 0])
+
+    def test_scene_check(self):
+        scene = sm.Scene(engine=None)
+        scene += sm.Box(name="box", with_collider=True)
+        scene += sm.Capsule(name="actor", is_actor=True, children=[sm.Sphere(name="arm")])
+        scene.actor.arm.actuator = sm.Actuator(n=1, mapping=[sm.ActionMapping("change_position")])
+        scene._scene_check()
+
+        # Invalid children are rejected when they are attached
+        with self.assertRaises(sm.assets.anytree.TreeError):
+            scene.box.tree_children[0] += sm.Asset(name="child")
+        with self.assertRaises(sm.assets.anytree.TreeError):
+            sm.Asset(name="child").tree_parent = scene.box.tree_children[0]
+        with self.assertRaises(sm.assets.anytree.TreeError):
+            sm.RewardFunction(name="reward", children=[sm.Asset(name="child")])
+        self.assertEqual(len(scene.box.tree_children[0].tree_children), 0)
+
+        # The scene is only checked again after a modification
+        with mock.patch.object(sm.Scene, "tree_children", new_callable=mock.PropertyMock) as tree_children:
+            scene._scene_check()
+            tree_children.assert_not_called()
+
+        scene.actor.arm.is_actor = True
+        with self.assertRaises(ValueError):
+            scene._scene_check()
+        scene.actor.is_actor = False
+        scene._scene_check()
+        scene.actor.arm.is_actor = False
+        with self.assertRaises(ValueError):
+            scene._scene_check()
+        scene.actor.arm.actuator = None
+        scene.actor.arm.name = "box"
+        with self.assertRaises(ValueError):
+            scene._scene_check()